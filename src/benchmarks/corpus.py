@@ -0,0 +1,119 @@
+import json
+import random
+from array import array
+from pathlib import Path
+
+from game.GameLogic import GameLogic, encode_dice_roll
+
+CORPUS_PATH: Path = Path(__file__).parent / "corpus.json"
+CORPUS_SEED: int = 2024
+CORPUS_GAMES: int = 4
+CORPUS_STRIDE: int = 20  # decisions between two captured states of a game
+TRAJECTORY_LENGTH: int = 20  # decisions played after a captured state, the deepest replay benchmark
+GAME_CONFIG: dict = {'victory-point-limit': 30, 'allow-dominance-card': False}
+
+
+def play_random_decisions(game: GameLogic, rng: random.Random, limit: int = -1) -> list[tuple[list, int, str | int]]:
+    """
+    Plays `game` with random decisions, to the end or for `limit` decisions. The forced moves in between are played
+    as in an MCTS replay, see `MCTS.exec_seq_actions`.
+
+    :return: <state, sub phase, decision> of every decision, a decision is an action name or a dice roll id
+             (see `encode_dice_roll`)
+    """
+    decisions: list[tuple[list, int, str | int]] = []
+    game.advance_forced_moves(stop_at_dice_roll=True)
+    while game.running and len(decisions) != limit:
+        actions = game.get_legal_actions()  # sets the card continuation functions, part of the state
+        state = game.get_state_as_num_array()
+        if game.sub_phase == 40007:
+            attacker_roll, defender_roll = sorted((rng.randrange(4), rng.randrange(4)), reverse=True)
+            decision = encode_dice_roll(attacker_roll, defender_roll)
+        else:
+            decision = rng.choice(actions).name
+        decisions.append((state, game.sub_phase, decision))
+
+        game.apply(get_decision_id(game, decision))
+        game.advance_forced_moves(stop_at_dice_roll=True)
+    return decisions
+
+
+def capture_corpus(seed: int = CORPUS_SEED, game_count: int = CORPUS_GAMES, stride: int = CORPUS_STRIDE) -> dict:
+    """
+    Captures states of seeded random games: every `stride`-th decision and the first decision of every sub phase.
+    Each state comes with a trajectory of `TRAJECTORY_LENGTH` random decisions (fewer near the end of the game)
+    played from the state restored by `restore`, which seeds the reshuffles of the replays the same way.
+    """
+    entries: list[dict] = []
+    seen_sub_phases: set[int] = set()
+    for game_index in range(game_count):
+        game = GameLogic(GAME_CONFIG, seed + game_index)
+        decisions = play_random_decisions(game, random.Random(seed + game_index))
+
+        for i, (state, sub_phase, _) in enumerate(decisions):
+            if i % stride != 0 and sub_phase in seen_sub_phases:
+                continue
+            seen_sub_phases.add(sub_phase)
+
+            trajectory_game = restore({'seed': seed, 'game-config': GAME_CONFIG}, state)
+            trajectory = play_random_decisions(trajectory_game, random.Random(seed + i), TRAJECTORY_LENGTH)
+            entries.append({'game': game_index, 'decision': i, 'sub-phase': sub_phase, 'state': state,
+                            'trajectory': [decision for _, _, decision in trajectory]})
+    return {'seed': seed, 'games': game_count, 'game-config': GAME_CONFIG, 'entries': entries}
+
+
+def restore(corpus: dict, state: list) -> GameLogic:
+    """
+    :return: a game at `state` of `corpus`, seeded with the corpus seed
+    """
+    game = GameLogic(corpus['game-config'], corpus['seed'])
+    game.set_state_from_num_array(state)
+    game.get_legal_actions()  # as captured, see play_random_decisions
+    return game
+
+
+def get_decision_id(game: GameLogic, decision: str | int) -> int:
+    """
+    :return: id of the first legal action of `game` named `decision`, or `decision` if it is a dice roll id
+    """
+    if isinstance(decision, int):
+        return decision
+    return next(action.action_id for action in game.get_legal_actions() if action.name == decision)
+
+
+def get_trajectory_ids(corpus: dict, entry: dict, length: int) -> array:
+    """
+    Action ids are local to a process and the corpus stores names, so the trajectory is played to find them.
+
+    :return: action ids of the first `length` decisions played from the state of `entry`, as in `MCTSNode.seq_actions`
+    """
+    game = restore(corpus, entry['state'])
+    game.advance_forced_moves(stop_at_dice_roll=True)
+    trajectory_ids = array('i')
+    for decision in entry['trajectory'][:length]:
+        trajectory_ids.append(get_decision_id(game, decision))
+        game.apply(trajectory_ids[-1])
+        game.advance_forced_moves(stop_at_dice_roll=True)
+    return trajectory_ids
+
+
+def save_corpus(corpus: dict, path: Path = CORPUS_PATH):
+    # one entry per line, so a recaptured corpus diffs by entry
+    header = json.dumps({key: value for key, value in corpus.items() if key != 'entries'})
+    entries = ",\n".join(json.dumps(entry) for entry in corpus['entries'])
+    with open(path, 'w') as file:
+        file.write(header[:-1] + ', "entries": [\n' + entries + "\n]}\n")
+
+
+def load_corpus(path: Path = CORPUS_PATH) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+if __name__ == "__main__":
+    captured = capture_corpus()
+    save_corpus(captured)
+    print("{} states of {} games written to {}".format(len(captured['entries']), captured['games'], CORPUS_PATH))
+
+#  Recapture the corpus from src, only when the state format or the rules change, by using this cmd
+#       python -m benchmarks.corpus
@@ -0,0 +1,245 @@
+import gc
+import logging
+import sys
+import time
+from datetime import datetime
+from typing import Callable
+
+import dill
+import yaml
+
+from benchmarks.corpus import get_trajectory_ids, load_corpus, restore
+from game.Faction import Faction
+from game.GameLogic import GameLogic
+from game.StateCodec import encode_state
+from roottrainer.CSVOutputWriter import CSVOutputWriter
+from roottrainer.HeadlessTrainer import play_game
+from roottrainer.agents.AgentFactory import create_agent
+from roottrainer.agents.MCTS import MCTS, exec_random_actions, exec_seq_actions
+from roottrainer.agents.MCTSNode import MCTSNode
+from utils.trace_utils import configure_tracing
+
+REPLAY_DEPTHS: tuple[int, ...] = (1, 5, 20)
+EXPAND_COUNTS: tuple[int, ...] = (10, 50, 200)
+MCTS_STATES: int = 4  # corpus states searched by each run_mcts benchmark
+PLAYOUTS: int = 4  # full random playouts from the start of a game
+MCTS_CONFIG: dict = {
+    'type': 'mcts',
+    'expand-count': 10,
+    'rollout-no': 1,
+    'action-count-limit': 50,
+    'time-limit': -1,
+    'reward-function': 'win',
+    'best-action-policy': 'max'
+}
+
+
+class Benchmark:
+    """
+    A timed operation on fixed inputs. `prepare` builds the inputs of one run outside of the timing,
+    `run` performs the measured operations on them and returns how many it performed.
+    """
+
+    def __init__(self, name: str, prepare: Callable[[], any], run: Callable[[any], int], repeat: int = 3):
+        self.name: str = name
+        self.prepare: Callable[[], any] = prepare
+        self.run: Callable[[any], int] = run
+        self.repeat: int = repeat
+
+    def measure(self) -> tuple[int, float, float]:
+        """
+        :return: operations of one run, best and mean run time in s
+        """
+        times: list[float] = []
+        ops = 0
+        for _ in range(self.repeat):
+            inputs = self.prepare()
+            gc.collect()
+            start_time = time.perf_counter()
+            ops = self.run(inputs)
+            times.append(time.perf_counter() - start_time)
+        return ops, min(times), sum(times) / len(times)
+
+
+def get_state_forms(corpus: dict) -> dict[str, Callable[[], list]]:
+    """
+    :return: builders of the corpus states in each form a state can be sent to the workers in
+    """
+    return {
+        'game': lambda: [restore(corpus, e['state']) for e in corpus['entries']],
+        'num_array': lambda: [e['state'] for e in corpus['entries']],
+        'bytes': lambda: [encode_state(e['state']) for e in corpus['entries']]
+    }
+
+
+def build_benchmarks(corpus: dict) -> list[Benchmark]:
+    game_config: dict = corpus['game-config']
+    entries: list[dict] = corpus['entries']
+    benchmarks: list[Benchmark] = []
+
+    def run_init(count: int) -> int:
+        for _ in range(count):
+            GameLogic(game_config)
+        return count
+
+    benchmarks.append(Benchmark("game_logic_init", lambda: 20, run_init))
+
+    def run_to_num_array(games: list[GameLogic]) -> int:
+        for game in games:
+            game.get_state_as_num_array()
+        return len(games)
+
+    benchmarks.append(Benchmark("get_state_as_num_array", lambda: [restore(corpus, e['state']) for e in entries] * 10,
+                                run_to_num_array))
+
+    def run_from_num_array(games: list[tuple[GameLogic, list]]) -> int:
+        for game, state in games:
+            game.set_state_from_num_array(state)
+        return len(games)
+
+    benchmarks.append(Benchmark("set_state_from_num_array",
+                                lambda: [(GameLogic(game_config), e['state']) for e in entries] * 10,
+                                run_from_num_array))
+
+    def run_to_bytes(games: list[GameLogic]) -> int:
+        for game in games:
+            game.to_bytes()
+        return len(games)
+
+    benchmarks.append(Benchmark("to_bytes", lambda: [restore(corpus, e['state']) for e in entries] * 10,
+                                run_to_bytes))
+
+    def run_from_bytes(games: list[tuple[GameLogic, bytes]]) -> int:
+        for game, data in games:
+            game.set_state_from_bytes(data)
+        return len(games)
+
+    benchmarks.append(Benchmark("set_state_from_bytes",
+                                lambda: [(GameLogic(game_config), encode_state(e['state'])) for e in entries] * 10,
+                                run_from_bytes))
+
+    def run_dill_round_trips(states: list) -> int:
+        for state in states:
+            dill.loads(dill.dumps(state))
+        return len(states)
+
+    for form, prepare_states in get_state_forms(corpus).items():
+        benchmarks.append(Benchmark("dill_round_trip[{}]".format(form), prepare_states, run_dill_round_trips))
+
+    def run_legal_actions(games: list[GameLogic]) -> int:
+        for game in games:
+            game.state_changed()  # drops the cached actions
+            game.get_legal_actions()
+        return len(games)
+
+    for sub_phase in sorted({e['sub-phase'] for e in entries}):
+        sub_phase_entries = [e for e in entries if e['sub-phase'] == sub_phase]
+        copies = 200 // len(sub_phase_entries) + 1  # about the same number of calls in every sub phase
+        benchmarks.append(Benchmark(
+            "get_legal_actions[{}]".format(sub_phase),
+            lambda sub_phase_entries=sub_phase_entries, copies=copies: [
+                restore(corpus, e['state']) for e in sub_phase_entries] * copies,
+            run_legal_actions))
+
+    def prepare_playouts() -> list[GameLogic]:
+        return [GameLogic(game_config, corpus['seed'] + i) for i in range(PLAYOUTS)]
+
+    def run_playouts(games: list[GameLogic]) -> int:
+        for i, game in enumerate(games):
+            exec_random_actions(i, game, 'win', game.get_state_as_num_array(), -1, -1, seed=corpus['seed'] + i)
+        return len(games)
+
+    benchmarks.append(Benchmark("random_playout", prepare_playouts, run_playouts))
+
+    def run_replays(replays: list[tuple[MCTSNode, GameLogic]]) -> int:
+        for node, game in replays:
+            exec_seq_actions(node, game)
+        return len(replays)
+
+    for depth in REPLAY_DEPTHS:
+        depth_entries = [e for e in entries if len(e['trajectory']) >= depth]
+        benchmarks.append(Benchmark(
+            "exec_seq_actions[{}]".format(depth),
+            lambda depth=depth, depth_entries=depth_entries: [
+                (MCTSNode(0, None, get_trajectory_ids(corpus, e, depth)), restore(corpus, e['state']))
+                for e in depth_entries],
+            run_replays))
+
+    def run_searches(searches: list[MCTS]) -> int:
+        for mcts in searches:
+            mcts.run_mcts()
+        return len(searches)
+
+    mcts_entries = entries[::len(entries) // MCTS_STATES][:MCTS_STATES]
+    for expand_count in EXPAND_COUNTS:
+        benchmarks.append(Benchmark(
+            "run_mcts[{}]".format(expand_count),
+            lambda expand_count=expand_count: [
+                MCTS(e['state'], [], MCTS_CONFIG['reward-function'], expand_count, MCTS_CONFIG['rollout-no'],
+                     MCTS_CONFIG['time-limit'], MCTS_CONFIG['action-count-limit'], MCTS_CONFIG['best-action-policy'],
+                     game_config=game_config, seed=corpus['seed']) for e in mcts_entries],
+            run_searches, 1 if expand_count > 50 else 3))
+
+    def prepare_game():
+        agent_config = {'type': 'mcts', 'mcts': MCTS_CONFIG}
+        return create_agent(Faction.MARQUISE, agent_config, None, game_config), \
+            create_agent(Faction.EYRIE, agent_config, None, game_config)
+
+    def run_game(agents) -> int:
+        play_game(agents[0], agents[1], "headless_game", game_config, corpus['seed'])
+        return 1
+
+    benchmarks.append(Benchmark("headless_game", prepare_game, run_game, 1))
+
+    return benchmarks
+
+
+def print_state_sizes(corpus: dict):
+    for form, prepare_states in get_state_forms(corpus).items():
+        sizes = [len(dill.dumps(state)) for state in prepare_states()]
+        print("{:<30} {:>12.1f} bytes pickled, mean of {} states".format(
+            "state_size[{}]".format(form), sum(sizes) / len(sizes), len(sizes)))
+
+
+def run_benchmarks(benchmarks: list[Benchmark], output_writer: CSVOutputWriter | None = None):
+    for benchmark in benchmarks:
+        ops, best_time, mean_time = benchmark.measure()
+        ops_per_s = ops / best_time if best_time > 0 else 0.0
+        print("{:<30} {:>12.2f} ops/s  {:>6} ops in {:.4f} s best, {:.4f} s mean of {}".format(
+            benchmark.name, ops_per_s, ops, best_time, mean_time, benchmark.repeat))
+        if output_writer is not None:
+            output_writer.write([benchmark.name, ops, benchmark.repeat, best_time, mean_time, ops_per_s])
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] in (['-h'], ['--help']):
+        print("usage: python -m benchmarks.run_benchmarks [config path] [benchmark name prefix ...]")
+        sys.exit(0)
+
+    config_path: str = ""
+    if len(sys.argv) > 1:
+        config_path = str(sys.argv[1])
+    if config_path == "":
+        config_path = "./config/config.yml"
+    config = yaml.safe_load(open(config_path))
+    name_prefixes: list[str] = sys.argv[2:]  # run only the benchmarks whose name starts with one of them
+
+    logging.basicConfig(level=logging.NOTSET)
+    logging.getLogger('game_logger').setLevel(config['logging']['game']['level'])
+    logging.getLogger('trainer_logger').setLevel(config['logging']['trainer']['level'])
+    logging.getLogger('mcts_logger').setLevel(config['logging']['mcts']['level'])
+    configure_tracing(config['logging'])
+
+    corpus: dict = load_corpus()
+    print_state_sizes(corpus)
+    selected: list[Benchmark] = [benchmark for benchmark in build_benchmarks(corpus)
+                                 if not name_prefixes or benchmark.name.startswith(tuple(name_prefixes))]
+
+    writer: CSVOutputWriter = CSVOutputWriter(config['simulation']['output']['dir'])
+    writer.open("benchmarks-{}.csv".format(datetime.now().strftime("%Y-%m-%d-%H-%M-%S")))
+    writer.write(['name', 'ops', 'repeat', 'best_time', 'mean_time', 'ops_per_s'])
+    run_benchmarks(selected, writer)
+    writer.close()
+
+#  Run from src with the config (logging levels, output dir) and optional benchmark name prefixes by using this cmd
+#       python -m benchmarks.run_benchmarks ./config/config.yml [get_legal_actions run_mcts ...]
@@ -1,17 +1,11 @@
-import math
-
-import pygame
-from pygame import Color, Vector2, Surface, Rect
-
-from config import Config, Colors
 from game.Building import Building
 from game.Suit import Suit
 from game.Token import Token
 from game.Warrior import Warrior
+from game.Zobrist import zobrist_key
 
 
 class AreaLogic:
-    size_ratio: float = 0.07
 
     def __init__(self, area_index: int, suit: Suit, buildings: list[Building]):
         self.suit: Suit = suit
@@ -30,6 +24,12 @@ class AreaLogic:
         for warrior in Warrior:
             self.warrior_count[warrior] = 0
 
+        # ruler() result, reset by every method that changes warriors or buildings
+        self.ruler_cache: str | Warrior | None = None
+
+        # undo journal of the board while a GameLogic frame is open, see GameLogic.push
+        self.journal: list | None = None
+
     def get_state_as_num_array(self) -> list:
         n_features: int = 4
         arr: list = [[]] * n_features
@@ -57,8 +57,30 @@ class AreaLogic:
             self.token_count[token] = token_count[i]
         for i, warrior in enumerate(Warrior):
             self.warrior_count[warrior] = warrior_count[i]
+        self.ruler_cache = None
+
+    def copy_from(self, other: 'AreaLogic'):
+        """
+        Copies the pieces of `other` into this clearing. Connections are left untouched.
+        """
+        self.ruler_cache = other.ruler_cache
+        self.buildings = other.buildings.copy()
+        self.token_count = other.token_count.copy()
+        self.warrior_count = other.warrior_count.copy()
+
+    def clone(self) -> 'AreaLogic':
+        area = AreaLogic.__new__(AreaLogic)
+        area.__dict__.update(self.__dict__)
+        area.journal = None
+        area.copy_from(self)
+        return area
 
     def ruler(self) -> str | Warrior:
+        if self.ruler_cache is None:
+            self.ruler_cache = self.compute_ruler()
+        return self.ruler_cache
+
+    def compute_ruler(self) -> str | Warrior:
         # only for MARQUIS vs DECREE
         marquise_presence = self.warrior_count[Warrior.MARQUISE] \
                             + self.buildings.count(Building.SAWMILL) \
@@ -75,8 +97,52 @@ class AreaLogic:
         else:
             return Warrior.EYRIE
 
+    def piece_key(self, piece: Warrior | Token | Building, count: int) -> int:
+        return zobrist_key(self.area_index, piece, count)
+
+    def get_zobrist_hash(self) -> int:
+        zobrist_hash = 0
+        for warrior in Warrior:
+            zobrist_hash ^= self.piece_key(warrior, self.warrior_count[warrior])
+        for token in Token:
+            zobrist_hash ^= self.piece_key(token, self.token_count[token])
+        for building in Building:
+            zobrist_hash ^= self.piece_key(building, self.buildings.count(building))
+        return zobrist_hash
+
+    def restore_warrior_count(self, warrior_type: Warrior, count: int):
+        """
+        Sets the warrior count back, undo of `add_warrior` and `remove_warrior`. Not journaled.
+        """
+        self.warrior_count[warrior_type] = count
+        self.ruler_cache = None
+
+    def restore_token_count(self, token_type: Token, count: int):
+        """
+        Sets the token count back, undo of `add_token` and `remove_token`. Not journaled.
+        """
+        self.token_count[token_type] = count
+
+    def restore_building(self, index: int, building: Building):
+        """
+        Puts `building` back in the building slot `index`, undo of `replace_building`. Not journaled.
+        """
+        self.buildings[index] = building
+        self.ruler_cache = None
+
+    def remove_last_building_slot(self):
+        """
+        Removes the last building slot, undo of `add_building`. Not journaled.
+        """
+        self.buildings.pop()
+        self.ruler_cache = None
+
     def add_warrior(self, warrior_type: Warrior, amount: int = 1):
-        self.warrior_count[warrior_type] += amount
+        old_count: int = self.warrior_count[warrior_type]
+        if self.journal is not None:
+            self.journal.append((self.restore_warrior_count, warrior_type, old_count))
+        self.warrior_count[warrior_type] = old_count + amount
+        self.ruler_cache = None
 
     def remove_warrior(self, warrior_type: Warrior, amount: int = 1):
         """
@@ -88,20 +154,45 @@ class AreaLogic:
         :return: numbers of removed warrior
         """
         pre_removed_warrior_count: int = self.warrior_count[warrior_type]
+        if self.journal is not None:
+            self.journal.append((self.restore_warrior_count, warrior_type, pre_removed_warrior_count))
         self.warrior_count[warrior_type] = max(0, self.warrior_count[warrior_type] - amount)
+        self.ruler_cache = None
         return pre_removed_warrior_count - self.warrior_count[warrior_type]
 
     def add_token(self, token_type: Token, amount: int = 1):
-        self.token_count[token_type] += amount
+        old_count: int = self.token_count[token_type]
+        if self.journal is not None:
+            self.journal.append((self.restore_token_count, token_type, old_count))
+        self.token_count[token_type] = old_count + amount
 
     def remove_token(self, token_type: Token, amount: int = 1):
-        self.token_count[token_type] = max(0, self.token_count[token_type] - amount)
+        old_count: int = self.token_count[token_type]
+        if self.journal is not None:
+            self.journal.append((self.restore_token_count, token_type, old_count))
+        self.token_count[token_type] = max(0, old_count - amount)
 
     def add_building(self, building: Building):
+        if self.journal is not None:
+            self.journal.append((self.remove_last_building_slot,))
         self.buildings.append(building)
+        self.ruler_cache = None
+
+    def place_building(self, building: Building):
+        """
+        Places `building` in the first empty building slot of this clearing.
+        """
+        self.replace_building(Building.EMPTY, building)
 
     def remove_building(self, building: Building):
-        self.buildings[self.buildings.index(building)] = Building.EMPTY
+        self.replace_building(building, Building.EMPTY)
+
+    def replace_building(self, old_building: Building, new_building: Building):
+        index: int = self.buildings.index(old_building)
+        if self.journal is not None:
+            self.journal.append((self.restore_building, index, old_building))
+        self.buildings[index] = new_building
+        self.ruler_cache = None
 
     def sum_all_pieces(self) -> int:
         sum_of_pieces = 0
@@ -127,225 +218,3 @@ class AreaLogic:
 
     def __str__(self):
         return str(self.area_index)
-
-
-class Area:
-
-    def __init__(self, area_logic: AreaLogic, position: Vector2, radius: float):
-        self.logic = area_logic
-
-        self.position: Vector2 = position
-        self.radius: float = radius
-        self.color: Color = Colors.WHITE
-
-    def draw(self, screen: Surface):
-        # circle
-        pygame.draw.circle(screen, self.color, self.position, self.radius, width=1)
-
-        # buildings
-        self.draw_buildings(screen)
-
-        # suit
-        self.draw_suit(screen)
-
-        # ruler
-        self.draw_ruler(screen)
-
-        # warriors
-        self.draw_warriors(screen)
-
-        # tokens
-        self.draw_tokens(screen)
-
-        # text: area_index
-        margin_top = 4
-        text = str(self.logic.area_index)
-
-        surface = Config.FONT_1.render(text, True, Colors.WHITE)
-        surface_rect = surface.get_rect()
-        surface_rect.centerx = self.position.x
-        surface_rect.top = self.position.y + self.radius + margin_top
-        screen.blit(surface, surface_rect)
-
-    def draw_buildings(self, screen: Surface):
-        size_ratio: float = 0.3
-        gap_size_ratio: float = 0.1
-        y_offset_ratio: float = 0.5
-
-        dimension = size_ratio * self.radius
-        gap = gap_size_ratio * self.radius
-
-        count = len(self.logic.buildings)
-        starting_offset: Vector2 = Vector2(
-            -1 * (count * dimension + max((count - 1), 0) * gap) / 2,
-            -1 * y_offset_ratio * self.radius
-        )
-
-        for i, building in enumerate(self.logic.buildings):
-            rect = Rect(0, 0, dimension, dimension)
-            rect.topleft = self.position + starting_offset + Vector2(i * dimension + i * gap, 0)
-
-            color = Colors.WHITE
-            width = 1
-            text = ""
-            if building is Building.EMPTY:
-                color = Colors.WHITE
-            elif building is Building.RUIN:
-                color = Colors.GREY
-                width = 0
-            elif building in [Building.SAWMILL, Building.WORKSHOP, Building.RECRUITER]:
-                color = Colors.ORANGE
-                if building is Building.SAWMILL:
-                    text = "S"
-                elif building is Building.WORKSHOP:
-                    text = "W"
-                elif building is Building.RECRUITER:
-                    text = "R"
-            elif building is Building.ROOST:
-                color = Colors.BLUE
-                text = "R"
-            elif building is Building.BASE:
-                color = Colors.GREEN
-                text = "B"
-
-            pygame.draw.rect(screen, color, rect, width)
-
-            # text
-            surface = Config.FONT_1.render(text, True, color)
-            surface_rect = surface.get_rect()
-            surface_rect.center = rect.center
-
-            screen.blit(surface, surface_rect)
-
-    def draw_suit(self, screen):
-        size_ratio: float = 0.15
-
-        radius = size_ratio * self.radius
-        color = Colors.WHITE
-        width = 0
-        text = ""
-
-        offset: Vector2 = Vector2(self.radius - radius)
-        position = self.position + offset
-
-        if self.logic.suit is Suit.MOUSE:
-            color = Colors.MOUSE
-            text = "M"
-        elif self.logic.suit is Suit.RABBIT:
-            color = Colors.RABBIT
-            text = "R"
-        if self.logic.suit is Suit.FOX:
-            color = Colors.FOX
-            text = "F"
-
-        pygame.draw.circle(screen, color, position, radius, width)
-
-        # text
-        surface = Config.FONT_1.render(text, True, Colors.BLACK)
-        surface_rect = surface.get_rect()
-        surface_rect.center = position
-
-        screen.blit(surface, surface_rect)
-
-    def draw_ruler(self, screen):
-        size_ratio: float = 0.15
-
-        radius = size_ratio * self.radius
-        color = Colors.WHITE
-        width = 0
-        text = ""
-
-        offset: Vector2 = Vector2(self.radius - radius, -1 * (self.radius - radius))
-        position = self.position + offset
-
-        ruler = self.logic.ruler()
-        if ruler is Warrior.MARQUISE:
-            color = Colors.ORANGE
-            text = "M"
-        elif ruler is Warrior.EYRIE:
-            color = Colors.BLUE
-            text = "E"
-
-        pygame.draw.circle(screen, color, position, radius, width)
-
-        # text
-        surface = Config.FONT_1.render(text, True, color)
-        surface_rect = surface.get_rect()
-        surface_rect.center = position
-
-        screen.blit(surface, surface_rect)
-
-    def draw_warriors(self, screen):
-        gap_size_ratio: float = 0.5
-        y_offset_ratio: float = 0.5
-
-        gap = gap_size_ratio * self.radius
-
-        count = 2
-        starting_offset: Vector2 = Vector2(
-            -1 * ((count - 1) * gap) / 2,
-            y_offset_ratio * self.radius
-        )
-
-        # text Marquis
-        if self.logic.warrior_count[Warrior.MARQUISE] > 0:
-            color = Colors.ORANGE
-            text = str(self.logic.warrior_count[Warrior.MARQUISE])
-
-            surface = Config.FONT_SM.render(text, True, color)
-            surface_rect = surface.get_rect()
-            surface_rect.center = Rect(self.position + starting_offset + (Vector2(gap * 0, 0)), (0, 0)).center
-
-            screen.blit(surface, surface_rect)
-
-        # text Eyrie
-        if self.logic.warrior_count[Warrior.EYRIE] > 0:
-            color = Colors.BLUE
-            text = str(self.logic.warrior_count[Warrior.EYRIE])
-
-            surface = Config.FONT_SM.render(text, True, color)
-            surface_rect = surface.get_rect()
-            surface_rect.center = Rect(self.position + starting_offset + (Vector2(gap * 1, 0)), (0, 0)).center
-
-            screen.blit(surface, surface_rect)
-
-    def draw_tokens(self, screen):
-        size_ratio: float = 0.2
-        offset_ratio: float = 0.8
-
-        radius = size_ratio * self.radius
-
-        # Wood
-        if self.logic.token_count[Token.WOOD] > 0:
-            rad = math.radians(45)
-            offset = Vector2(math.cos(rad) * offset_ratio * self.radius,
-                             -1 * math.sin(rad) * offset_ratio * self.radius)
-            position = self.position + offset
-
-            color = Colors.ORANGE
-            width = 1
-            text = "w" + str(self.logic.token_count[Token.WOOD])
-            pygame.draw.circle(screen, color, position, radius, width)
-            # text
-            surface = Config.FONT_1.render(text, True, Colors.ORANGE)
-            surface_rect = surface.get_rect()
-            surface_rect.center = position
-
-            screen.blit(surface, surface_rect)
-        # Castle
-        if self.logic.token_count[Token.CASTLE] > 0:
-            rad = math.radians(10)
-            offset = Vector2(math.cos(rad) * offset_ratio * self.radius,
-                             -1 * math.sin(rad) * offset_ratio * self.radius)
-            position = self.position + offset
-
-            color = Colors.ORANGE
-            width = 1
-            text = "C"
-            pygame.draw.circle(screen, color, position, radius, width)
-            # text
-            surface = Config.FONT_1.render(text, True, Colors.ORANGE)
-            surface_rect = surface.get_rect()
-            surface_rect.center = position
-
-            screen.blit(surface, surface_rect)
@@ -1,41 +1,13 @@
 import math
-import sys
 
-import pygame
-from pygame import Rect, Color, Surface
-
-from config import Config, Colors
-from game.AreaLogic import AreaLogic, Area
+from game.AreaLogic import AreaLogic
 from game.Faction import Faction
 from game.Item import Item
+from game.Journal import JournaledState
 from game.Suit import Suit
-from utils.geometry_utils import get_path_points
-
-import yaml
-
+from game.Zobrist import zobrist_key
 from utils.utils import faction_to_warrior
 
-config_path: str = ""
-if len(sys.argv) > 1:
-    config_path = str(sys.argv[1])
-if config_path == "":
-    config_path = "./config/config.yml"
-config = yaml.safe_load(open(config_path))
-
-FACTION_NAMES = ['Marquise de Cat', 'The Decree', 'Woodland Alliance', 'Vagabond']
-FACTION_ALIAS = {
-    Faction.MARQUISE: 'MC',
-    Faction.EYRIE: 'EY'
-}
-FACTION_COLORS = {
-    Faction.MARQUISE: Colors.ORANGE,
-    Faction.EYRIE: Colors.BLUE
-}
-FACTION_SIZE = 4
-ITEM_SUPPLY_RENDER = [
-    [Item.BAG, Item.BOOTS, Item.CROSSBOW, Item.KNIFE, Item.KEG, Item.COIN],
-    [Item.BAG, Item.BOOTS, Item.HAMMER, Item.KNIFE, Item.KEG, Item.COIN]
-]
 ITEM_SUPPLY_INDEX = {
     Item.BAG: [0, 6],
     Item.BOOTS: [1, 7],
@@ -47,11 +19,7 @@ ITEM_SUPPLY_INDEX = {
 }
 
 
-def add_tuple(a, b):
-    return tuple(map(lambda i, j: i + j, a, b))
-
-
-class BoardLogic:
+class BoardLogic(JournaledState):
 
     def __init__(self, area_logics: list[AreaLogic]):
         self.areas: list[AreaLogic] = area_logics
@@ -65,6 +33,9 @@ class BoardLogic:
         self.turn_player: Faction | None = None
         self.turn_count: int = 0
 
+        # (undo function, args...) of every change since the first open GameLogic frame, see GameLogic.push
+        self.journal: list | None = None
+
     def get_state_as_num_array(self) -> list[list]:
         n_features = 3
         arr: list = [[]] * n_features
@@ -93,6 +64,32 @@ class BoardLogic:
 
         self.item_supply_available = [item_available == 1 for item_available in item_supply_available]
 
+    def copy_from(self, other: 'BoardLogic'):
+        """
+        Copies the mutable state of `other` into this board. Both boards must have the same clearings and paths.
+        """
+        for area, other_area in zip(self.areas, other.areas):
+            area.copy_from(other_area)
+
+        self.copy_counters_from(other)
+
+    def copy_counters_from(self, other: 'BoardLogic'):
+        self.faction_points = other.faction_points.copy()
+        self.item_supply_available = other.item_supply_available.copy()
+        self.turn_player = other.turn_player
+        self.turn_count = other.turn_count
+
+    def clone(self) -> 'BoardLogic':
+        board = BoardLogic.__new__(BoardLogic)
+        board.__dict__.update(self.__dict__)
+        board.journal = None
+        board.areas = [area.clone() for area in self.areas]
+        for area in board.areas:
+            area.connected_clearings = [board.areas[a.area_index] for a in area.connected_clearings]
+            area.connected_forests = [board.areas[a.area_index] for a in area.connected_forests]
+        board.copy_counters_from(self)
+        return board
+
     def get_area(self, area_index: int) -> AreaLogic | None:
         for area in self.areas:
             if area.area_index == area_index:
@@ -127,134 +124,57 @@ class BoardLogic:
     def remove_item_from_board(self, item: Item):
         for item_index in ITEM_SUPPLY_INDEX[item]:
             if self.item_supply_available[item_index]:
+                if self.journal is not None:
+                    self.journal.append((self.restore_item, item_index))
                 self.item_supply_available[item_index] = False
                 break
 
+    def restore_item(self, item_index: int):
+        """
+        Puts an item back in the supply, undo of `remove_item_from_board`. Not journaled.
+        """
+        self.item_supply_available[item_index] = True
+
     def gain_vp(self, faction: Faction, vp: int):
-        self.faction_points[faction] += vp
+        self.change_vp(faction, self.faction_points[faction] + vp)
 
     def lose_vp(self, faction: Faction, vp: int):
-        self.faction_points[faction] -= vp
+        self.change_vp(faction, self.faction_points[faction] - vp)
+
+    def change_vp(self, faction: Faction, vp: int):
+        if self.journal is not None:
+            self.journal.append((self.set_vp, faction, self.faction_points[faction]))
+        self.set_vp(faction, vp)
+
+    def set_vp(self, faction: Faction, vp: int):
+        """
+        `change_vp` without journaling, also its undo.
+        """
+        self.faction_points[faction] = vp
+
+    def set_journal(self, journal: list | None):
+        """
+        Starts (a list) or stops (None) recording the undo of every change to this board and its clearings.
+        """
+        self.journal = journal
+        for area in self.areas:
+            area.journal = journal
+
+    def get_zobrist_hash(self) -> int:
+        """
+        64 bit hash of the board: pieces of every clearing, faction points and item supply.
+        Computed on demand, nothing is kept up to date while the rules change the board.
+        """
+        zobrist_hash = 0
+        for area in self.areas:
+            zobrist_hash ^= area.get_zobrist_hash()
+        for faction in self.faction_points.keys():
+            zobrist_hash ^= zobrist_key(faction, self.faction_points[faction])
+        for item_index, item_available in enumerate(self.item_supply_available):
+            zobrist_hash ^= zobrist_key(item_index, bool(item_available))
+        return zobrist_hash
 
     def count_ruling_clearing_by_faction_and_suit(self, faction: Faction, suit: Suit) -> int:
         warrior = faction_to_warrior(faction)
 
         return len([area for area in self.areas if area.ruler() == warrior and area.suit == suit])
-
-
-class Board:
-    dimension: float = 800
-    rect: Rect = Rect(
-        ((Config.NATIVE_SCREEN_WIDTH - dimension) / 2, (Config.NATIVE_SCREEN_HEIGHT - dimension) / 2 - 50),
-        (dimension, dimension))
-
-    def __init__(self, board_logic: BoardLogic, areas: list[Area]):
-        self.name: str = "Forest"
-        self.color: Color = Colors.GREEN
-        self.logic: BoardLogic = board_logic
-        self.areas: list[Area] = areas
-
-    def draw(self, screen: Surface):
-        pygame.draw.rect(screen, self.color, self.rect, width=1)
-
-        self.draw_paths_clearing(screen)
-        self.draw_areas(screen)
-        self.draw_board_info(screen)
-
-    def draw_areas(self, screen: Surface):
-        for area in self.areas:
-            area.draw(screen)
-
-    def draw_paths_clearing(self, screen: Surface):
-        for path in self.logic.paths:
-            area_a = self.areas[path[0]]
-            area_b = self.areas[path[1]]
-            additional_shift = 5
-            line_width = 5
-            pos_a, pos_b = get_path_points(area_a.position, area_b.position, area_a.radius + additional_shift)
-
-            pygame.draw.line(
-                screen, Colors.GREY_DARK_2, pos_a, pos_b, line_width
-            )
-        pass
-
-    def draw_board_info(self, screen):
-        starting_point = ((Config.NATIVE_SCREEN_WIDTH - self.dimension) / 2, (Config.NATIVE_SCREEN_HEIGHT - 130))
-
-        size = (self.dimension, 130)
-        block_one_third = (size[0] / 3, size[1] / 3)
-        block_full = (size[0] / 3, size[1])
-
-        self.draw_victory_point_tracker(screen, starting_point, block_one_third)
-        self.draw_turn_tracker(screen, add_tuple(starting_point, (size[0] / 3, 0)), block_one_third)
-        self.draw_item_supply(screen, add_tuple(starting_point, (size[0] / 3 * 2, 0)), block_full)
-
-        pass
-
-    def draw_victory_point_tracker(self, screen, starting_point, size):
-        # Box
-        box = Rect(starting_point, size)
-        pygame.draw.rect(screen, self.color, box, width=1)
-
-        # Text
-        points_text = Config.FONT_LG_BOLD.render("VPs", True, Colors.WHITE)
-        shift = (10, size[1] / 2 - points_text.get_height() / 2)
-
-        screen.blit(points_text, add_tuple(starting_point, shift))
-
-        faction_pos_ind = 0
-        for (faction, vp) in self.logic.faction_points.items():
-            rendered_text = Config.FONT_LG_BOLD.render("{}".format(vp), True, FACTION_COLORS[faction])
-            pos = (starting_point[0] + faction_pos_ind * 45 + points_text.get_width() + 20, starting_point[1])
-            screen.blit(rendered_text, add_tuple(pos, shift))
-            faction_pos_ind += 1
-
-        pass
-
-    def draw_turn_tracker(self, screen, starting_point, size):
-
-        # Box
-        box = Rect(starting_point, size)
-        pygame.draw.rect(screen, self.color, box, width=1)
-
-        turn_text = Config.FONT_MD_BOLD.render("Turn {}:".format(self.logic.turn_count), True, Colors.WHITE)
-        shift = (10, size[1] / 2 - turn_text.get_height() / 2)
-
-        screen.blit(turn_text, add_tuple(starting_point, shift))
-
-        player_turn_text = Config.FONT_MD_BOLD.render("{}'s turn".format(FACTION_ALIAS[self.logic.turn_player]), True,
-                                                      FACTION_COLORS[self.logic.turn_player])
-        pos = (starting_point[0] + turn_text.get_width() + 10, starting_point[1])
-        screen.blit(player_turn_text, add_tuple(pos, shift))
-
-        pass
-
-    def draw_item_supply(self, screen, starting_point, size):
-
-        # Box
-        box = Rect(starting_point, size)
-        pygame.draw.rect(screen, self.color, box, width=1)
-
-        item_supply_text = Config.FONT_MD_BOLD.render("Item Supply", True, Colors.WHITE)
-        shift = (10, 10)
-
-        screen.blit(item_supply_text, add_tuple(starting_point, shift))
-
-        img_size = (40, 40)
-        img_pos = add_tuple(starting_point, (10, item_supply_text.get_height() + 10))
-
-        for i in range(len(self.logic.item_supply_available)):
-            row = i // 6
-            col = i % 6
-
-            item_image = pygame.image.load("./assets/images/{}.png".format(ITEM_SUPPLY_RENDER[row][col]))
-            item_image = pygame.transform.scale(item_image, img_size)
-
-            if self.logic.item_supply_available[i]:
-                screen.blit(item_image,
-                            (img_pos[0] + img_size[0] * col, img_pos[1] + img_size[0] * row))
-            else:
-                alpha = 128
-                item_image.set_alpha(alpha)
-                screen.blit(item_image,
-                            (img_pos[0] + img_size[0] * col, img_pos[1] + img_size[0] * row))
@@ -181,3 +181,7 @@ def build_card(card_id: int) -> Card:
             return Card(card_id, CardName.DOMINANCE_BIRD, Suit.BIRD, CardPhase.DAYLIGHT)
         case 53:
             return Card(card_id, CardName.DOMINANCE_FOX, Suit.FOX, CardPhase.DAYLIGHT)
+
+
+# Cards never change, so every game shares these: a card id names the same card object in any game of the process
+DECK: list[Card] = [build_card(i) for i in range(0, 54)]
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import logging
+from enum import StrEnum
+
+from game.FactionBoardLogic import FactionBoardLogic
+from game.Card import Card, CardPhase
+from utils.utils import get_card
+from game.Suit import Suit
+from game.Zobrist import card_lists_field, count_field, hashed_field
+
+LOGGER = logging.getLogger('logger')
+
+
+class DecreeAction(StrEnum):
+    RECRUIT = "RECRUIT"
+    MOVE = "MOVE"
+    BATTLE = "BATTLE"
+    BUILD = "BUILD"
+
+
+eyrie_leader_mapping: dict[str, int] = {
+    "COMMANDER": 0,
+    "DESPOT": 1,
+    "BUILDER": 2,
+    "CHARISMATIC": 3
+}
+
+eyrie_leader_mapping_reversed = [key for key in eyrie_leader_mapping]
+
+
+class EyrieLeader(StrEnum):
+    COMMANDER = "COMMANDER"
+    DESPOT = "DESPOT"
+    BUILDER = "BUILDER"
+    CHARISMATIC = "CHARISMATIC"
+
+    def to_number(self) -> int:
+        return eyrie_leader_mapping[self.name]
+
+    def to_eyrie_leader(leader_id: int) -> EyrieLeader:
+        return EyrieLeader[eyrie_leader_mapping_reversed[leader_id]]
+
+
+leader_status_mapping: dict[str, int] = {
+    "ACTIVE": 0,
+    "INACTIVE": 1,
+    "USED": 2,
+}
+
+leader_status_mapping_reversed = [key for key in leader_status_mapping]
+
+
+class LeaderStatus(StrEnum):
+    ACTIVE = "ACTIVE"
+    INACTIVE = "INACTIVE"
+    USED = "USED"
+
+    def to_number(self) -> int:
+        return leader_status_mapping[self.name]
+
+    def to_leader_status(status_id: int) -> LeaderStatus:
+        return LeaderStatus[leader_status_mapping_reversed[status_id]]
+
+
+LOYAL_VIZIER = Card(54, "Loyal Vizier", Suit.BIRD, CardPhase.IMMEDIATE)  # own id, not part of the 54 deck cards
+
+
+def get_decree_card(card_id: int, cards: list[Card]) -> Card | None:
+    return LOYAL_VIZIER if card_id == LOYAL_VIZIER.card_id else get_card(card_id, cards)
+
+
+def count_decree_action_static(decree: {DecreeAction: list[Card]}, decree_action: DecreeAction | str,
+                               suit: Suit | str) -> int:
+    return len([x for x in decree[decree_action] if x.suit == suit])
+
+
+class EyrieBoardLogic(FactionBoardLogic):
+    zobrist_tag = 'eyrie'
+    HASHED_FIELDS = FactionBoardLogic.HASHED_FIELDS | {
+        'roost_tracker': hashed_field(),
+        'leaders': count_field,
+        'decree': card_lists_field
+    }
+
+    ROOST_REWARD_VP: list[int] = [0, 0, 1, 2, 3, 4, 4, 5]
+    ROOST_REWARD_CARD: list[int] = [0, 0, 0, 1, 1, 1, 2, 2]
+
+    def __init__(self, reserved_warriors: int):
+        super().__init__(reserved_warriors)
+        self.roost_tracker: int = 0
+        self.leaders: {EyrieLeader: LeaderStatus} = {
+            EyrieLeader.COMMANDER: LeaderStatus.INACTIVE,
+            EyrieLeader.DESPOT: LeaderStatus.INACTIVE,
+            EyrieLeader.BUILDER: LeaderStatus.INACTIVE,
+            EyrieLeader.CHARISMATIC: LeaderStatus.INACTIVE
+        }
+        self.decree: {DecreeAction: list[Card]} = {
+            DecreeAction.RECRUIT: [],
+            DecreeAction.MOVE: [],
+            DecreeAction.BATTLE: [],
+            DecreeAction.BUILD: []
+        }
+
+    def get_state_as_num_array(self):
+        prev_arr = super().get_state_as_num_array()
+
+        n_features: int = 3
+        arr: list = prev_arr + [[]] * n_features
+
+        arr[7] = self.roost_tracker
+        arr[8] = [
+            self.leaders[leader].to_number() for leader in self.leaders
+        ]
+        arr[9] = [
+            [card.card_id for card in self.decree[decree_action]] for decree_action in self.decree
+        ]
+
+        return arr
+
+    def set_state_from_num_array(self,
+                                 arr: list = None,
+                                 cards: list[Card] = None):
+        super().set_state_from_num_array(arr, cards)
+        self.__set_state_from_num_arrays(arr[7], arr[8], arr[9], cards)
+
+    def __set_state_from_num_arrays(self,
+                                    roost_tracker: list[int] = None,
+                                    leader_statuses: list[int] = None,
+                                    decree: list = None,
+                                    cards: list[Card] = None):
+
+        self.roost_tracker = roost_tracker
+
+        self.a_new_generation()
+        for i, leader in enumerate(self.leaders):
+            self.leaders[leader] = LeaderStatus.to_leader_status(leader_statuses[i])
+
+        self.decree = {
+            DecreeAction.RECRUIT: [get_decree_card(i, cards) for i in decree[0]],
+            DecreeAction.MOVE: [get_decree_card(i, cards) for i in decree[1]],
+            DecreeAction.BATTLE: [get_decree_card(i, cards) for i in decree[2]],
+            DecreeAction.BUILD: [get_decree_card(i, cards) for i in decree[3]]
+        }
+
+    def copy_from(self, other: EyrieBoardLogic):
+        super().copy_from(other)
+        self.roost_tracker = other.roost_tracker
+        self.leaders = other.leaders.copy()
+        self.decree = {decree_action: cards.copy() for decree_action, cards in other.decree.items()}
+
+    def get_active_leader(self) -> EyrieLeader | None:
+        for leader in self.leaders.keys():
+            if self.leaders[leader] == LeaderStatus.ACTIVE:
+                return leader
+
+        return None
+
+    def get_inactive_leader(self) -> list[EyrieLeader]:
+        inactive_leaders: list[EyrieLeader] = []
+        for leader in self.leaders.keys():
+            if self.leaders[leader] == LeaderStatus.INACTIVE:
+                inactive_leaders.append(leader)
+        return inactive_leaders
+
+    def deactivate_current_leader(self):
+        self.journaled_set(self.leaders, self.get_active_leader(), LeaderStatus.USED)
+
+    def a_new_generation(self):
+        for leader in self.leaders.keys():
+            self.journaled_set(self.leaders, leader, LeaderStatus.INACTIVE)
+
+    def reset_decree(self):
+        self.decree = {
+            DecreeAction.RECRUIT: [],
+            DecreeAction.MOVE: [],
+            DecreeAction.BATTLE: [],
+            DecreeAction.BUILD: []
+        }
+
+    def activate_leader(self, leader: EyrieLeader) -> bool:
+        if self.leaders[leader] == LeaderStatus.USED:
+            LOGGER.warning("{} is already {}".format(leader, LeaderStatus.USED))
+            return False
+
+        self.journaled_set(self.leaders, leader, LeaderStatus.ACTIVE)
+        if leader == EyrieLeader.COMMANDER:
+            self.journaled_append(self.decree[DecreeAction.MOVE], LOYAL_VIZIER)
+            self.journaled_append(self.decree[DecreeAction.BATTLE], LOYAL_VIZIER)
+        elif leader == EyrieLeader.DESPOT:
+            self.journaled_append(self.decree[DecreeAction.MOVE], LOYAL_VIZIER)
+            self.journaled_append(self.decree[DecreeAction.BUILD], LOYAL_VIZIER)
+        elif leader == EyrieLeader.BUILDER:
+            self.journaled_append(self.decree[DecreeAction.RECRUIT], LOYAL_VIZIER)
+            self.journaled_append(self.decree[DecreeAction.MOVE], LOYAL_VIZIER)
+        elif leader == EyrieLeader.CHARISMATIC:
+            self.journaled_append(self.decree[DecreeAction.RECRUIT], LOYAL_VIZIER)
+            self.journaled_append(self.decree[DecreeAction.BATTLE], LOYAL_VIZIER)
+
+        return True
+
+    def count_card_in_decree_with_suit(self, suit: Suit | str) -> int:
+        return sum([self.count_decree_action_with_suit(decree_action, suit) for decree_action in DecreeAction])
+
+    def count_decree_action_with_suit(self, decree_action: DecreeAction | str, suit: Suit | str) -> int:
+        return count_decree_action_static(self.decree, decree_action, suit)
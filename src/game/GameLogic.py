@@ -1,40 +1,37 @@
 from __future__ import annotations
 
-import logging
 import random
-import sys
 from copy import deepcopy
 from enum import StrEnum
-from itertools import combinations
-from random import shuffle, randint
+from functools import partial
+from math import comb
+from types import MethodType
 
-from pygame import Vector2, Surface
-
-from config import Config, Colors
-from game.AreaLogic import AreaLogic, Area
-from game.BoardLogic import BoardLogic, Board
+from game.AreaLogic import AreaLogic
+from game.BoardLogic import BoardLogic
 from game.Building import Building
-from game.EyrieBoard import EyrieBoardLogic, DecreeAction, EyrieLeader, LOYAL_VIZIER, \
-    count_decree_action_static, EyrieBoard
+from game.EyrieBoardLogic import EyrieBoardLogic, DecreeAction, EyrieLeader, LOYAL_VIZIER, get_decree_card, \
+    count_decree_action_static
 from game.Faction import Faction
 from game.FactionBoardLogic import FactionBoardLogic
-from game.MarquiseBoard import MarquiseBoardLogic, MarquiseBoard
-from game.Card import Card, CardName, CardPhase, build_card
+from game.Journal import JournaledState
+from game.MarquiseBoardLogic import MarquiseBoardLogic
+from game.Card import Card, CardName, CardPhase, DECK
+from game.StateCodec import encode_state, decode_state
 from game.Suit import Suit
 from game.Token import Token
 from game.Warrior import Warrior
+from game.Zobrist import HashedState, card_feature, card_list_field, card_lists_field, hashed_field
 from utils.utils import perform, faction_to_warrior, faction_to_tokens, faction_to_buildings, get_card
+from utils.trace_utils import Tracer
 
-import yaml
-
-config_path: str = ""
-if len(sys.argv) > 1:
-    config_path = str(sys.argv[1])
-if config_path == "":
-    config_path = "./config/config.yml"
-config = yaml.safe_load(open(config_path))
+TRACER = Tracer('game_logger')
 
-LOGGER = logging.getLogger('game_logger')
+# Rules of the `game` section of the config file, used for keys the caller does not pass
+DEFAULT_GAME_CONFIG: dict = {
+    'victory-point-limit': 30,
+    'allow-dominance-card': False
+}
 
 phase_mapping: dict[str, int] = {
     "BIRDSONG": 0,
@@ -59,10 +56,110 @@ class Phase(StrEnum):
         return Phase[phase_mapping_reversed[phase_id]]
 
 
+ACTION_IDS: dict[tuple, int] = {}
+ACTION_KEYS: list[tuple] = []
+
+TEMPLATE_GAMES: dict[str, GameLogic] = {}  # by game config, see GameLogic.from_bytes
+
+
+def get_action_id(key: tuple) -> int:
+    """
+    Interns an action key (see `get_handler_key`). The same key always maps to the same non-negative id within
+    a process, ids are not meant to be shared between processes, keys are.
+    """
+    action_id = ACTION_IDS.get(key)
+    if action_id is None:
+        action_id = len(ACTION_KEYS)
+        ACTION_IDS[key] = action_id
+        ACTION_KEYS.append(key)
+    return action_id
+
+
+def get_handler_key(function: any) -> tuple:
+    """
+    Key of an action function: the name of the GameLogic method it calls, then the key of every argument.
+    Clearings and cards are keyed by index and id, so `GameLogic.resolve_handler_key` can rebuild the function
+    in any game, and plain values (factions, counts, ...) by themselves.
+    """
+    if type(function) is not partial:
+        return () if function is None else (function.__name__,)
+    return (function.func.__name__, *[get_argument_key(argument) for argument in function.args])
+
+
+def get_argument_key(argument: any) -> any:
+    get_key = ARGUMENT_KEYS.get(type(argument))
+    return argument if get_key is None else get_key(argument)
+
+
+ARGUMENT_KEYS: dict[type, any] = {
+    AreaLogic: lambda area: ('area', area.area_index),
+    Card: lambda card: ('card', card.card_id),
+    partial: lambda function: ('call', *get_handler_key(function)),
+    MethodType: lambda method: ('call', method.__name__),
+    tuple: lambda arguments: ('tuple', *[get_argument_key(argument) for argument in arguments])
+}
+
+
+def format_argument_key(key: any) -> str:
+    if type(key) is not tuple:
+        return str(key)
+    match key[0]:
+        case 'call':
+            return format_handler_key(key[1:])
+        case 'tuple':
+            return "({})".format(", ".join(format_argument_key(argument) for argument in key[1:]))
+    return "{} {}".format(*key)
+
+
+def format_handler_key(key: tuple) -> str:
+    return "{}({})".format(key[0], ", ".join(format_argument_key(argument) for argument in key[1:]))
+
+
+def encode_dice_roll(attacker_roll: int, defender_roll: int) -> int:
+    """
+    Encodes a chance outcome of the battle roll (sub phase 40007) as a negative action id.
+    """
+    return -(1 + attacker_roll * 4 + defender_roll)
+
+
+def decode_dice_roll(action_id: int) -> tuple[int, int]:
+    return divmod(-action_id - 1, 4)
+
+
+def get_action_name(action_id: int) -> str:
+    if action_id < 0:
+        return "roll dice {}".format(decode_dice_roll(action_id))
+    return format_handler_key(ACTION_KEYS[action_id])
+
+
 class Action:
-    def __init__(self, name: str, function: any = None):
-        self.name: str = name
+    def __init__(self, name: str | tuple, function: any = None):
+        """
+        :param name: shown name, or <format string, args...> formatted only when the name is read
+        :param function: GameLogic method, or `perform` of one, executing the action
+        """
+        self.label: str | tuple = name
         self.function: any = function
+        self.handler: any = function  # `function` as created, GameLogic wraps `function` to invalidate its cache
+        self.cached_action_id: int | None = None
+
+    @property
+    def name(self) -> str:
+        label = self.label
+        return label if type(label) is str else label[0].format(*label[1:])
+
+    @property
+    def action_id(self) -> int:
+        """
+        Interned key of the handler, made on first use: a random playout executes actions without their ids.
+        """
+        if self.cached_action_id is None:
+            self.cached_action_id = get_action_id(get_handler_key(self.handler))
+        return self.cached_action_id
+
+    @property
+    def key(self) -> tuple:
+        return ACTION_KEYS[self.action_id]
 
     def __str__(self):
         return "Action {}".format(self.name)
@@ -71,11 +168,111 @@ class Action:
         return self.name, self.function
 
     def __eq__(self, other: Action):
-        return self.name == other.name
+        return self.action_id == other.action_id
+
+    def __hash__(self):
+        return self.action_id
+
+
+class ActionGroup:
+    """
+    `count` legal actions created on demand, `build(i)` returns the i-th one.
+    Lets `GameLogic.sample_random_action` pick an action without creating the others.
+    """
 
+    def __init__(self, count: int, build: any):
+        self.count: int = count
+        self.build: any = build
+
+    @staticmethod
+    def of(actions: list[Action]) -> ActionGroup:
+        return ActionGroup(len(actions), actions.__getitem__)
+
+    def get_actions(self) -> list[Action]:
+        return [self.build(i) for i in range(self.count)]
+
+
+def expand_action_groups(groups: list[ActionGroup]) -> list[Action]:
+    return [action for group in groups for action in group.get_actions()]
+
+
+def nth_combination(pool: list, r: int, index: int) -> tuple:
+    """
+    The `index`-th tuple of `itertools.combinations(pool, r)`, without generating the ones before it.
+    """
+    n = len(pool)
+    c = comb(n, r)
+    result = []
+    while r:
+        c, n, r = c * r // n, n - 1, r - 1
+        while index >= c:
+            index -= c
+            c, n = c * (n - r) // n, n - 1
+        result.append(pool[-1 - n])
+    return tuple(result)
+
+
+def is_marquise(faction: Faction | None) -> bool:
+    return faction == Faction.MARQUISE
+
+
+def method_feature(method) -> str | None:
+    return None if method is None else method.__name__
+
+
+class GameLogic(HashedState, JournaledState):
+    # Fields of the num array (see get_state_as_num_array) but the board and faction boards, which hash themselves.
+    # Each is hashed by what the num array stores of it, so a game set from a num array hashes as the game it was
+    # taken from.
+    zobrist_tag = 'game'
+    HASHED_FIELDS = {
+        'running': hashed_field(),
+        'turn_count': hashed_field(),
+        'ui_turn_player': hashed_field(is_marquise),
+        'turn_player': hashed_field(is_marquise),
+        'phase': hashed_field(),
+        'sub_phase': hashed_field(),
+        'is_in_action_sub_phase': hashed_field(bool),
+        'draw_pile': card_list_field,
+        'discard_pile': card_list_field,
+        'discard_pile_dominance': card_list_field,
+        'marquise_action_count': hashed_field(),
+        'marquise_march_count': hashed_field(),
+        'marquise_recruit_count': hashed_field(),
+        'selected_clearing': hashed_field(lambda area: -1 if area is None else area.area_index),
+        'selected_card': hashed_field(card_feature),
+        'added_bird_card': hashed_field(bool),
+        'addable_count': hashed_field(),
+        'decree_counter': card_lists_field,
+        'attacker': hashed_field(is_marquise),
+        'defender': hashed_field(is_marquise),
+        'attacking_clearing': hashed_field(lambda area: 0 if area is None else area.area_index),
+        'continuation_func': hashed_field(method_feature),
+        'attacker_roll': hashed_field(),
+        'defender_roll': hashed_field(),
+        'defender_defenseless_extra_hits': hashed_field(),
+        'attacker_extra_hits': hashed_field(),
+        'defender_extra_hits': hashed_field(),
+        'redirect_func': hashed_field(lambda method: method is not None),
+        'attacker_remaining_hits': hashed_field(),
+        'defender_remaining_hits': hashed_field(),
+        'marquise_removed_warrior': hashed_field(),
+        'selecting_piece_to_remove_faction': hashed_field(is_marquise),
+        'cards_birdsong_continuation_func': hashed_field(method_feature),
+        'cards_daylight_continuation_func': hashed_field(method_feature),
+        'ignore_decree': hashed_field(),
+        'command_warren_attacker': hashed_field(is_marquise),
+        'command_warren_continuation_func': hashed_field(method_feature)
+    }
+
+    def __init__(self, game_config: dict | None = None, seed: int | None = None):
+        """
+        :param game_config: the `game` section of the config file, missing keys fall back to DEFAULT_GAME_CONFIG
+        :param seed: seed of the shuffles, dice and random picks of this game, None to seed from OS entropy
+        """
+        self.game_config: dict = DEFAULT_GAME_CONFIG | (game_config or {})
+        self.rng: random.Random = random.Random(seed)
 
-class GameLogic:
-    def __init__(self):
         self.running: bool = True
 
         # Game Data
@@ -87,7 +284,7 @@ class GameLogic:
         self.is_in_action_sub_phase: bool = False
 
         # Board Game Components
-        self.draw_pile: list[Card] = [build_card(i) for i in range(0, 54)]
+        self.draw_pile: list[Card] = DECK.copy()
         self.discard_pile: list[Card] = []
         self.discard_pile_dominance: list[Card] = []
 
@@ -125,6 +322,18 @@ class GameLogic:
         # Actions
         self.actions: list[Action] = []
         self.agent_actions: list[Action] = []
+
+        # Legal actions are cached until the state version changes, see get_legal_actions
+        self.state_version: int = 0
+        self.legal_actions_version: int = -1
+        self.legal_actions: list[Action] = []
+        self.legal_action_ids_version: int = -1
+        self.legal_action_ids: set[int] = set()
+
+        # Open undo frames and the undo journal shared by every component while one is open, see push
+        self.frames: list[tuple] = []
+        self.journal: list | None = None
+
         self.set_actions(self.get_legal_actions())
         self.set_agent_actions(self.actions)
 
@@ -281,6 +490,36 @@ class GameLogic:
             arr[33], arr[34], arr[35], arr[36], arr[37], arr[38], arr[39]
         )
 
+    def to_bytes(self) -> bytes:
+        """
+        :return: the state in the fixed binary layout of `StateCodec`, the form states are sent to workers in
+        """
+        # The num array stores whether a battle redirects, decoding redirects to the only redirect the rules set
+        if self.redirect_func is not None and self.redirect_func != self.roll_dice:
+            raise ValueError("to_bytes: redirect to {} cannot be encoded".format(self.redirect_func.__name__))
+        return encode_state(self.get_state_as_num_array())
+
+    def set_state_from_bytes(self, data: bytes):
+        self.set_state_from_num_array(decode_state(data))
+
+    @classmethod
+    def from_bytes(cls, data: bytes, game_config: dict = None, seed: int | None = None) -> GameLogic:
+        """
+        Clones a template game of `game_config` instead of running `__init__`, which sets up a whole game first.
+
+        :param data: a state of `to_bytes`
+        :param seed: seed of the random stream of the new game, None to seed from OS entropy
+        :return: a new game at that state
+        """
+        template_key = repr(sorted((game_config or {}).items()))
+        template = TEMPLATE_GAMES.get(template_key)
+        if template is None:
+            template = TEMPLATE_GAMES[template_key] = cls(game_config, 0)
+        game = template.clone()
+        game.seed(seed)
+        game.set_state_from_bytes(data)
+        return game
+
     def set_state_from_num_arrays(self,
                                   running: int = 0,
                                   turn_count: int = 0,
@@ -366,7 +605,7 @@ class GameLogic:
             marquise_action_count,
             marquise_march_count,
             marquise_recruit_count,
-            selected_clearing_area_index == 1,
+            selected_clearing_area_index,
             selected_card_id,
             added_bird_card == 1,
             addable_count,
@@ -435,8 +674,6 @@ class GameLogic:
                   command_warren_continuation_func=None
                   ):
 
-        CARDS: list[Card] = [build_card(i) for i in range(0, 54)]
-
         self.running = running
 
         # Game Data
@@ -448,16 +685,16 @@ class GameLogic:
         self.is_in_action_sub_phase = is_in_action_sub_phase
 
         # Board Game Components
-        self.draw_pile = [get_card(i, CARDS) for i in draw_pile_card_ids]
-        self.discard_pile = [get_card(i, CARDS) for i in discard_pile_card_ids]
-        self.discard_pile_dominance = [get_card(i, CARDS) for i in discard_pile_dominance_card_ids]
+        self.draw_pile = [get_card(i, DECK) for i in draw_pile_card_ids]
+        self.discard_pile = [get_card(i, DECK) for i in discard_pile_card_ids]
+        self.discard_pile_dominance = [get_card(i, DECK) for i in discard_pile_dominance_card_ids]
 
         # Board, Areas (Clearings)
         self.board.set_state_from_num_array(board)
 
         # Faction Board
-        self.marquise_board_logic.set_state_from_num_array(marquise_board, CARDS)
-        self.eyrie_board_logic.set_state_from_num_array(eyrie_board, CARDS)
+        self.marquise_board_logic.set_state_from_num_array(marquise_board, DECK)
+        self.eyrie_board_logic.set_state_from_num_array(eyrie_board, DECK)
 
         # Marquise variables
         self.marquise_action_count = marquise_action_count
@@ -491,16 +728,16 @@ class GameLogic:
         self.cards_birdsong_continuation_func = cards_birdsong_continuation_func
 
         # # Add Card To Decree variables
-        self.selected_card = get_card(selected_card_id, CARDS)
+        self.selected_card = get_card(selected_card_id, DECK)
         self.added_bird_card = added_bird_card
         self.addable_count = addable_count
 
         # # Resolve Decree variables
         self.decree_counter = {
-            DecreeAction.RECRUIT: [get_card(i, CARDS) for i in decree_counter[0]],
-            DecreeAction.MOVE: [get_card(i, CARDS) for i in decree_counter[1]],
-            DecreeAction.BATTLE: [get_card(i, CARDS) for i in decree_counter[2]],
-            DecreeAction.BUILD: [get_card(i, CARDS) for i in decree_counter[3]]
+            DecreeAction.RECRUIT: [get_decree_card(i, DECK) for i in decree_counter[0]],
+            DecreeAction.MOVE: [get_decree_card(i, DECK) for i in decree_counter[1]],
+            DecreeAction.BATTLE: [get_decree_card(i, DECK) for i in decree_counter[2]],
+            DecreeAction.BUILD: [get_decree_card(i, DECK) for i in decree_counter[3]]
         }
 
         self.ignore_decree = ignore_decree
@@ -508,6 +745,172 @@ class GameLogic:
         self.command_warren_attacker = command_warren_attacker
         self.command_warren_continuation_func = command_warren_continuation_func
 
+        self.state_changed()
+
+    #####
+    # Clone
+    def clone(self) -> GameLogic:
+        """
+        Returns an independent copy of this game without running `__init__` or a num array round trip.
+        Clearings and faction boards are copied, card objects are shared since they are never mutated.
+        The copy draws from the random stream of this game, call `seed` on it to give it one of its own.
+        """
+        game = GameLogic.__new__(GameLogic)
+        game.game_config = self.game_config
+        game.rng = self.rng  # shared stream, see seed
+
+        game.board = self.board.clone()
+        game.marquise_board_logic = self.marquise_board_logic.clone()
+        game.eyrie_board_logic = self.eyrie_board_logic.clone()
+
+        game.distance_from_the_keep_list = self.distance_from_the_keep_list
+        game.distance_from_the_keep = {}
+        for i in range(0, len(game.board.areas)):
+            game.distance_from_the_keep[game.board.areas[i]] = game.distance_from_the_keep_list[i]
+
+        game.actions = []
+        game.agent_actions = []
+
+        game.state_version = 0
+        game.legal_actions_version = -1
+        game.legal_actions = []
+        game.legal_action_ids_version = -1
+        game.legal_action_ids = set()
+
+        game.frames = []
+        game.journal = None
+
+        game.copy_from(self, copy_components=False)
+
+        return game
+
+    def copy_from(self, other: GameLogic, copy_components: bool = True):
+        """
+        Overwrites the state of this game with the state of `other`.
+        Clearing references are remapped by index and continuation functions are rebound to this game.
+
+        :param other: game to copy from
+        :param copy_components: also copy board and faction boards, set to False when they are already copies
+        """
+        if copy_components:
+            self.board.copy_from(other.board)
+            self.marquise_board_logic.copy_from(other.marquise_board_logic)
+            self.eyrie_board_logic.copy_from(other.eyrie_board_logic)
+
+        self.running = other.running
+
+        # Game Data
+        self.turn_count = other.turn_count
+        self.ui_turn_player = other.ui_turn_player
+        self.turn_player = other.turn_player
+        self.phase = other.phase
+        self.sub_phase = other.sub_phase
+        self.is_in_action_sub_phase = other.is_in_action_sub_phase
+
+        # Board Game Components
+        self.draw_pile = other.draw_pile.copy()
+        self.discard_pile = other.discard_pile.copy()
+        self.discard_pile_dominance = other.discard_pile_dominance.copy()
+
+        # Marquise variables
+        self.marquise_action_count = other.marquise_action_count
+        self.marquise_march_count = other.marquise_march_count
+        self.marquise_recruit_count = other.marquise_recruit_count
+
+        # Eyrie variables
+        self.selected_clearing = self.get_same_area(other.selected_clearing)
+        self.ignore_decree = other.ignore_decree
+
+        # Battle variables
+        self.attacker = other.attacker
+        self.defender = other.defender
+        self.attacking_clearing = self.get_same_area(other.attacking_clearing)
+        self.continuation_func = self.get_same_method(other.continuation_func)
+
+        self.attacker_roll = other.attacker_roll
+        self.defender_roll = other.defender_roll
+        self.defender_defenseless_extra_hits = other.defender_defenseless_extra_hits
+        self.attacker_extra_hits = other.attacker_extra_hits
+        self.defender_extra_hits = other.defender_extra_hits
+
+        self.redirect_func = self.get_same_method(other.redirect_func)
+        self.attacker_remaining_hits = other.attacker_remaining_hits
+        self.defender_remaining_hits = other.defender_remaining_hits
+        self.marquise_removed_warrior = other.marquise_removed_warrior
+
+        self.selecting_piece_to_remove_faction = other.selecting_piece_to_remove_faction
+
+        # Cards
+        self.cards_daylight_continuation_func = self.get_same_method(other.cards_daylight_continuation_func)
+        self.cards_birdsong_continuation_func = self.get_same_method(other.cards_birdsong_continuation_func)
+
+        self.command_warren_attacker = other.command_warren_attacker
+        self.command_warren_continuation_func = self.get_same_method(other.command_warren_continuation_func)
+
+        # # Add Card To Decree variables
+        self.selected_card = other.selected_card
+        self.added_bird_card = other.added_bird_card
+        self.addable_count = other.addable_count
+
+        # # Resolve Decree variables
+        self.decree_counter = {decree_action: cards.copy() for decree_action, cards in other.decree_counter.items()}
+
+        self.prompt = other.prompt
+
+        self.state_changed()
+
+        if other.legal_actions_version == other.state_version:
+            # ids are the same in every game, only the actions are bound to `other`
+            self.legal_action_ids = other.get_legal_action_ids()
+            self.legal_action_ids_version = self.state_version
+
+    def get_same_area(self, area: AreaLogic | None) -> AreaLogic | None:
+        return None if area is None else self.board.areas[area.area_index]
+
+    def get_same_method(self, method):
+        return None if method is None else getattr(self, method.__name__)
+
+    #####
+    # Make / Unmake
+    def push(self):
+        """
+        Opens an undo frame, the matching `pop` takes the game back to this state. Frames nest, so a search can
+        descend a line of play and ascend it again on a single game instead of cloning at every step.
+        Lists and dicts changed in place (pieces, points, items, piles, hands, decrees, trackers) are journaled with
+        their inverse as they change, so rules must change them through the `journaled_*` methods, see
+        JournaledState. Fields that are assigned instead (scalars, continuations, piles and decrees replaced as a
+        whole) are saved with the frame as shallow copies of the `__dict__` of this game and both faction boards.
+        `copy_from` and `set_state_from_num_array` are not journaled, do not call them while a frame is open.
+        """
+        if not self.frames:
+            self.set_journal([])
+
+        self.frames.append((len(self.journal), self.__dict__.copy(), self.marquise_board_logic.__dict__.copy(),
+                            self.eyrie_board_logic.__dict__.copy()))
+
+    def pop(self):
+        """
+        Undoes every change since the matching `push`, cached legal actions included.
+        """
+        journal_length, fields, marquise_fields, eyrie_fields = self.frames.pop()
+
+        self.undo_journal(journal_length)
+        self.__dict__.update(fields)
+        self.marquise_board_logic.__dict__.update(marquise_fields)
+        self.eyrie_board_logic.__dict__.update(eyrie_fields)
+
+        if not self.frames:
+            self.set_journal(None)
+
+    def set_journal(self, journal: list | None):
+        """
+        Starts (a list) or stops (None) recording the undo of every in-place change to this game and its components.
+        """
+        self.journal = journal
+        self.board.set_journal(journal)
+        self.marquise_board_logic.set_journal(journal)
+        self.eyrie_board_logic.set_journal(journal)
+
     #####
     # Setup Board
     def setup_board(self):
@@ -525,18 +928,176 @@ class GameLogic:
         self.take_card_from_draw_pile(Faction.MARQUISE, starting_card_amount)
         self.take_card_from_draw_pile(Faction.EYRIE, starting_card_amount)
 
+        self.state_changed()
+
+    def seed(self, seed: int):
+        """
+        Gives this game a random stream of its own, e.g. to a clone played out from a shared snapshot.
+        """
+        self.rng = random.Random(seed)
+
     def shuffle_draw_pile(self):
-        shuffle(self.draw_pile)
+        self.journaled_shuffle(self.draw_pile, self.rng)
 
     #####
     # Actions
 
+    def get_legal_action_ids(self) -> set[int]:
+        """
+        Ids of the legal actions, made once per state version.
+        """
+        if self.legal_action_ids_version != self.state_version:
+            self.legal_action_ids = {action.action_id for action in self.get_legal_actions()}
+            self.legal_action_ids_version = self.state_version
+        return self.legal_action_ids
+
+    def apply(self, action_id: int) -> bool:
+        """
+        Executes the legal action with `action_id`, rebuilt from its key (see `get_handler_key`).
+        The id is checked against the legal action ids of the current state, which are generated only if they are not
+        cached yet. Replays rarely pay for that: `advance_forced_moves` leaves them cached after each action, and
+        clones and copies take them over from their source.
+        A negative id (see `encode_dice_roll`) sets the dice of the pending battle and executes the roll.
+
+        :return: False if the action is not legal in the current state, nothing is executed then
+        """
+        self.prepare_legal_actions()
+
+        if action_id < 0:
+            if self.sub_phase != 40007:
+                return False
+            self.set_dice_values(*decode_dice_roll(action_id))
+            self.attacker_activate_battle_ability_card()
+        else:
+            if action_id not in self.get_legal_action_ids():
+                return False
+            self.resolve_handler_key(ACTION_KEYS[action_id])()
+
+        self.state_changed()
+        return True
+
+    def resolve_handler_key(self, key: tuple) -> any:
+        """
+        The action function of this game with `key`, see `get_handler_key`.
+        """
+        function = getattr(self, key[0])
+        if len(key) == 1:
+            return function
+        return partial(function, *[self.resolve_argument_key(argument) for argument in key[1:]])
+
+    def resolve_argument_key(self, key: any) -> any:
+        if type(key) is not tuple:
+            return key
+        match key[0]:
+            case 'area':
+                return self.board.areas[key[1]]
+            case 'card':
+                return LOYAL_VIZIER if key[1] == LOYAL_VIZIER.card_id else DECK[key[1]]
+            case 'call':
+                return self.resolve_handler_key(key[1:])
+        return tuple(self.resolve_argument_key(argument) for argument in key[1:])
+
+    def advance_forced_moves(self, stop_at_dice_roll: bool = False) -> int:
+        """
+        Executes single option actions (`Next`, `End turn`, ...) until the game ends or a choice has to be made.
+
+        :param stop_at_dice_roll: stop at the battle roll (sub phase 40007), a chance node of the search tree
+        :return: number of actions executed
+        """
+        count = 0
+        while self.running and not (stop_at_dice_roll and self.sub_phase == 40007):
+            actions = self.get_legal_actions()
+            if len(actions) != 1:
+                break
+            actions[0].function()
+            count += 1
+        return count
+
+    def state_changed(self):
+        """
+        Invalidates the legal actions cache. Executing a legal action calls this,
+        anything else that changes the game state from outside must call it too.
+        """
+        self.state_version += 1
+
+    def get_zobrist_hash(self) -> int:
+        """
+        64 bit hash of the whole game state, equal states have equal hashes whatever actions led to them.
+        Computed on demand from the current state, see HashedState, so only the transposition lookups pay for it.
+        """
+        return super().get_zobrist_hash() ^ self.board.get_zobrist_hash() \
+            ^ self.marquise_board_logic.get_zobrist_hash() ^ self.eyrie_board_logic.get_zobrist_hash()
+
+    def trace(self, message: str, *args):
+        """
+        Emits a game trace record with the turn player, phase and sub phase, call only `if TRACER.enabled`.
+        """
+        TRACER.emit(message, *args, turn_player=self.ui_turn_player, phase=self.phase, sub_phase=self.sub_phase)
+
+    def perform_and_invalidate(self, function):
+        def performed():
+            function()
+            self.state_changed()
+
+        return performed
+
     def get_legal_actions(self) -> list[Action]:
         """
         Returns list of legal actions for agent from the current state of the game.
+        Actions are generated once per state version, executing one of them invalidates the cache.
 
         :return: list of legal actions
         """
+        if self.legal_actions_version != self.state_version:
+            self.prepare_legal_actions()
+            state_version = self.state_version
+            actions = self.generate_legal_actions()
+            for action in actions:
+                if action.function is not None:
+                    action.function = self.perform_and_invalidate(action.function)
+
+            self.legal_actions = actions
+            self.legal_actions_version = state_version
+
+        return self.legal_actions.copy()
+
+    def prepare_legal_actions(self):
+        """
+        Sets what the legal actions of the current sub phase depend on: the continuation of the card actions,
+        whether a battle resolves the decree. An eyrie evening without cards to discard ends here.
+        Generating the legal actions and `apply` call this first.
+        """
+        match self.sub_phase:
+            case 10001:
+                self.cards_birdsong_continuation_func = self.marquise_birdsong_cards
+            case 10003:
+                self.cards_daylight_continuation_func = self.marquise_daylight
+            case 10004:
+                self.cards_daylight_continuation_func = self.marquise_daylight_2
+            case 20002:
+                if self.addable_count in (1, 2):
+                    self.cards_birdsong_continuation_func = self.eyrie_start_to_add_to_decree
+            case 20003:
+                self.cards_birdsong_continuation_func = self.eyrie_start_to_add_to_decree
+            case 20006:
+                self.cards_daylight_continuation_func = self.eyrie_daylight_craft
+            case 20007:
+                self.cards_daylight_continuation_func = self.eyrie_pre_recruit
+            case 20008:
+                self.cards_daylight_continuation_func = self.eyrie_pre_move
+            case 20009:
+                self.cards_daylight_continuation_func = self.eyrie_pre_battle
+                self.ignore_decree = False
+            case 20010:
+                self.cards_daylight_continuation_func = self.eyrie_pre_build
+            case 21002:
+                if len(self.eyrie_board_logic.cards_in_hand) <= 5:
+                    self.eyrie_evening_to_marquise()
+                    self.state_changed()
+            case 30003:
+                self.ignore_decree = True
+
+    def generate_legal_actions(self) -> list[Action]:
         actions: list[Action] = []
 
         match self.sub_phase:
@@ -544,7 +1105,7 @@ class GameLogic:
             # Marquise
             case 10001:  # marquise_birdsong
                 actions.extend(
-                    self.generate_actions_agent_cards_birdsong(Faction.MARQUISE, self.marquise_birdsong_cards)
+                    self.generate_actions_agent_cards_birdsong(Faction.MARQUISE)
                     + [Action('Next', perform(self.marquise_pre_daylight))]
                 )
             case 10002:  # marquise_pre_daylight
@@ -555,34 +1116,11 @@ class GameLogic:
             case 10003:  # marquise_daylight
                 actions.extend(
                     self.generate_actions_craft_cards(Faction.MARQUISE) +
-                    self.generate_actions_agent_cards_daylight(Faction.MARQUISE,
-                                                               self.marquise_daylight)
+                    self.generate_actions_agent_cards_daylight(Faction.MARQUISE)
                     + [Action('Next', perform(self.marquise_daylight_2))]
                 )
-            case 10004:  # marquise_daylight_2
-                agent_actions = []
-                if self.marquise_action_count == 0:
-                    if self.marquise_hawks_for_hire_check():
-                        agent_actions.append(Action('Hawks for hire (discard BIRD suit card to gain extra action)',
-                                                    perform(self.marquise_daylight_hawks_for_hire_select_card)))
-                else:
-                    agent_actions += (
-                            self.generate_actions_agent_marquise_march(self.marquise_daylight_agent_resolve_march) +
-                            self.generate_actions_agent_marquise_build() +
-                            self.generate_actions_agent_marquise_recruit() +
-                            self.generate_actions_agent_marquise_overwork() +
-                            self.generate_actions_agent_marquise_battle()
-                    )
-                actions.extend(
-                    agent_actions
-                    + self.generate_actions_cards_daylight(Faction.MARQUISE,
-                                                           self.marquise_daylight_2)
-                    + [Action('Next', perform(self.marquise_pre_evening))]
-                )
-
-            case 10014:  # marquise_daylight_agent_resolve_march
-                actions += (self.generate_actions_agent_marquise_march(self.marquise_daylight_2) + [
-                    Action('Next', perform(self.marquise_daylight_2))])
+            case 10004 | 10014:  # marquise_daylight_2, marquise_daylight_agent_resolve_march
+                actions.extend(expand_action_groups(self.generate_action_groups()))
 
             case 10024:  # marquise_daylight_hawks_for_hire_select_card
                 actions += (self.generate_actions_select_card_hawks_for_hire())
@@ -616,20 +1154,17 @@ class GameLogic:
             case 20002:  # eyrie_start -> eyrie_start_to_add_to_decree
                 if self.addable_count == 2:
                     actions += self.generate_actions_agent_add_card_to_decree() \
-                               + self.generate_actions_agent_cards_birdsong(Faction.EYRIE,
-                                                                            self.eyrie_start_to_add_to_decree)
+                               + self.generate_actions_agent_cards_birdsong(Faction.EYRIE)
 
                 elif self.addable_count == 1:
                     actions += self.generate_actions_agent_add_card_to_decree() \
                                + [
                                    Action("Skip", perform(self.eyrie_add_to_the_decree_additional_skip))
                                ] \
-                               + self.generate_actions_agent_cards_birdsong(Faction.EYRIE,
-                                                                            self.eyrie_start_to_add_to_decree)
+                               + self.generate_actions_agent_cards_birdsong(Faction.EYRIE)
             case 20003:
                 actions += self.generate_actions_place_roost_and_3_warriors() \
-                           + self.generate_actions_agent_cards_birdsong(Faction.EYRIE,
-                                                                        self.eyrie_start_to_add_to_decree)
+                           + self.generate_actions_agent_cards_birdsong(Faction.EYRIE)
             case 20004:
                 actions.append(Action('Next, to Daylight', perform(self.eyrie_birdsong_to_daylight)))
             case 20005:
@@ -637,22 +1172,21 @@ class GameLogic:
                            + [Action('Next, to Craft', self.eyrie_daylight_craft)]
             case 20006:
                 actions += self.generate_actions_craft_cards(Faction.EYRIE) \
-                           + self.generate_actions_agent_cards_daylight(Faction.EYRIE, self.eyrie_daylight_craft) \
+                           + self.generate_actions_agent_cards_daylight(Faction.EYRIE) \
                            + [Action('Next, to Resolve Decree',
                                      perform(self.eyrie_daylight_craft_to_resolve_the_decree))]
             case 20007:
                 actions += self.generate_actions_eyrie_recruit() \
-                           + self.generate_actions_agent_cards_daylight(Faction.EYRIE, self.eyrie_pre_recruit)
+                           + self.generate_actions_agent_cards_daylight(Faction.EYRIE)
             case 20008:
-                actions += self.generate_actions_agent_eyrie_move() \
-                           + self.generate_actions_agent_cards_daylight(Faction.EYRIE, self.eyrie_pre_move)
+                actions.extend(expand_action_groups(self.generate_action_groups()))
             case 20009:
                 actions += self.generate_actions_agent_eyrie_battle() \
-                           + self.generate_actions_agent_cards_daylight(Faction.EYRIE, self.eyrie_pre_battle)
+                           + self.generate_actions_agent_cards_daylight(Faction.EYRIE)
             case 20010:
                 actions.extend(
                     self.generate_actions_eyrie_build() +
-                    self.generate_actions_agent_cards_daylight(Faction.EYRIE, self.eyrie_pre_build)
+                    self.generate_actions_agent_cards_daylight(Faction.EYRIE)
                 )
 
             case 20011:
@@ -664,8 +1198,6 @@ class GameLogic:
             case 21002:
                 if len(self.eyrie_board_logic.cards_in_hand) > 5:
                     actions += self.generate_actions_select_card_to_discard(Faction.EYRIE)
-                else:
-                    self.eyrie_evening_to_marquise()
             case 21003:
                 actions += [Action('Next, to Marquise', perform(self.marquise_birdsong_start))]
 
@@ -698,7 +1230,7 @@ class GameLogic:
                               card.name == CardName.AMBUSH and (
                                       card.suit == Suit.BIRD or card.suit == self.attacking_clearing.suit)]
                 for card in def_ambush:
-                    def_ambush_actions.append(Action('Discard {} ({})'.format(card.name, card.suit),
+                    def_ambush_actions.append(Action(('Discard {} ({})', card.name, card.suit),
                                                      perform(self.attacker_use_ambush, card)))
 
                 actions.extend(
@@ -712,7 +1244,7 @@ class GameLogic:
                 attacker_board = self.faction_to_faction_board(self.attacker)
                 atk_ambush = [card for card in attacker_board.cards_in_hand if card.name == CardName.AMBUSH]
                 for card in atk_ambush:
-                    atk_ambush_actions.append(Action('Discard {} ({})'.format(card.name, card.suit),
+                    atk_ambush_actions.append(Action(('Discard {} ({})', card.name, card.suit),
                                                      perform(self.foil_ambush, card)))
 
                 actions.extend(
@@ -732,12 +1264,12 @@ class GameLogic:
                 if len(atk_brutal_tactics) > 0 and attacker_faction_board.activated_card.count(
                         atk_brutal_tactics[0]) < 1:
                     brutal_tactics_card = atk_brutal_tactics[0]
-                    atk_actions.append(Action('Use {} ({})'.format(brutal_tactics_card.name, brutal_tactics_card.suit),
+                    atk_actions.append(Action(('Use {} ({})', brutal_tactics_card.name, brutal_tactics_card.suit),
                                               perform(self.brutal_tactics, brutal_tactics_card)))
 
                 if len(atk_armorers) > 0 and attacker_faction_board.activated_card.count(atk_armorers[0]) < 1:
                     armorers_card = atk_armorers[0]
-                    atk_actions.append(Action('Use {} ({})'.format(armorers_card.name, armorers_card.suit),
+                    atk_actions.append(Action(('Use {} ({})', armorers_card.name, armorers_card.suit),
                                               perform(self.armorers, self.attacker, armorers_card)))
 
                 actions.extend(
@@ -755,12 +1287,12 @@ class GameLogic:
 
                 if len(def_sappers) > 0 and defender_faction_board.activated_card.count(def_sappers[0]) < 1:
                     sappers_card = def_sappers[0]
-                    def_actions.append(Action('Use {} ({})'.format(sappers_card.name, sappers_card.suit),
+                    def_actions.append(Action(('Use {} ({})', sappers_card.name, sappers_card.suit),
                                               perform(self.sappers, sappers_card)))
 
                 if len(def_armorers) > 0 and defender_faction_board.activated_card.count(def_armorers[0]) < 1:
                     armorers_card = def_armorers[0]
-                    def_actions.append(Action('Use {} ({})'.format(armorers_card.name, armorers_card.suit),
+                    def_actions.append(Action(('Use {} ({})', armorers_card.name, armorers_card.suit),
                                               perform(self.armorers, self.defender, armorers_card)))
 
                 actions.extend(
@@ -784,10 +1316,75 @@ class GameLogic:
                     [Action('Next', perform(self.attacker_activate_battle_ability_card))]
                 )
 
-        LOGGER.debug("get_legal_actions:{}: len(actions) {}, actions {}".format(self.sub_phase, len(actions),
-                                                                                [a.name for a in actions]))
+        if TRACER.enabled:
+            self.trace("generate_legal_actions: len(actions) {}, actions {}", len(actions), [a.name for a in actions])
         return actions
 
+    def generate_action_groups(self) -> list[ActionGroup] | None:
+        """
+        Legal actions of the sub phases with many of them, as groups created on demand, in the order of
+        `generate_legal_actions`. None for the other sub phases.
+        """
+        match self.sub_phase:
+            case 10004:  # marquise_daylight_2
+                groups: list[ActionGroup] = []
+                if self.marquise_action_count == 0:
+                    if self.marquise_hawks_for_hire_check():
+                        groups.append(ActionGroup.of([
+                            Action('Hawks for hire (discard BIRD suit card to gain extra action)',
+                                   perform(self.marquise_daylight_hawks_for_hire_select_card))]))
+                else:
+                    groups += (
+                            self.generate_action_groups_agent_marquise_march(
+                                self.marquise_daylight_agent_resolve_march) +
+                            self.generate_action_groups_agent_marquise_build() +
+                            self.generate_action_groups_agent_marquise_recruit() +
+                            self.generate_action_groups_agent_marquise_overwork() +
+                            self.generate_action_groups_agent_marquise_battle()
+                    )
+                return groups + [ActionGroup.of(
+                    self.generate_actions_cards_daylight(Faction.MARQUISE, self.marquise_daylight_2)
+                    + [Action('Next', perform(self.marquise_pre_evening))]
+                )]
+
+            case 10014:  # marquise_daylight_agent_resolve_march
+                return self.generate_action_groups_agent_marquise_march(self.marquise_daylight_2) + [
+                    ActionGroup.of([Action('Next', perform(self.marquise_daylight_2))])]
+
+            case 20008:
+                return self.generate_action_groups_agent_eyrie_move() + [ActionGroup.of(
+                    self.generate_actions_agent_cards_daylight(Faction.EYRIE))]
+
+        return None
+
+    def sample_random_action(self, rng: any) -> Action | None:
+        """
+        Uniformly random legal action, same distribution as picking from `get_legal_actions`.
+        In the sub phases of `generate_action_groups`, only the picked action is created.
+
+        :param rng: anything with a `random()` method returning a float in [0, 1), e.g. the `random` module
+                    or a numpy Generator
+        :return: None if there is no legal action
+        """
+        if self.legal_actions_version != self.state_version:
+            self.prepare_legal_actions()
+            groups = self.generate_action_groups()
+            if groups is not None:
+                index = int(rng.random() * sum(group.count for group in groups))
+                for group in groups:
+                    if index < group.count:
+                        action = group.build(index)
+                        if action.function is not None:
+                            action.function = self.perform_and_invalidate(action.function)
+                        return action
+                    index -= group.count
+                return None
+
+        actions = self.get_legal_actions()
+        if len(actions) == 0:
+            return None
+        return actions[int(rng.random() * len(actions))]
+
     def get_actions(self) -> list[Action]:
         return self.get_legal_actions()
 
@@ -820,11 +1417,11 @@ class GameLogic:
             return self.check_win_condition_dominance(faction, no_end_action)
 
     def check_win_condition_vp(self, faction: Faction, no_end_action: bool = False) -> tuple[int, int] | None:
-        if self.board.faction_points[faction] >= config['game']['victory-point-limit']:
+        if self.board.faction_points[faction] >= self.game_config['victory-point-limit']:
             if not no_end_action:
-                LOGGER.debug(
-                    "GAME_END:VP:MARQUISE {} vs EYRIE {}".format(self.board.faction_points[Faction.MARQUISE],
-                                                                 self.board.faction_points[Faction.EYRIE]))
+                if TRACER.enabled:
+                    TRACER.emit("GAME_END:VP:MARQUISE {} vs EYRIE {}",
+                                self.board.faction_points[Faction.MARQUISE], self.board.faction_points[Faction.EYRIE])
                 self.end_game()
             return self.board.faction_points[Faction.MARQUISE], self.board.faction_points[Faction.EYRIE]
 
@@ -845,9 +1442,8 @@ class GameLogic:
 
         if not no_end_action:
             if winning_dominance is not None:
-                LOGGER.debug(
-                    "GAME_END:DOMINANCE:{}, {} Wins".format(winning_dominance.name,
-                                                            faction))
+                if TRACER.enabled:
+                    TRACER.emit("GAME_END:DOMINANCE:{}, {} Wins", winning_dominance.name, faction)
                 self.end_game()
         return winning_dominance
 
@@ -884,7 +1480,7 @@ class GameLogic:
         vp_marquise: int = self.board.faction_points[Faction.MARQUISE]
         vp_eyrie: int = self.board.faction_points[Faction.EYRIE]
         winning_dominance: None | Card = None
-        if config['game']['allow-dominance-card']:
+        if self.game_config['allow-dominance-card']:
             winning_dominance = self.check_win_condition_dominance(winning_faction, True) \
                 if self.faction_to_faction_board(winning_faction).dominance_card is not None \
                 else None
@@ -899,7 +1495,8 @@ class GameLogic:
         self.phase = Phase.BIRDSONG
         self.sub_phase = 10001
 
-        LOGGER.debug("{}:{}:{}:MARQUISE's turn begins".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("MARQUISE's turn begins")
         self.turn_count += 1
 
         self.check_win_condition(Faction.MARQUISE)
@@ -910,14 +1507,15 @@ class GameLogic:
         self.marquise_recruit_count = 1
         # Place one wood at each sawmill
         for area in self.board.areas:
-            area.token_count[Token.WOOD] += area.buildings.count(Building.SAWMILL)
+            area.add_token(Token.WOOD, area.buildings.count(Building.SAWMILL))
 
-        self.marquise_board_logic.crafting_pieces_count = self.get_workshop_count_by_suit()
+        self.marquise_board_logic.set_crafting_piece_count(self.get_workshop_count_by_suit())
 
         self.marquise_birdsong_cards()
 
     def marquise_birdsong_cards(self):
-        LOGGER.debug("{}:{}:{}:Enter marquise_birdsong_cards".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_birdsong_cards")
         if len(self.generate_actions_cards_birdsong(Faction.MARQUISE, self.marquise_birdsong_cards)) == 0:
             self.marquise_pre_daylight()
         else:
@@ -929,7 +1527,8 @@ class GameLogic:
         self.phase = Phase.DAYLIGHT
         self.sub_phase = 10002
 
-        LOGGER.debug("{}:{}:{}:Enter marquise_pre_daylight".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_pre_daylight")
 
         actions = self.generate_actions_command_warren(Faction.MARQUISE, self.marquise_daylight)
         if not actions:
@@ -939,7 +1538,8 @@ class GameLogic:
             self.set_actions(actions + [Action('Next', self.marquise_daylight)])
 
     def marquise_daylight(self):  # 10003
-        LOGGER.debug("{}:{}:{}:Enter marquise_daylight".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_daylight")
         self.sub_phase = 10003
 
         craftable_cards = self.generate_actions_craft_cards(Faction.MARQUISE)
@@ -953,7 +1553,8 @@ class GameLogic:
                                  Action('Next', perform(self.marquise_daylight_2))])
 
     def marquise_daylight_2(self):  # 10004
-        LOGGER.debug("{}:{}:{}:Enter marquise_daylight_2".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_daylight_2")
         actions = []
         agent_actions = []
         self.prompt = "Select Actions (Remaining Action: {})".format(self.marquise_action_count)
@@ -1013,9 +1614,8 @@ class GameLogic:
 
     def marquise_daylight_hawks_for_hire_select_card(self):  # 10024
         self.sub_phase = 10024
-        LOGGER.debug(
-            "{}:{}:{}:Enter marquise_daylight_hawks_for_hire_select_card".format(self.ui_turn_player, self.phase,
-                                                                                 self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_daylight_hawks_for_hire_select_card")
 
         self.prompt = "Select card to discard"
         self.set_actions(self.generate_actions_select_card_hawks_for_hire())
@@ -1025,9 +1625,8 @@ class GameLogic:
 
     def marquise_daylight_resolve_march(self):
         self.marquise_march_count -= 1
-        LOGGER.debug(
-            "{}:{}:{}:MARQUISE's remaining march action: {}".format(self.ui_turn_player, self.phase,
-                                                                    self.sub_phase, self.marquise_march_count))
+        if TRACER.enabled:
+            self.trace("MARQUISE's remaining march action: {}", self.marquise_march_count)
         if self.marquise_march_count > 0 and len(
                 self.generate_actions_select_src_clearing(Faction.MARQUISE, None, False)) > 0:
             self.prompt = "The warriors has been moved. (Remaining march action: {})".format(
@@ -1039,59 +1638,47 @@ class GameLogic:
                 self.marquise_march_count)
             self.set_actions([Action('Next', perform(self.marquise_daylight_2))])
 
-    def generate_actions_agent_marquise_march(self, cont_func):
-        actions: list[Action] = []
-
-        can_move_from_clearing = self.find_available_source_clearings(Faction.MARQUISE, False)
-        for src in can_move_from_clearing:
-            dests = self.find_available_destination_clearings(Faction.MARQUISE, src)
-            for dest in dests:
-                for num_of_warriors in range(1, src.warrior_count[faction_to_warrior(Faction.MARQUISE)] + 1):
-                    actions.append(Action("Move {} warriors from {} to {}".format(
-                        num_of_warriors, src.area_index, dest.area_index),
-                        perform(self.move_warriors,
-                                Faction.MARQUISE, src, dest,
-                                num_of_warriors, cont_func)))
-        return actions
+    def generate_action_groups_agent_marquise_march(self, cont_func) -> list[ActionGroup]:
+        return self.generate_action_groups_move(Faction.MARQUISE, False, cont_func)
 
     def marquise_daylight_agent_resolve_march(self):  # 10014
         self.marquise_action_count -= 1
         self.sub_phase = 10014
-        LOGGER.debug(
-            "{}:{}:{}:MARQUISE's remaining march action: {}".format(self.ui_turn_player, self.phase,
-                                                                    self.sub_phase, 1))
+        if TRACER.enabled:
+            self.trace("MARQUISE's remaining march action: {}", 1)
 
     def marquise_daylight_build_select_clearing(self):
-        LOGGER.debug("{}:{}:{}:Enter marquise_daylight_build_select_clearing".format(self.ui_turn_player, self.phase,
-                                                                                     self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_daylight_build_select_clearing")
 
         self.prompt = "Let's build. Select clearing"
         self.set_actions(self.generate_actions_select_buildable_clearing(Faction.MARQUISE))
 
     def marquise_daylight_build_select_building(self, clearing):
-        LOGGER.debug("{}:{}:{}:Enter marquise_daylight_build_select_building".format(self.ui_turn_player, self.phase,
-                                                                                     self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_daylight_build_select_building")
 
         self.prompt = "Select Building"
         self.set_actions(self.generate_actions_select_building(Faction.MARQUISE, clearing))
 
-    def generate_actions_agent_marquise_build(self):
-        actions = []
+    def generate_action_groups_agent_marquise_build(self) -> list[ActionGroup]:
+        groups = []
         buildable_clearings = self.get_buildable_clearings(Faction.MARQUISE)
 
         for clearing in buildable_clearings:
             buildings = self.get_buildable_buildings(Faction.MARQUISE, clearing)
-            for building in buildings:
-                actions.append(
-                    Action("Builds {} in clearing #{}".format(building, clearing),
-                           perform(self.build, Faction.MARQUISE, clearing, building)))
+            groups.append(ActionGroup(len(buildings), lambda i, clearing=clearing, buildings=buildings: Action(
+                ("Builds {} in clearing #{}", buildings[i], clearing),
+                perform(self.build, Faction.MARQUISE, clearing, buildings[i]))))
 
-        return actions
+        return groups
 
     def marquise_daylight_recruit(self):
-        LOGGER.debug("{}:{}:{}:Enter marquise_daylight_recruit".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_daylight_recruit")
 
-        LOGGER.debug("{}:{}:{}:MARQUISE recruit.".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("MARQUISE recruit.")
         self.prompt = "Recruit warrior"
 
         if (self.marquise_board_logic.reserved_warriors >=
@@ -1104,8 +1691,8 @@ class GameLogic:
             self.marquise_daylight_recruit_some_clearings(clearing_with_recruiter)
 
     def marquise_daylight_recruit_some_clearings(self, clearing_with_recruiter):
-        LOGGER.debug("{}:{}:{}:Enter marquise_daylight_recruit_some_clearings".format(self.ui_turn_player, self.phase,
-                                                                                      self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_daylight_recruit_some_clearings")
 
         if clearing_with_recruiter is [] or self.marquise_board_logic.reserved_warriors == 0:
             self.marquise_recruit_count -= 1
@@ -1122,72 +1709,70 @@ class GameLogic:
         for clearing in clearing_with_recruiter:
             remaining_clearing = clearing_with_recruiter.copy()
             remaining_clearing.remove(clearing)
-            actions.append(Action('{}'.format(clearing.area_index), perform(self.recruit_single_clearing, clearing,
+            actions.append(Action(('{}', clearing.area_index), perform(self.recruit_single_clearing, clearing,
                                                                             remaining_clearing)))
 
         return actions
 
     def recruit_single_clearing(self, clearing, remaining_clearing_with_recruiter):
-        LOGGER.debug("{}:{}:{}:Enter recruit_single_clearing".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter recruit_single_clearing")
 
         self.add_warrior(Faction.MARQUISE, clearing, 1)
-        LOGGER.debug(
-            "{}:{}:{}:MARQUISE adds warrior in clearing #{}".format(self.ui_turn_player, self.phase,
-                                                                    self.sub_phase,
-                                                                    clearing.area_index))
+        if TRACER.enabled:
+            self.trace("MARQUISE adds warrior in clearing #{}", clearing.area_index)
         self.marquise_daylight_recruit_some_clearings(remaining_clearing_with_recruiter)
 
-    def generate_actions_agent_marquise_recruit(self):
-        actions = []
+    def generate_action_groups_agent_marquise_recruit(self) -> list[ActionGroup]:
         if self.marquise_recruit_count == 0:
-            return actions
+            return []
 
         if (self.marquise_board_logic.reserved_warriors >=
                 self.marquise_board_logic.building_trackers[Building.RECRUITER]):
-            actions.append(Action("Recruit", perform(self.marquise_daylight_recruit)))
-        else:
-            clearing_with_recruiter = [clearing for clearing in self.board.areas for _ in
-                                       range(clearing.buildings.count(Building.RECRUITER))]
-            all_possible_clearing_combinations = combinations(clearing_with_recruiter,
-                                                              self.marquise_board_logic.reserved_warriors)
-            for combination in list(all_possible_clearing_combinations):
-                actions.append(Action("Recruit in clearing {}".format([c.area_index for c in combination]),
-                                      perform(self.recruit_many_clearings, combination)))
+            return [ActionGroup.of([Action("Recruit", perform(self.marquise_daylight_recruit))])]
 
-        return actions
+        # one action per combination of recruiters, the i-th one is built without listing the others
+        clearing_with_recruiter = [clearing for clearing in self.board.areas for _ in
+                                   range(clearing.buildings.count(Building.RECRUITER))]
+        reserved_warriors = self.marquise_board_logic.reserved_warriors
+
+        def build(i: int) -> Action:
+            combination = nth_combination(clearing_with_recruiter, reserved_warriors, i)
+            return Action(("Recruit in clearing {}", [c.area_index for c in combination]),
+                          perform(self.recruit_many_clearings, combination))
+
+        return [ActionGroup(comb(len(clearing_with_recruiter), reserved_warriors), build)]
 
     def recruit_many_clearings(self, clearings):
         self.marquise_recruit_count -= 1
         self.marquise_action_count -= 1
         for clearing in clearings:
             self.add_warrior(Faction.MARQUISE, clearing, 1)
-            LOGGER.debug(
-                "{}:{}:{}:MARQUISE adds warrior in clearing #{}".format(self.ui_turn_player, self.phase,
-                                                                        self.sub_phase,
-                                                                        clearing.area_index))
+            if TRACER.enabled:
+                self.trace("MARQUISE adds warrior in clearing #{}", clearing.area_index)
         self.marquise_daylight_2()
 
     def marquise_daylight_battle(self):
-        LOGGER.debug("{}:{}:{}:Enter marquise_daylight_battle".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_daylight_battle")
 
         self.marquise_action_count -= 1
         self.select_clearing_battle(Faction.MARQUISE, self.marquise_daylight_2)
 
-    def generate_actions_agent_marquise_battle(self):
+    def generate_action_groups_agent_marquise_battle(self) -> list[ActionGroup]:
         attacker = Faction.MARQUISE
         clearings = self.get_battlable_clearing(attacker, False)
-        actions = []
+        groups = []
 
         for clearing in clearings:
             enemy_factions: list[Faction] = self.get_available_enemy_tokens_from_clearing(attacker, clearing)
 
-            for enemy_faction in enemy_factions:
-                actions.append(
-                    Action("Attack {} in area {}".format(enemy_faction, clearing.area_index),
-                           perform(self.marquise_agent_initiate_battle, attacker, enemy_faction, clearing,
-                                   self.marquise_daylight_2)))
+            groups.append(ActionGroup(len(enemy_factions), lambda i, clearing=clearing, enemy_factions=enemy_factions:
+                                      Action(("Attack {} in area {}", enemy_factions[i], clearing.area_index),
+                                             perform(self.marquise_agent_initiate_battle, attacker, enemy_factions[i],
+                                                     clearing, self.marquise_daylight_2))))
 
-        return actions
+        return groups
 
     def marquise_agent_initiate_battle(self, attacker, defender, clearing, continuation_func):
         self.marquise_action_count -= 1
@@ -1195,50 +1780,50 @@ class GameLogic:
         self.initiate_battle(attacker, defender, clearing, continuation_func)
 
     def marquise_daylight_overwork_select_clearing(self):
-        LOGGER.debug("{}:{}:{}:Enter marquise_daylight_overwork_select_clearing".format(self.ui_turn_player, self.phase,
-                                                                                        self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_daylight_overwork_select_clearing")
 
         self.prompt = "Select Clearing"
         self.set_actions(self.generate_actions_overwork_select_clearing())
 
     def marquise_daylight_overwork_select_card_to_discard(self, clearing):
-        LOGGER.debug(
-            "{}:{}:{}:Enter marquise_daylight_overwork_select_card_to_discard".format(self.ui_turn_player, self.phase,
-                                                                                      self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_daylight_overwork_select_card_to_discard")
 
         self.prompt = "Select Card"
         self.set_actions(self.generate_actions_overwork_select_card(clearing))
 
     def marquise_overwork(self, clearing: AreaLogic, card):
-        LOGGER.debug("{}:{}:{}:Enter marquise_overwork".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_overwork")
 
-        LOGGER.debug(
-            "{}:{}:{}:MARQUISE overwork on clearing #{}".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                                clearing.area_index))
+        if TRACER.enabled:
+            self.trace("MARQUISE overwork on clearing #{}", clearing.area_index)
         self.discard_card(self.marquise_board_logic.cards_in_hand, card)
-        clearing.token_count[Token.WOOD] += 1
+        clearing.add_token(Token.WOOD)
 
         self.prompt = "Overwork complete"
         self.marquise_action_count -= 1
         self.set_actions([Action('Next', self.marquise_daylight_2)])
 
-    def generate_actions_agent_marquise_overwork(self):
+    def generate_action_groups_agent_marquise_overwork(self) -> list[ActionGroup]:
         available_clearing = self.find_available_overwork_clearings()
-        actions = []
+        groups = []
 
         for clearing in available_clearing:
             discardable_card = [card for card in self.marquise_board_logic.cards_in_hand if card.suit == clearing.suit]
 
-            for card in discardable_card:
-                actions.append(Action('Overwork: Discard {} ({})'.format(card.name, card.suit),
-                                      perform(self.marquise_overwork, clearing, card)))
+            groups.append(ActionGroup(len(discardable_card), lambda i, clearing=clearing, cards=discardable_card:
+                                      Action(('Overwork: Discard {} ({})', cards[i].name, cards[i].suit),
+                                             perform(self.marquise_overwork, clearing, cards[i]))))
 
-        return actions
+        return groups
 
     def marquise_pre_evening(self):  # 10005
         self.phase = Phase.EVENING
         self.sub_phase = 10005
-        LOGGER.debug("{}:{}:{}:Enter marquise_pre_evening".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_pre_evening")
         actions = self.generate_actions_cobbler(Faction.MARQUISE, self.marquise_evening_draw_card)
 
         if not actions:
@@ -1248,8 +1833,8 @@ class GameLogic:
             self.set_actions(actions + [Action('Next', self.marquise_evening_draw_card)])
 
     def marquise_evening_draw_card(self):  # 10006
-        LOGGER.debug(
-            "{}:{}:{}:Enter marquise_evening_draw_card".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_evening_draw_card")
         self.sub_phase = 10006
 
         self.prompt = "Draw one card, plus one card per draw bonus"
@@ -1261,8 +1846,8 @@ class GameLogic:
     def marquise_evening_discard_card(self):  # 10007
         self.sub_phase = 10007
 
-        LOGGER.debug(
-            "{}:{}:{}:Enter marquise_evening_discard_card".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter marquise_evening_discard_card")
 
         card_in_hand_count = len(self.marquise_board_logic.cards_in_hand)
         if card_in_hand_count > 5:
@@ -1328,8 +1913,7 @@ class GameLogic:
     def remove_wood_from_clearing(self, clearing,
                                   number):
         remaining_wood = max(number - clearing.token_count[Token.WOOD], 0)
-        clearing.token_count[Token.WOOD] -= (
-            min(number, clearing.token_count[Token.WOOD]))
+        clearing.remove_token(Token.WOOD, number)
         return remaining_wood
 
     def find_available_overwork_clearings(self) -> list[AreaLogic]:
@@ -1347,7 +1931,7 @@ class GameLogic:
 
         for clearing in available_clearing:
             actions.append(
-                Action("{}".format(clearing.area_index),
+                Action(("{}", clearing.area_index),
                        perform(self.marquise_daylight_overwork_select_card_to_discard, clearing)))
 
         return actions
@@ -1357,7 +1941,7 @@ class GameLogic:
         actions: list[Action] = []
 
         for card in discardable_card:
-            actions.append(Action('{} ({})'.format(card.name, card.suit),
+            actions.append(Action(('{} ({})', card.name, card.suit),
                                   perform(self.marquise_overwork, clearing, card)))
 
         return actions
@@ -1367,7 +1951,7 @@ class GameLogic:
         actions: list[Action] = []
 
         for card in cards:
-            actions.append(Action('{} ({})'.format(card.name, card.suit),
+            actions.append(Action(('{} ({})', card.name, card.suit),
                                   perform(self.marquise_hawks_for_hire, card)))
 
         return actions
@@ -1381,7 +1965,8 @@ class GameLogic:
     #####
     # Eyrie
     def eyrie_start(self):  # 20001
-        LOGGER.debug("{}:{}:{}:eyrie turn begins".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("eyrie turn begins")
         self.turn_count += 1
 
         self.check_win_condition(Faction.EYRIE)
@@ -1389,7 +1974,8 @@ class GameLogic:
         self.better_burrow_bank(Faction.EYRIE)
 
         if len(self.eyrie_board_logic.cards_in_hand) == 0:
-            LOGGER.debug("{}:{}:{}:eyrie_emergency_orders".format(self.ui_turn_player, self.phase, self.sub_phase))
+            if TRACER.enabled:
+                self.trace("eyrie_emergency_orders")
             self.take_card_from_draw_pile(Faction.EYRIE)
 
         self.ui_turn_player = Faction.EYRIE
@@ -1402,9 +1988,8 @@ class GameLogic:
         self.eyrie_start_to_add_to_decree()
 
     def eyrie_start_to_add_to_decree(self):  # 20002
-        LOGGER.debug(
-            "{}:{}:{}:eyrie_start_to_add_to_decree addable_count = {}".format(self.ui_turn_player, self.phase,
-                                                                              self.sub_phase, self.addable_count))
+        if TRACER.enabled:
+            self.trace("eyrie_start_to_add_to_decree addable_count = {}", self.addable_count)
         self.sub_phase = 20002
         if self.addable_count == 2:
             self.prompt = "Select Card To Add To Decree"
@@ -1421,7 +2006,7 @@ class GameLogic:
             if self.added_bird_card and card.suit == Suit.BIRD:
                 continue
             for decree_action in DecreeAction:
-                actions.append(Action('{} ({}) to {}'.format(card.name, card.suit, decree_action),
+                actions.append(Action(('{} ({}) to {}', card.name, card.suit, decree_action),
                                       perform(self.agent_add_card_to_decree, card, decree_action)))
 
         return actions
@@ -1436,12 +2021,10 @@ class GameLogic:
             for card in self.eyrie_board_logic.cards_in_hand:
                 if self.added_bird_card and card.suit == Suit.BIRD:
                     continue
-                actions.append(Action('{} ({})'.format(card.name, card.suit),
+                actions.append(Action(('{} ({})', card.name, card.suit),
                                       perform(self.select_card_to_add_to_the_decree, card)))
-        LOGGER.debug(
-            "{}:{}:{}:generate_actions_add_to_the_decree_first {}".format(self.ui_turn_player, self.phase,
-                                                                          self.sub_phase,
-                                                                          len(actions)))
+        if TRACER.enabled:
+            self.trace("generate_actions_add_to_the_decree_first {}", len(actions))
         return actions
 
     def select_card_to_add_to_the_decree(self, card: Card):
@@ -1454,31 +2037,30 @@ class GameLogic:
         actions: list[Action] = []
         for decree_action in DecreeAction:
             actions.append(
-                Action("{}".format(decree_action), perform(self.select_decree_to_add_card_to, decree_action)))
+                Action(("{}", decree_action), perform(self.select_decree_to_add_card_to, decree_action)))
 
         return actions
 
     def select_decree_to_add_card_to(self, decree_action: DecreeAction | str):
-        self.eyrie_board_logic.decree[decree_action].append(self.selected_card)
-        self.eyrie_board_logic.cards_in_hand.remove(self.selected_card)
+        self.journaled_append(self.eyrie_board_logic.decree[decree_action], self.selected_card)
+        self.journaled_remove(self.eyrie_board_logic.cards_in_hand, self.selected_card)
 
         self.addable_count -= 1
         if self.selected_card.suit == Suit.BIRD:
             self.added_bird_card = True
 
-        LOGGER.debug(
-            "{}:{}:{}:Added card '{}' to {} decree".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                           self.selected_card.name, decree_action))
+        if TRACER.enabled:
+            self.trace("Added card '{}' to {} decree", self.selected_card.name, decree_action)
         self.eyrie_start_to_add_to_decree()
 
     def eyrie_add_to_the_decree_additional_skip(self):
-        LOGGER.debug(
-            "{}:{}:{}:eyrie_add_to_the_decree_additional_skip".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("eyrie_add_to_the_decree_additional_skip")
         self.eyrie_a_new_roost()
 
     def eyrie_a_new_roost(self):  # 20003
-        LOGGER.debug(
-            "{}:{}:{}:eyrie_a_new_roost".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("eyrie_a_new_roost")
 
         self.sub_phase = 20003
 
@@ -1496,31 +2078,29 @@ class GameLogic:
         actions: list[Action] = []
         min_token_areas = self.get_areas_with_min_warrior_and_empty_building()
         for area in min_token_areas:
-            actions.append(Action("Area {}".format(area.area_index), perform(self.place_roost_and_3_warriors, area)))
+            actions.append(Action(("Area {}", area.area_index), perform(self.place_roost_and_3_warriors, area)))
 
         return actions
 
     def place_roost_and_3_warriors(self, area: AreaLogic):  # 20004
         self.sub_phase = 20004
-        LOGGER.debug(
-            "{}:{}:{}:place_roost_and_3_warriors at area#{}".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                                    area.area_index))
+        if TRACER.enabled:
+            self.trace("place_roost_and_3_warriors at area#{}", area.area_index)
 
         self.add_warrior(Faction.EYRIE, area, 3)
         self.build_roost(area)
 
     def build_roost(self, clearing: AreaLogic):
-        building_slot_index = clearing.buildings.index(Building.EMPTY)
-        clearing.buildings[building_slot_index] = Building.ROOST
+        clearing.place_building(Building.ROOST)
         self.eyrie_board_logic.roost_tracker += 1
 
-        LOGGER.debug(
-            "{}:{}:{}:build_roost built {} in clearing #{}".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                                   Building.ROOST, clearing.area_index))
+        if TRACER.enabled:
+            self.trace("build_roost built {} in clearing #{}", Building.ROOST, clearing.area_index)
 
     def eyrie_birdsong_to_daylight(self):  # 20005
         self.sub_phase = 20005
-        LOGGER.debug("{}:{}:{}:eyrie_birdsong_to_daylight".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("eyrie_birdsong_to_daylight")
 
         self.phase = Phase.DAYLIGHT
 
@@ -1547,16 +2127,16 @@ class GameLogic:
         return roost_count
 
     def eyrie_daylight_craft_to_resolve_the_decree(self):
-        LOGGER.debug(
-            "{}:{}:{}:eyrie_daylight_craft_to_resolve_the_decree".format(self.ui_turn_player, self.phase,
-                                                                         self.sub_phase))
+        if TRACER.enabled:
+            self.trace("eyrie_daylight_craft_to_resolve_the_decree")
 
         self.decree_counter = deepcopy(self.eyrie_board_logic.decree)
         self.eyrie_pre_recruit()
 
     def eyrie_pre_recruit(self):  # 20007
         self.sub_phase = 20007
-        LOGGER.debug("{}:{}:{}:eyrie_pre_recruit".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("eyrie_pre_recruit")
 
         self.update_prompt_eyrie_decree(DecreeAction.RECRUIT)
         self.prompt += " Recruit in Area:"
@@ -1574,12 +2154,9 @@ class GameLogic:
         vp_lost = min(self.board.faction_points[Faction.EYRIE],
                       bird_card_in_decree_count)
         self.board.lose_vp(Faction.EYRIE, vp_lost)
-        LOGGER.debug(
-            "{}:{}:{}:turmoil:humiliate: {} bird cards in the decree, lost {} vp(s)".format(self.ui_turn_player,
-                                                                                            self.phase,
-                                                                                            self.sub_phase,
-                                                                                            bird_card_in_decree_count,
-                                                                                            vp_lost))
+        if TRACER.enabled:
+            self.trace("turmoil:humiliate: {} bird cards in the decree, lost {} vp(s)",
+                       bird_card_in_decree_count, vp_lost)
 
     def eyrie_turmoil_purge(self):
         for decree in DecreeAction:
@@ -1588,10 +2165,8 @@ class GameLogic:
                     self.discard_card(self.eyrie_board_logic.decree[decree], card)
 
         self.eyrie_board_logic.reset_decree()
-        LOGGER.debug(
-            "{}:{}:{}:turmoil:purge: discarded all decree cards except loyal viziers".format(self.ui_turn_player,
-                                                                                             self.phase,
-                                                                                             self.sub_phase))
+        if TRACER.enabled:
+            self.trace("turmoil:purge: discarded all decree cards except loyal viziers")
 
     def eyrie_turmoil_depose(self):  # 21001
         self.sub_phase = 21001
@@ -1603,29 +2178,28 @@ class GameLogic:
         if len(inactive_leaders) == 0:
             self.eyrie_board_logic.a_new_generation()
 
-        LOGGER.debug(
-            "{}:{}:{}:turmoil:depose: {} deposed".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                         current_leader))
+        if TRACER.enabled:
+            self.trace("turmoil:depose: {} deposed", current_leader)
         self.prompt = "Select New Eyrie Leader:"
 
     def generate_actions_eyrie_select_new_leader(self, inactive_leaders: list[EyrieLeader]) -> list[Action]:
         actions: list[Action] = []
 
         for leader in inactive_leaders:
-            actions.append(Action("{}".format(leader),
+            actions.append(Action(("{}", leader),
                                   perform(self.eyrie_select_new_leader, leader)))
 
         return actions
 
     def eyrie_select_new_leader(self, leader: EyrieLeader):
         self.eyrie_board_logic.activate_leader(leader)
-        LOGGER.debug(
-            "{}:{}:{}:turmoil:depose: {} selected as new leader".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                                        leader))
+        if TRACER.enabled:
+            self.trace("turmoil:depose: {} selected as new leader", leader)
         self.eyrie_turmoil_rest()
 
     def eyrie_turmoil_rest(self):
-        LOGGER.debug("{}:{}:{}:turmoil:rest".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("turmoil:rest")
         self.phase = Phase.EVENING
         self.eyrie_evening()
 
@@ -1649,7 +2223,7 @@ class GameLogic:
 
         for area in self.board.areas:
             if Building.ROOST in area.buildings and (can_recruit[Suit.BIRD] or can_recruit[area.suit]):
-                actions.append(Action("Recruit in area {}".format(area.area_index), perform(self.eyrie_recruit, area)))
+                actions.append(Action(("Recruit in area {}", area.area_index), perform(self.eyrie_recruit, area)))
 
         if len(actions) == 0:
             if len(self.decree_counter[decree_action]) > 0:
@@ -1665,31 +2239,29 @@ class GameLogic:
         # remove decree counter
         self.remove_decree_counter(decree_action, area.suit)
 
-        LOGGER.debug(
-            "{}:{}:{}:{} recruited in area {}".format(self.ui_turn_player, self.phase, self.sub_phase, Faction.EYRIE,
-                                                      area.area_index))
+        if TRACER.enabled:
+            self.trace("{} recruited in area {}", Faction.EYRIE, area.area_index)
 
         self.eyrie_pre_recruit()
 
     def eyrie_pre_move(self):  # 20008
         self.sub_phase = 20008
 
-        LOGGER.debug("{}:{}:{}:eyrie_pre_move".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("eyrie_pre_move")
         self.update_prompt_eyrie_decree(DecreeAction.MOVE)
         self.prompt += " Choose area to move from."
 
-    def generate_actions_agent_eyrie_move(self) -> list[Action]:
+    def generate_action_groups_agent_eyrie_move(self) -> list[ActionGroup]:
         decree_action = DecreeAction.MOVE
-        faction = Faction.EYRIE
-        actions: list[Action] = self.generate_actions_agent_move(faction)
+        groups: list[ActionGroup] = self.generate_action_groups_move(Faction.EYRIE, True, self.eyrie_resolve_move)
 
-        if len(actions) == 0:
+        if sum(group.count for group in groups) == 0:
             if len(self.decree_counter[decree_action]) > 0:
-                actions.append(Action("Turmoil", self.eyrie_turmoil))
-            else:
-                actions.append(Action("Next, To BATTLE", self.eyrie_pre_battle))
+                return [ActionGroup.of([Action("Turmoil", self.eyrie_turmoil)])]
+            return [ActionGroup.of([Action("Next, To BATTLE", self.eyrie_pre_battle)])]
 
-        return actions
+        return groups
 
     def generate_actions_eyrie_move(self) -> list[Action]:
         actions: list[Action] = self.generate_actions_select_src_clearing(Faction.EYRIE, self.eyrie_resolve_move, True)
@@ -1712,7 +2284,8 @@ class GameLogic:
     def eyrie_pre_battle(self):  # 20009
         self.sub_phase = 20009
 
-        LOGGER.debug("{}:{}:{}:eyrie_pre_battle".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("eyrie_pre_battle")
         self.update_prompt_eyrie_decree(DecreeAction.BATTLE)
         self.prompt += " Choose area to battle in."
 
@@ -1755,7 +2328,8 @@ class GameLogic:
     def eyrie_pre_build(self):  # 20010
         self.sub_phase = 20010
 
-        LOGGER.debug("{}:{}:{}:eyrie_pre_build".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("eyrie_pre_build")
         self.update_prompt_eyrie_decree(DecreeAction.BUILD)
 
         self.ui_turn_player = Faction.EYRIE
@@ -1790,11 +2364,8 @@ class GameLogic:
         vp = EyrieBoardLogic.ROOST_REWARD_VP[roost_tracker]
         card_to_draw = 1 + EyrieBoardLogic.ROOST_REWARD_CARD[roost_tracker]
         self.gain_vp(Faction.EYRIE, vp)
-        LOGGER.debug(
-            "{}:{}:{}:eyrie_evening: roost tracker {}, scored {} vps".format(self.ui_turn_player, self.phase,
-                                                                             self.sub_phase,
-                                                                             self.eyrie_board_logic.roost_tracker,
-                                                                             vp))
+        if TRACER.enabled:
+            self.trace("eyrie_evening: roost tracker {}, scored {} vps", self.eyrie_board_logic.roost_tracker, vp)
         self.take_card_from_draw_pile(Faction.EYRIE, card_to_draw)
         self.eyrie_evening_discard()
 
@@ -1810,7 +2381,8 @@ class GameLogic:
 
     def eyrie_evening_to_marquise(self):  # 21003
         self.sub_phase = 21003
-        LOGGER.debug("{}:{}:{}:eyrie_evening_to_marquise".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("eyrie_evening_to_marquise")
         self.ui_turn_player = Faction.MARQUISE
         self.turn_player = Faction.MARQUISE
         self.phase = Phase.BIRDSONG
@@ -1819,7 +2391,8 @@ class GameLogic:
     def get_decree_card_to_use(self, decree_action: DecreeAction, suit: Suit) -> Card:
         eligible_cards = [card for card in self.decree_counter[decree_action] if card.suit == suit]
         bird_cards = [card for card in self.decree_counter[decree_action] if card.suit == Suit.BIRD]
-        LOGGER.debug("after {} {}".format(len(eligible_cards), len(bird_cards)))
+        if TRACER.enabled:
+            TRACER.emit("after {} {}", len(eligible_cards), len(bird_cards))
         if len(eligible_cards) > 0:
             return eligible_cards[0]
         else:
@@ -1830,13 +2403,11 @@ class GameLogic:
 
     def activate_leader(self, leader: EyrieLeader):
         if self.eyrie_board_logic.activate_leader(leader):
-            LOGGER.debug(
-                "{}:{}:{}:{} selected as new leader".format(self.ui_turn_player, self.phase, self.sub_phase, leader))
+            if TRACER.enabled:
+                self.trace("{} selected as new leader", leader)
 
     def remove_decree_counter(self, decree_action: DecreeAction | str, suit: Suit | str):
-        self.decree_counter[decree_action].remove(
-            self.get_decree_card_to_use(decree_action, suit)
-        )
+        self.journaled_remove(self.decree_counter[decree_action], self.get_decree_card_to_use(decree_action, suit))
 
     #####
     # Neutral
@@ -1857,20 +2428,21 @@ class GameLogic:
 
         if faction == Faction.MARQUISE:
             for card in craftable_cards:
-                actions.append(Action('{} ({})'.format(card.name, card.suit), perform(self.craft_card, faction, card)))
+                actions.append(Action(('{} ({})', card.name, card.suit), perform(self.craft_card, faction, card)))
         elif faction == Faction.EYRIE:
             for card in craftable_cards:
-                actions.append(Action('{} ({})'.format(card.name, card.suit), perform(self.craft_card, faction, card)))
+                actions.append(Action(('{} ({})', card.name, card.suit), perform(self.craft_card, faction, card)))
 
         return actions
 
     def craft_card(self, faction: Faction, card: Card):
-        LOGGER.debug("{}:{}:{}:Crafted {} card".format(self.ui_turn_player, self.phase, self.sub_phase, card.name))
+        if TRACER.enabled:
+            self.trace("Crafted {} card", card.name)
         if faction == Faction.MARQUISE:
             if card.phase == CardPhase.IMMEDIATE:
                 self.gain_vp(faction, card.reward_vp)
                 if card.reward_item is not None:
-                    self.marquise_board_logic.items[card.reward_item] += 1
+                    self.journaled_add(self.marquise_board_logic.items, card.reward_item, 1)
                     self.board.remove_item_from_board(card.reward_item)
                 elif card.name == CardName.FAVOR_OF_THE_FOXES:
                     self.favor_card(faction, Suit.FOX)
@@ -1880,8 +2452,8 @@ class GameLogic:
                     self.favor_card(faction, Suit.RABBIT)
                 self.discard_card(self.marquise_board_logic.cards_in_hand, card)
             else:
-                self.marquise_board_logic.cards_in_hand.remove(card)
-                self.marquise_board_logic.crafted_cards.append(card)
+                self.journaled_remove(self.marquise_board_logic.cards_in_hand, card)
+                self.journaled_append(self.marquise_board_logic.crafted_cards, card)
 
             for suit in card.craft_requirement.keys():
                 self.marquise_board_logic.spend_crafting_piece(suit, card.craft_requirement[suit])
@@ -1900,7 +2472,7 @@ class GameLogic:
 
                 # Gain Item
                 if card.reward_item is not None:
-                    self.eyrie_board_logic.items[card.reward_item] += 1
+                    self.journaled_add(self.eyrie_board_logic.items, card.reward_item, 1)
                     self.board.remove_item_from_board(card.reward_item)
                 elif card.name == CardName.FAVOR_OF_THE_FOXES:
                     self.favor_card(faction, Suit.FOX)
@@ -1911,8 +2483,8 @@ class GameLogic:
 
                 self.discard_card(self.eyrie_board_logic.cards_in_hand, card)
             else:
-                self.eyrie_board_logic.cards_in_hand.remove(card)
-                self.eyrie_board_logic.crafted_cards.append(card)
+                self.journaled_remove(self.eyrie_board_logic.cards_in_hand, card)
+                self.journaled_append(self.eyrie_board_logic.crafted_cards, card)
 
             for suit in card.craft_requirement.keys():
                 self.marquise_board_logic.spend_crafting_piece(suit, card.craft_requirement[suit])
@@ -1965,53 +2537,52 @@ class GameLogic:
             faction_board = self.eyrie_board_logic
 
         if self.can_take_card_from_draw_pile(amount):
-            faction_board.cards_in_hand.extend(self.draw_pile[0:amount])
+            self.journaled_extend(faction_board.cards_in_hand, self.draw_pile[0:amount])
             self.draw_pile = self.draw_pile[amount:]
-            LOGGER.debug(
-                "{}:{}:{}:{} drawn {} card(s)".format(self.ui_turn_player, self.phase, self.sub_phase, faction, amount))
+            if TRACER.enabled:
+                self.trace("{} drawn {} card(s)", faction, amount)
         else:
             lesser_amount = min(len(self.draw_pile), amount)
-            faction_board.cards_in_hand.extend(self.draw_pile[0:lesser_amount])
+            self.journaled_extend(faction_board.cards_in_hand, self.draw_pile[0:lesser_amount])
             self.draw_pile = self.draw_pile[lesser_amount:]
-            LOGGER.debug(
-                "{}:{}:{}:{} drawn {} card(s)".format(self.ui_turn_player, self.phase, self.sub_phase, faction,
-                                                      lesser_amount))
+            if TRACER.enabled:
+                self.trace("{} drawn {} card(s)", faction, lesser_amount)
 
             self.shuffle_discard_pile_into_draw_pile()
 
             remaining_amount = amount - lesser_amount
-            faction_board.cards_in_hand.extend(self.draw_pile[0:remaining_amount])
+            self.journaled_extend(faction_board.cards_in_hand, self.draw_pile[0:remaining_amount])
             self.draw_pile = self.draw_pile[remaining_amount:]
-            LOGGER.debug(
-                "{}:{}:{}:{} drawn {} card(s)".format(self.ui_turn_player, self.phase, self.sub_phase, faction,
-                                                      remaining_amount))
+            if TRACER.enabled:
+                self.trace("{} drawn {} card(s)", faction, remaining_amount)
 
     def shuffle_discard_pile_into_draw_pile(self):
-        self.draw_pile.extend(self.discard_pile)
+        self.journaled_extend(self.draw_pile, self.discard_pile)
         self.discard_pile = []
         self.shuffle_draw_pile()
 
     def discard_card(self, discard_from: list[Card], card: Card):
-        discard_from.remove(card)
+        self.journaled_remove(discard_from, card)
         if card.name in Card.DOMINANCE_CARD_NAMES:
-            self.discard_pile_dominance.append(card)
+            self.journaled_append(self.discard_pile_dominance, card)
         else:
-            self.discard_pile.append(card)
+            self.journaled_append(self.discard_pile, card)
 
-    def generate_actions_agent_move(self, faction: Faction) -> list[Action]:
-        actions: list[Action] = []
+    def generate_action_groups_move(self, faction: Faction, decree: bool, cont_func) -> list[ActionGroup]:
+        """
+        One group per <source, destination> pair, its i-th action moves i + 1 warriors.
+        """
+        groups: list[ActionGroup] = []
 
-        can_move_from_clearing = self.find_available_source_clearings(faction, decree=(faction == Faction.EYRIE))
+        can_move_from_clearing = self.find_available_source_clearings(faction, decree)
         for src in can_move_from_clearing:
+            warrior_count = src.warrior_count[faction_to_warrior(faction)]
             dests = self.find_available_destination_clearings(faction, src)
             for dest in dests:
-                for num_of_warriors in range(1, src.warrior_count[faction_to_warrior(faction)] + 1):
-                    actions.append(Action("Move {} warriors from {} to {}".format(
-                        num_of_warriors, src.area_index, dest.area_index),
-                        perform(self.move_warriors,
-                                faction, src, dest,
-                                num_of_warriors, self.eyrie_resolve_move)))
-        return actions
+                groups.append(ActionGroup(warrior_count, lambda i, src=src, dest=dest: Action(
+                    ("Move {} warriors from {} to {}", i + 1, src.area_index, dest.area_index),
+                    perform(self.move_warriors, faction, src, dest, i + 1, cont_func))))
+        return groups
 
     def generate_actions_agent_move_with_cont_func(self, faction: Faction, cont_func) -> list[Action]:
         actions: list[Action] = []
@@ -2022,7 +2593,7 @@ class GameLogic:
             dests = self.find_available_destination_clearings(faction, src)
             for dest in dests:
                 for num_of_warriors in range(1, src.warrior_count[faction_to_warrior(faction)] + 1):
-                    actions.append(Action("Move {} warriors from {} to {}".format(
+                    actions.append(Action(("Move {} warriors from {} to {}", 
                         num_of_warriors, src.area_index, dest.area_index),
                         perform(self.move_warriors,
                                 faction, src, dest,
@@ -2040,7 +2611,7 @@ class GameLogic:
 
         for clearing in can_move_from_clearing:
             actions.append(
-                Action("{}".format(clearing),
+                Action(("{}", clearing),
                        perform(self.select_clearing_dest_move, faction, clearing, continuation_func)))
 
         return actions
@@ -2056,7 +2627,7 @@ class GameLogic:
 
         for dest in dests:
             actions.append(
-                Action("{}".format(dest),
+                Action(("{}", dest),
                        perform(self.select_warriors, faction, src, dest, continuation_func)))
 
         return actions
@@ -2071,17 +2642,14 @@ class GameLogic:
         actions = []
 
         for num_of_warriors in range(1, src.warrior_count[faction_to_warrior(faction)] + 1):
-            actions.append(Action("{}".format(num_of_warriors),
+            actions.append(Action(("{}", num_of_warriors),
                                   perform(self.move_warriors, faction, src, dest, num_of_warriors, continuation_func)))
 
         return actions
 
     def move_warriors(self, faction, src: AreaLogic, dest: AreaLogic, num, continuation_func):
-        LOGGER.debug(
-            "{}:{}:{}:{} move {} warrior(s) from Clearing #{} to Clearing #{}".format(self.ui_turn_player, self.phase,
-                                                                                      self.sub_phase, faction,
-                                                                                      num, src,
-                                                                                      dest))
+        if TRACER.enabled:
+            self.trace("{} move {} warrior(s) from Clearing #{} to Clearing #{}", faction, num, src, dest)
         self.selected_clearing = src
         src.remove_warrior(faction_to_warrior(faction), num)
         dest.add_warrior(faction_to_warrior(faction), num)
@@ -2149,10 +2717,8 @@ class GameLogic:
                 total_recruiters = area.buildings.count(Building.RECRUITER)
                 if total_recruiters > 0:
                     self.add_warrior(faction, area, min(total_recruiters, self.marquise_board_logic.reserved_warriors))
-                    LOGGER.debug(
-                        "{}:{}:{}:MARQUISE adds warrior in clearing #{}".format(self.ui_turn_player, self.phase,
-                                                                                self.sub_phase,
-                                                                                area.area_index))
+                    if TRACER.enabled:
+                        self.trace("MARQUISE adds warrior in clearing #{}", area.area_index)
         elif faction == Faction.EYRIE:
             amount = 1
             if self.eyrie_board_logic.get_active_leader() == EyrieLeader.CHARISMATIC:
@@ -2167,13 +2733,13 @@ class GameLogic:
         if faction == Faction.MARQUISE:
             for clearing in buildable_clearings:
                 actions.append(
-                    Action("{}".format(clearing),
+                    Action(("{}", clearing),
                            perform(self.marquise_daylight_build_select_building, clearing)))
 
         elif faction == Faction.EYRIE:
             for clearing in buildable_clearings:
                 actions.append(
-                    Action("{}".format(clearing),
+                    Action(("{}", clearing),
                            perform(self.eyrie_build, clearing)))
 
         return actions
@@ -2185,7 +2751,7 @@ class GameLogic:
         if faction == Faction.MARQUISE:
             for building in buildings:
                 actions.append(
-                    Action("{}".format(building),
+                    Action(("{}", building),
                            perform(self.build, faction, clearing, building)))
         elif faction == Faction.EYRIE:
             pass
@@ -2194,17 +2760,15 @@ class GameLogic:
 
     def build(self, faction, clearing: AreaLogic, building):
         if faction == Faction.MARQUISE:
-            ind = clearing.buildings.index(Building.EMPTY)
-            clearing.buildings[ind] = building
+            clearing.place_building(building)
 
             self.gain_vp(Faction.MARQUISE, self.marquise_board_logic.get_reward(building))
             wood_cost = self.marquise_board_logic.build_action_update(building)
 
             self.remove_wood(wood_cost, self.count_woods_from_clearing(clearing)[0])
 
-            LOGGER.debug(
-                "{}:{}:{}:MARQUISE builds {} in clearing #{}".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                                     building, clearing.area_index))
+            if TRACER.enabled:
+                self.trace("MARQUISE builds {} in clearing #{}", building, clearing.area_index)
             self.prompt = "The {} has been build at clearing #{}.".format(building, clearing.area_index)
             self.marquise_action_count -= 1
             self.set_actions([Action('Next', perform(self.marquise_daylight_2))])
@@ -2264,7 +2828,6 @@ class GameLogic:
 
     def generate_actions_agent_battle(self, attacker, continuation_func, decree) -> list[Action]:
         clearings = self.get_battlable_clearing(attacker, decree)
-        self.ignore_decree = False
 
         actions: list[Action] = []
         for clearing in clearings:
@@ -2272,7 +2835,7 @@ class GameLogic:
 
             for enemy_faction in enemy_factions:
                 actions.append(
-                    Action("Attack {} in area {}".format(enemy_faction, clearing.area_index),
+                    Action(("Attack {} in area {}", enemy_faction, clearing.area_index),
                            perform(self.initiate_battle, attacker, enemy_faction, clearing, continuation_func)))
 
         return actions
@@ -2288,7 +2851,7 @@ class GameLogic:
 
         for clearing in clearings:
             actions.append(
-                Action("{}".format(clearing),
+                Action(("{}", clearing),
                        perform(self.select_enemy_faction_battle, attacker, clearing, continuation_func)))
 
         return actions
@@ -2305,7 +2868,7 @@ class GameLogic:
 
         for enemy_faction in enemy_factions:
             actions.append(
-                Action("{}".format(enemy_faction),
+                Action(("{}", enemy_faction),
                        perform(self.initiate_battle, faction, enemy_faction, clearing, continuation_func)))
 
         return actions
@@ -2387,10 +2950,8 @@ class GameLogic:
         self.attacking_clearing = clearing
         self.continuation_func = continuation_func
 
-        LOGGER.debug(
-            "{}:{}:{}:battle:{} initiate battle on {} in clearing #{}".format(self.ui_turn_player, self.phase,
-                                                                              self.sub_phase,
-                                                                              attacker, defender, clearing.area_index))
+        if TRACER.enabled:
+            self.trace("battle:{} initiate battle on {} in clearing #{}", attacker, defender, clearing.area_index)
         attacker_board = self.faction_to_faction_board(attacker)
         defender_board = self.faction_to_faction_board(defender)
         atk_scouting_party = [card for card in attacker_board.crafted_cards if
@@ -2414,7 +2975,7 @@ class GameLogic:
                       card.name == CardName.AMBUSH and (
                               card.suit == Suit.BIRD or card.suit == self.attacking_clearing.suit)]
         for card in def_ambush:
-            def_ambush_actions.append(Action('Discard {} ({})'.format(card.name, card.suit),
+            def_ambush_actions.append(Action(('Discard {} ({})', card.name, card.suit),
                                              perform(self.attacker_use_ambush, card)))
 
         self.set_actions(
@@ -2422,8 +2983,8 @@ class GameLogic:
                 Action('Skip', perform(self.roll_dice))])
 
     def attacker_use_ambush(self, ambush_discarded):  # 40002
-        LOGGER.debug(
-            "{}:{}:{}:battle:{} discard AMBUSH".format(self.ui_turn_player, self.phase, self.sub_phase, self.defender))
+        if TRACER.enabled:
+            self.trace("battle:{} discard AMBUSH", self.defender)
         defender_board = self.faction_to_faction_board(self.defender)
         self.discard_card(defender_board.cards_in_hand, ambush_discarded)
 
@@ -2441,7 +3002,7 @@ class GameLogic:
             self.sub_phase = 40002
             atk_ambush_actions = []
             for card in atk_ambush:
-                atk_ambush_actions.append(Action('Discard {} ({})'.format(card.name, card.suit),
+                atk_ambush_actions.append(Action(('Discard {} ({})', card.name, card.suit),
                                                  perform(self.foil_ambush, card)))
             self.set_actions(
                 atk_ambush_actions
@@ -2450,8 +3011,8 @@ class GameLogic:
             )
 
     def foil_ambush(self, ambush_discarded):
-        LOGGER.debug(
-            "{}:{}:{}:battle:{} discard AMBUSH".format(self.ui_turn_player, self.phase, self.sub_phase, self.attacker))
+        if TRACER.enabled:
+            self.trace("battle:{} discard AMBUSH", self.attacker)
         self.defender_extra_hits -= 2
         attacker_board = self.faction_to_faction_board(self.attacker)
         self.discard_card(attacker_board.cards_in_hand, ambush_discarded)
@@ -2465,7 +3026,7 @@ class GameLogic:
         if self.attacking_clearing.warrior_count[faction_to_warrior(self.attacker)] == 0:
             self.continuation_func()
         else:
-            dices: list[int] = [randint(0, 3), randint(0, 3)]
+            dices: list[int] = [self.rng.randint(0, 3), self.rng.randint(0, 3)]
             self.attacker_roll = max(dices)
             self.defender_roll = min(dices)
 
@@ -2477,10 +3038,9 @@ class GameLogic:
                                         + self.defender_defenseless_extra_hits)
             self.defender_extra_hits = 0
 
-            LOGGER.debug(
-                "{}:{}:{}:battle:{} rolls {}, {} rolls {}".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                                  self.attacker, self.attacker_roll, self.defender,
-                                                                  self.defender_roll))
+            if TRACER.enabled:
+                self.trace("battle:{} rolls {}, {} rolls {}",
+                           self.attacker, self.attacker_roll, self.defender, self.defender_roll)
 
     def set_dice_values(self, attacker_dice, defender_dice):
         self.prompt = "The dices has been rolled."
@@ -2490,26 +3050,18 @@ class GameLogic:
 
         self.attacker_roll = attacker_dice
         self.defender_roll = defender_dice
+        self.state_changed()
 
-        LOGGER.debug(
-            "{}:{}:{}:battle:set_dice_values:{} rolls {}, {} rolls {}".format(self.ui_turn_player, self.phase,
-                                                                              self.sub_phase,
-                                                                              self.attacker, self.attacker_roll,
-                                                                              self.defender,
-                                                                              self.defender_roll))
+        if TRACER.enabled:
+            self.trace("battle:set_dice_values:{} rolls {}, {} rolls {}",
+                       self.attacker, self.attacker_roll, self.defender, self.defender_roll)
 
     def attacker_activate_battle_ability_card(self):  # 40003
-        LOGGER.debug(
-            "{}:{}:{}:battle: Total hits: {}: ({}+{}) hits, {}: ({}+{}) hits".format(self.ui_turn_player, self.phase,
-                                                                                     self.sub_phase,
-                                                                                     self.attacker,
-                                                                                     self.attacker_roll + self.attacker_extra_hits,
-                                                                                     self.attacker_roll,
-                                                                                     self.attacker_extra_hits,
-                                                                                     self.defender,
-                                                                                     self.defender_roll + self.defender_extra_hits,
-                                                                                     self.defender_roll,
-                                                                                     self.defender_extra_hits))
+        if TRACER.enabled:
+            self.trace("battle: Total hits: {}: ({}+{}) hits, {}: ({}+{}) hits",
+                       self.attacker, self.attacker_roll + self.attacker_extra_hits, self.attacker_roll,
+                       self.attacker_extra_hits, self.defender, self.defender_roll + self.defender_extra_hits,
+                       self.defender_roll, self.defender_extra_hits)
 
         attacker_faction_board = self.faction_to_faction_board(self.attacker)
 
@@ -2521,12 +3073,12 @@ class GameLogic:
 
         if len(atk_brutal_tactics) > 0 and attacker_faction_board.activated_card.count(atk_brutal_tactics[0]) < 1:
             brutal_tactics_card = atk_brutal_tactics[0]
-            atk_actions.append(Action('Use {} ({})'.format(brutal_tactics_card.name, brutal_tactics_card.suit),
+            atk_actions.append(Action(('Use {} ({})', brutal_tactics_card.name, brutal_tactics_card.suit),
                                       perform(self.brutal_tactics, brutal_tactics_card)))
 
         if len(atk_armorers) > 0 and attacker_faction_board.activated_card.count(atk_armorers[0]) < 1:
             armorers_card = atk_armorers[0]
-            atk_actions.append(Action('Use {} ({})'.format(armorers_card.name, armorers_card.suit),
+            atk_actions.append(Action(('Use {} ({})', armorers_card.name, armorers_card.suit),
                                       perform(self.armorers, self.attacker, armorers_card)))
 
         if len(atk_actions) > 0:
@@ -2539,17 +3091,11 @@ class GameLogic:
             self.defender_activate_battle_ability_card()
 
     def defender_activate_battle_ability_card(self):  # 40004
-        LOGGER.debug(
-            "{}:{}:{}:battle: Total hits: {}: ({}+{}) hits, {}: ({}+{}) hits".format(self.ui_turn_player, self.phase,
-                                                                                     self.sub_phase,
-                                                                                     self.attacker,
-                                                                                     self.attacker_roll + self.attacker_extra_hits,
-                                                                                     self.attacker_roll,
-                                                                                     self.attacker_extra_hits,
-                                                                                     self.defender,
-                                                                                     self.defender_roll + self.defender_extra_hits,
-                                                                                     self.defender_roll,
-                                                                                     self.defender_extra_hits))
+        if TRACER.enabled:
+            self.trace("battle: Total hits: {}: ({}+{}) hits, {}: ({}+{}) hits",
+                       self.attacker, self.attacker_roll + self.attacker_extra_hits, self.attacker_roll,
+                       self.attacker_extra_hits, self.defender, self.defender_roll + self.defender_extra_hits,
+                       self.defender_roll, self.defender_extra_hits)
 
         defender_faction_board = self.faction_to_faction_board(self.defender)
 
@@ -2560,12 +3106,12 @@ class GameLogic:
 
         if len(def_sappers) > 0 and defender_faction_board.activated_card.count(def_sappers[0]) < 1:
             sappers_card = def_sappers[0]
-            def_actions.append(Action('Use {} ({})'.format(sappers_card.name, sappers_card.suit),
+            def_actions.append(Action(('Use {} ({})', sappers_card.name, sappers_card.suit),
                                       perform(self.sappers, sappers_card)))
 
         if len(def_armorers) > 0 and defender_faction_board.activated_card.count(def_armorers[0]) < 1:
             armorers_card = def_armorers[0]
-            def_actions.append(Action('Use {} ({})'.format(armorers_card.name, armorers_card.suit),
+            def_actions.append(Action(('Use {} ({})', armorers_card.name, armorers_card.suit),
                                       perform(self.armorers, self.defender, armorers_card)))
 
         if len(def_actions) > 0:
@@ -2578,22 +3124,20 @@ class GameLogic:
             self.resolve_hits()
 
     def brutal_tactics(self, brutal_tactics_card):
-        LOGGER.debug(
-            "{}:{}:{}:battle:{} use BRUTAL TACTICS".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                           self.attacker))
+        if TRACER.enabled:
+            self.trace("battle:{} use BRUTAL TACTICS", self.attacker)
         attacker_faction_board = self.faction_to_faction_board(self.attacker)
-        attacker_faction_board.activated_card.append(brutal_tactics_card)
+        self.journaled_append(attacker_faction_board.activated_card, brutal_tactics_card)
         self.gain_vp(self.defender, 1)
         self.attacker_extra_hits += 1
         self.attacker_activate_battle_ability_card()
 
     def armorers(self, faction, armorers_card):
-        LOGGER.debug(
-            "{}:{}:{}:battle:{} discard ARMORERS".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                         faction))
+        if TRACER.enabled:
+            self.trace("battle:{} discard ARMORERS", faction)
 
         faction_board = self.faction_to_faction_board(faction)
-        faction_board.activated_card.append(armorers_card)
+        self.journaled_append(faction_board.activated_card, armorers_card)
         self.discard_card(faction_board.crafted_cards, armorers_card)
 
         if faction == self.attacker:
@@ -2604,12 +3148,11 @@ class GameLogic:
             self.defender_activate_battle_ability_card()
 
     def sappers(self, sappers_card):
-        LOGGER.debug(
-            "{}:{}:{}:battle:{} discard BRUTAL TACTICS".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                               self.defender))
+        if TRACER.enabled:
+            self.trace("battle:{} discard BRUTAL TACTICS", self.defender)
 
         defender_faction_board = self.faction_to_faction_board(self.defender)
-        defender_faction_board.activated_card.append(sappers_card)
+        self.journaled_append(defender_faction_board.activated_card, sappers_card)
         self.discard_card(defender_faction_board.crafted_cards, sappers_card)
         self.defender_extra_hits += 1
         self.defender_activate_battle_ability_card()
@@ -2648,14 +3191,10 @@ class GameLogic:
         self.gain_vp(self.attacker, attacker_total_vp)
         self.gain_vp(self.defender, defender_total_vp)
 
-        LOGGER.debug(
-            "{}:{}:{}:battle: {} vs {}, total hits {}:{}, vps gained {}:{}".format(self.ui_turn_player, self.phase,
-                                                                                   self.sub_phase,
-                                                                                   self.attacker, self.defender,
-                                                                                   attacker_total_hits,
-                                                                                   defender_total_hits,
-                                                                                   attacker_total_vp, defender_total_vp)
-        )
+        if TRACER.enabled:
+            self.trace("battle: {} vs {}, total hits {}:{}, vps gained {}:{}",
+                       self.attacker, self.defender, attacker_total_hits, defender_total_hits, attacker_total_vp,
+                       defender_total_vp)
 
         if self.attacker == Faction.MARQUISE and removed_attacker_warriors > 0 and self.marquise_field_hospital_check(
                 self.attacking_clearing):
@@ -2690,17 +3229,14 @@ class GameLogic:
 
         for card in discardable_cards:
             actions.append(
-                Action("{} ({})".format(card.name, card.suit),
+                Action(("{} ({})", card.name, card.suit),
                        perform(self.marquise_field_hospital, card)))
 
         return actions
 
     def marquise_field_hospital(self, card):
-        LOGGER.debug(
-            "{}:{}:{}:battle:{} use field hospital, discarding {} ({})".format(self.ui_turn_player, self.phase,
-                                                                               self.sub_phase,
-                                                                               Faction.MARQUISE,
-                                                                               card.name, card.suit))
+        if TRACER.enabled:
+            self.trace("battle:{} use field hospital, discarding {} ({})", Faction.MARQUISE, card.name, card.suit)
 
         self.discard_card(self.marquise_board_logic.cards_in_hand, card)
         for clearing in self.board.areas:
@@ -2711,13 +3247,9 @@ class GameLogic:
         self.resolve_remaining_hits()
 
     def resolve_remaining_hits(self):
-        LOGGER.debug(
-            "{}:{}:{}:battle: {} vs {}, remaining hits {}:{}".format(self.ui_turn_player, self.phase,
-                                                                     self.sub_phase,
-                                                                     self.attacker, self.defender,
-                                                                     self.attacker_remaining_hits,
-                                                                     self.defender_remaining_hits)
-        )
+        if TRACER.enabled:
+            self.trace("battle: {} vs {}, remaining hits {}:{}",
+                       self.attacker, self.defender, self.attacker_remaining_hits, self.defender_remaining_hits)
         if self.attacker_remaining_hits == 0 and self.defender_remaining_hits == 0:
             if self.redirect_func is not None:
                 self.redirect_func()
@@ -2778,7 +3310,7 @@ class GameLogic:
     def remove_piece(self, piece):
         if isinstance(piece, Building):
             if self.selecting_piece_to_remove_faction == Faction.MARQUISE:
-                self.marquise_board_logic.building_trackers[piece] -= 1
+                self.journaled_add(self.marquise_board_logic.building_trackers, piece, -1)
             elif self.selecting_piece_to_remove_faction == Faction.EYRIE:
                 self.eyrie_board_logic.roost_tracker -= 1
             self.attacking_clearing.remove_building(piece)
@@ -2786,16 +3318,14 @@ class GameLogic:
             self.attacking_clearing.remove_token(piece)
 
         if self.selecting_piece_to_remove_faction == self.attacker:
-            LOGGER.debug(
-                "{}:{}:{}:battle:{} remove {}'s {}".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                           self.defender, self.attacker, piece))
+            if TRACER.enabled:
+                self.trace("battle:{} remove {}'s {}", self.defender, self.attacker, piece)
             self.gain_vp(self.defender, 1)
             self.defender_remaining_hits -= 1
             self.resolve_remaining_hits()
         else:
-            LOGGER.debug(
-                "{}:{}:{}:battle:{} remove {}'s {}".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                           self.attacker, self.defender, piece))
+            if TRACER.enabled:
+                self.trace("battle:{} remove {}'s {}", self.attacker, self.defender, piece)
             self.gain_vp(self.attacker, 1)
             self.attacker_remaining_hits -= 1
             self.resolve_remaining_hits()
@@ -2819,16 +3349,15 @@ class GameLogic:
         actions = []
 
         for card in faction_board.cards_in_hand:
-            actions.append(Action('Discard {} ({})'.format(card.name, card.suit),
+            actions.append(Action(('Discard {} ({})', card.name, card.suit),
                                   perform(self.select_card_to_discard, faction, card)))
 
         return actions
 
     def select_card_to_discard(self, faction: Faction, card: Card):  # 10017
         faction_board = self.faction_to_faction_board(faction)
-        LOGGER.debug(
-            "{}:{}:{}:{}:{} ({}) discarded".format(self.ui_turn_player, self.phase, self.sub_phase, faction,
-                                                   card.name, card.suit))
+        if TRACER.enabled:
+            self.trace("{}:{} ({}) discarded", faction, card.name, card.suit)
         self.discard_card(faction_board.cards_in_hand, card)
         card_in_hand_count = len(faction_board.cards_in_hand)
         if card_in_hand_count > 5:
@@ -2856,22 +3385,20 @@ class GameLogic:
         for card in faction_board.cards_in_hand:
             if card.name not in Card.DOMINANCE_CARD_NAMES:
                 continue
-            actions.append(Action("Activate {}".format(card.name),
+            actions.append(Action(("Activate {}", card.name),
                                   perform(self.activate_dominance_card, faction, card, perform(continuation_func))))
 
         return actions
 
     def activate_dominance_card(self, faction: Faction, card: Card, continuation_func: any):
-        if config['game']['allow-dominance-card']:
-            LOGGER.debug(
-                "{}:{}:{}:{}:activate_dominance_card {} ".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                                 faction,
-                                                                 card.name))
+        if self.game_config['allow-dominance-card']:
+            if TRACER.enabled:
+                self.trace("{}:activate_dominance_card {} ", faction, card.name)
 
             faction_board = self.faction_to_faction_board(faction)
 
             faction_board.dominance_card = card
-            faction_board.cards_in_hand.remove(card)
+            self.journaled_remove(faction_board.cards_in_hand, card)
 
         continuation_func()
 
@@ -2885,7 +3412,7 @@ class GameLogic:
         for card in faction_board.cards_in_hand:
             for dominance_card in self.discard_pile_dominance:
                 if dominance_card.suit == card.suit:
-                    actions.append(Action("Take {} by spending {}".format(dominance_card.name, card.name),
+                    actions.append(Action(("Take {} by spending {}", dominance_card.name, card.name),
                                           perform(self.take_dominance_card, faction, dominance_card, card,
                                                   perform(continuation_func))))
 
@@ -2893,17 +3420,15 @@ class GameLogic:
 
     def take_dominance_card(self, faction: Faction, dominance_card: Card, card_to_spend: Card,
                             continuation_func: any):
-        LOGGER.debug(
-            "{}:{}:{}:{}:take_dominance_card {} by spending {}".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                                       faction,
-                                                                       dominance_card.name, card_to_spend.name))
+        if TRACER.enabled:
+            self.trace("{}:take_dominance_card {} by spending {}", faction, dominance_card.name, card_to_spend.name)
 
         faction_board = self.faction_to_faction_board(faction)
 
         self.discard_card(faction_board.cards_in_hand, card_to_spend)
 
-        faction_board.cards_in_hand.append(dominance_card)
-        self.discard_pile_dominance.remove(dominance_card)
+        self.journaled_append(faction_board.cards_in_hand, dominance_card)
+        self.journaled_remove(self.discard_pile_dominance, dominance_card)
 
         continuation_func()
 
@@ -2915,30 +3440,30 @@ class GameLogic:
             if faction_board.activated_card.count(card) > 0:
                 continue
             if card.name == CardName.ROYAL_CLAIM:
-                actions.append(Action('Discard {}'.format(card.name),
+                actions.append(Action(('Discard {}', card.name),
                                       perform(self.royal_claim, faction, card)))
             if card.name == CardName.STAND_AND_DELIVER and self.stand_and_deliver_check(faction):
                 actions.append(
-                    Action('Use {} effect'.format(card.name),
+                    Action(('Use {} effect', card.name),
                            perform(self.stand_and_deliver_select_faction, faction, card)))
         return actions
 
-    def generate_actions_agent_cards_birdsong(self, faction, continuation_func):
-        self.cards_birdsong_continuation_func = continuation_func
+    def generate_actions_agent_cards_birdsong(self, faction):
         actions = []
         faction_board = self.faction_to_faction_board(faction)
         for card in faction_board.crafted_cards:
             if faction_board.activated_card.count(card) > 0:
                 continue
             if card.name == CardName.ROYAL_CLAIM:
-                actions.append(Action('Discard {}'.format(card.name),
+                actions.append(Action(('Discard {}', card.name),
                                       perform(self.royal_claim, faction, card)))
             if card.name == CardName.STAND_AND_DELIVER and self.stand_and_deliver_check(faction):
                 actions = actions + self.generate_actions_agent_stand_and_deliver(faction, card)
         return actions
 
     def royal_claim(self, faction, card):
-        LOGGER.debug("{}:{}:{}:Enter royal_claim".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter royal_claim")
         faction_board = self.faction_to_faction_board(faction)
 
         self.discard_card(faction_board.crafted_cards, card)
@@ -2949,14 +3474,14 @@ class GameLogic:
                 gained_vp += 1
         self.gain_vp(faction, gained_vp)
 
-        LOGGER.debug(
-            "{}:{}:{}:{} discard ROYAL_CLAIM, {} vp gained".format(self.ui_turn_player, self.phase, self.sub_phase,
-                                                                   faction, gained_vp))
+        if TRACER.enabled:
+            self.trace("{} discard ROYAL_CLAIM, {} vp gained", faction, gained_vp)
 
         self.cards_daylight_continuation_func()
 
     def stand_and_deliver_check(self, faction):
-        LOGGER.debug("{}:{}:{}:Enter stand_and_deliver_check".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter stand_and_deliver_check")
 
         available = False
         available_faction = [Faction.MARQUISE, Faction.EYRIE]
@@ -2968,16 +3493,15 @@ class GameLogic:
         return available
 
     def stand_and_deliver_select_faction(self, faction, card):
-        LOGGER.debug(
-            "{}:{}:{}:Enter stand_and_deliver_select_faction".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter stand_and_deliver_select_faction")
 
         self.prompt = "Select Faction"
         self.set_actions(self.generate_actions_stand_and_deliver_select_faction(faction, card))
 
     def generate_actions_agent_stand_and_deliver(self, faction, card) -> list[Action]:
-        LOGGER.debug(
-            "{}:{}:{}:Enter generate_actions_agent_stand_and_deliver".format(self.ui_turn_player, self.phase,
-                                                                             self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter generate_actions_agent_stand_and_deliver")
 
         actions: list[Action] = []
         available_faction: list[Faction] = [Faction.MARQUISE, Faction.EYRIE]
@@ -2986,14 +3510,13 @@ class GameLogic:
         for enemy_faction in available_faction:
             if len(self.faction_to_faction_board(enemy_faction).cards_in_hand) > 0:
                 actions.append(
-                    Action('Use {} card on {}'.format(card.name, enemy_faction),
+                    Action(('Use {} card on {}', card.name, enemy_faction),
                            perform(self.stand_and_deliver, faction, enemy_faction, card)))
         return actions
 
     def generate_actions_stand_and_deliver_select_faction(self, faction, card) -> list[Action]:
-        LOGGER.debug(
-            "{}:{}:{}:Enter generate_actions_stand_and_deliver_select_faction".format(self.ui_turn_player, self.phase,
-                                                                                      self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter generate_actions_stand_and_deliver_select_faction")
 
         actions: list[Action] = []
         available_faction: list[Faction] = [Faction.MARQUISE, Faction.EYRIE]
@@ -3002,22 +3525,23 @@ class GameLogic:
         for enemy_faction in available_faction:
             if len(self.faction_to_faction_board(enemy_faction).cards_in_hand) > 0:
                 actions.append(
-                    Action('{}'.format(enemy_faction),
+                    Action(('{}', enemy_faction),
                            perform(self.stand_and_deliver, faction, enemy_faction, card)))
         return actions
 
     def stand_and_deliver(self, faction, stolen_faction, card):
-        LOGGER.debug("{}:{}:{}:Enter stand_and_deliver".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter stand_and_deliver")
 
         faction_board = self.faction_to_faction_board(faction)
         stolen_faction_board = self.faction_to_faction_board(stolen_faction)
 
-        faction_board.activated_card.append(card)
+        self.journaled_append(faction_board.activated_card, card)
 
-        random_card = random.choice(stolen_faction_board.cards_in_hand)
+        random_card = self.rng.choice(stolen_faction_board.cards_in_hand)
 
         self.discard_card(stolen_faction_board.cards_in_hand, random_card)
-        faction_board.cards_in_hand.append(random_card)
+        self.journaled_append(faction_board.cards_in_hand, random_card)
 
         self.gain_vp(stolen_faction, 1)
 
@@ -3031,8 +3555,7 @@ class GameLogic:
             for faction in [Faction.MARQUISE, Faction.EYRIE]:
                 self.take_card_from_draw_pile(faction)
 
-    def generate_actions_agent_cards_daylight(self, faction, continuation_func):
-        self.cards_daylight_continuation_func = continuation_func
+    def generate_actions_agent_cards_daylight(self, faction):
         actions = []
         faction_board = self.faction_to_faction_board(faction)
         for card in faction_board.crafted_cards:
@@ -3041,7 +3564,7 @@ class GameLogic:
             if card.name == CardName.TAX_COLLECTOR and self.tax_collector_check(faction):
                 actions += self.generate_actions_agent_tax_collector(faction, card)
             if card.name == CardName.CODEBREAKERS:
-                actions.append(Action('* Use {} card'.format(card.name),
+                actions.append(Action(('* Use {} card', card.name),
                                       perform(self.codebreakers, faction, card)))
 
         return actions
@@ -3054,10 +3577,10 @@ class GameLogic:
             if faction_board.activated_card.count(card) > 0:
                 continue
             if card.name == CardName.TAX_COLLECTOR and self.tax_collector_check(faction):
-                actions.append(Action('* Use {} card'.format(card.name),
+                actions.append(Action(('* Use {} card', card.name),
                                       perform(self.tax_collector_select_clearing, faction, card)))
             if card.name == CardName.CODEBREAKERS:
-                actions.append(Action('* Use {} card'.format(card.name),
+                actions.append(Action(('* Use {} card', card.name),
                                       perform(self.codebreakers, faction, card)))
 
         return actions
@@ -3070,14 +3593,13 @@ class GameLogic:
             if card.name == CardName.COMMAND_WARREN and len(
                     self.generate_actions_select_clearing_battle(faction, continuation_func, False)) != 0:
                 actions.append(
-                    Action('Use {} card'.format(card.name),
+                    Action(('Use {} card', card.name),
                            perform(self.command_warren, card, faction, continuation_func)))
 
         return actions
 
     def generate_actions_agent_command_warren_battle(self):
         clearings = self.get_battlable_clearing(self.command_warren_attacker, False)
-        self.ignore_decree = True
 
         actions: list[Action] = []
         for clearing in clearings:
@@ -3086,7 +3608,7 @@ class GameLogic:
 
             for enemy_faction in enemy_factions:
                 actions.append(
-                    Action("Attack {} in area {}".format(enemy_faction, clearing.area_index),
+                    Action(("Attack {} in area {}", enemy_faction, clearing.area_index),
                            perform(self.initiate_battle, self.command_warren_attacker, enemy_faction, clearing,
                                    self.command_warren_continuation_func)))
 
@@ -3095,7 +3617,7 @@ class GameLogic:
     def command_warren(self, card, faction, continuation_func):
         self.sub_phase = 30003
         faction_board = self.faction_to_faction_board(faction)
-        faction_board.activated_card.append(card)
+        self.journaled_append(faction_board.activated_card, card)
 
         self.command_warren_attacker = faction
         self.command_warren_continuation_func = continuation_func
@@ -3116,7 +3638,7 @@ class GameLogic:
 
         for clearing in self.board.areas:
             if clearing.warrior_count[faction_to_warrior(faction)] > 0:
-                actions.append(Action('* Use Tax Collector: remove 1 warrior from {}'.format(clearing.area_index),
+                actions.append(Action(('* Use Tax Collector: remove 1 warrior from {}', clearing.area_index),
                                       perform(self.tax_collector, faction, clearing, card)))
 
         return actions
@@ -3126,13 +3648,14 @@ class GameLogic:
 
         for clearing in self.board.areas:
             if clearing.warrior_count[faction_to_warrior(faction)] > 0:
-                actions.append(Action('{}'.format(clearing.area_index),
+                actions.append(Action(('{}', clearing.area_index),
                                       perform(self.tax_collector, faction, clearing, card)))
 
         return actions
 
     def tax_collector(self, faction, clearing, card):
-        LOGGER.debug("{}:{}:{}:Enter tax_collector".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter tax_collector")
         faction_board = self.faction_to_faction_board(faction)
         warrior = faction_to_warrior(faction)
 
@@ -3140,13 +3663,14 @@ class GameLogic:
         faction_board.reserved_warriors += 1
 
         self.take_card_from_draw_pile(faction, 1)
-        faction_board.activated_card.append(card)
+        self.journaled_append(faction_board.activated_card, card)
 
         self.cards_daylight_continuation_func()
 
     def codebreakers(self, faction, card):  # 30002
         self.sub_phase = 30002
-        LOGGER.debug("{}:{}:{}:Enter codebreakers".format(self.ui_turn_player, self.phase, self.sub_phase))
+        if TRACER.enabled:
+            self.trace("Enter codebreakers")
 
         if faction == Faction.MARQUISE:
             enemy_faction = Faction.EYRIE
@@ -3159,7 +3683,7 @@ class GameLogic:
         prompt_str = ""
         for card_in_hand in enemy_faction_board.cards_in_hand:
             prompt_str = prompt_str + "{} ({}), ".format(card_in_hand.name, card_in_hand.suit)
-        faction_board.activated_card.append(card)
+        self.journaled_append(faction_board.activated_card, card)
 
         self.prompt = prompt_str
         self.set_actions([Action('Next', self.cards_daylight_continuation_func)])
@@ -3172,7 +3696,7 @@ class GameLogic:
             if card.name == CardName.COBBLER and len(
                     self.generate_actions_select_src_clearing(faction, continuation_func, False)) != 0:
                 actions.append(
-                    Action('Use {} card'.format(card.name),
+                    Action(('Use {} card', card.name),
                            perform(self.cobbler, card, faction, continuation_func)))
 
         return actions
@@ -3185,21 +3709,21 @@ class GameLogic:
             if card.name == CardName.COBBLER and len(
                     self.generate_actions_select_src_clearing(faction, None, False)) != 0:
                 actions.append(
-                    Action('Use {} card'.format(card.name),
+                    Action(('Use {} card', card.name),
                            perform(self.cobbler_agent, card, faction)))
 
         return actions
 
     def cobbler(self, card, faction, continuation_func):
         faction_board = self.faction_to_faction_board(faction)
-        faction_board.activated_card.append(card)
+        self.journaled_append(faction_board.activated_card, card)
         self.select_clearing_src_move(faction, continuation_func)
 
     def cobbler_agent(self, card, faction):
         self.sub_phase = 30001
 
         faction_board = self.faction_to_faction_board(faction)
-        faction_board.activated_card.append(card)
+        self.journaled_append(faction_board.activated_card, card)
 
     def favor_card(self, faction, suit):
         for clearing in self.board.areas:
@@ -3223,21 +3747,21 @@ class GameLogic:
                             clearing.remove_building(Building.SAWMILL)
                         except ValueError:
                             break
-                        self.marquise_board_logic.building_trackers[Building.SAWMILL] -= 1
+                        self.journaled_add(self.marquise_board_logic.building_trackers, Building.SAWMILL, -1)
                         self.gain_vp(faction, 1)
                     while True:
                         try:
                             clearing.remove_building(Building.RECRUITER)
                         except ValueError:
                             break
-                        self.marquise_board_logic.building_trackers[Building.RECRUITER] -= 1
+                        self.journaled_add(self.marquise_board_logic.building_trackers, Building.RECRUITER, -1)
                         self.gain_vp(faction, 1)
                     while True:
                         try:
                             clearing.remove_building(Building.WORKSHOP)
                         except ValueError:
                             break
-                        self.marquise_board_logic.building_trackers[Building.WORKSHOP] -= 1
+                        self.journaled_add(self.marquise_board_logic.building_trackers, Building.WORKSHOP, -1)
                         self.gain_vp(faction, 1)
                     num_tokens_removed = clearing.token_count[Token.WOOD]
                     num_warriors_removed = clearing.warrior_count[Warrior.MARQUISE]
@@ -3245,69 +3769,3 @@ class GameLogic:
                     clearing.remove_warrior(Warrior.MARQUISE, num_warriors_removed)
                     self.marquise_board_logic.reserved_warriors += num_warriors_removed
                     self.gain_vp(faction, num_tokens_removed + num_warriors_removed)
-
-
-class Game:
-    def __init__(self):
-        self.logic = GameLogic()
-        areas_offset_y = 0.05
-        areas_radius = Board.rect.width * AreaLogic.size_ratio
-        areas: list[Area] = [
-            Area(self.logic.get_area(0), Vector2(Board.rect.x + Board.rect.width * 0.12,
-                                                 Board.rect.y + Board.rect.height * (0.20 - areas_offset_y)),
-                 areas_radius),
-            Area(self.logic.get_area(1), Vector2(Board.rect.x + Board.rect.width * 0.55,
-                                                 Board.rect.y + Board.rect.height * (0.15 - areas_offset_y)),
-                 areas_radius),
-            Area(self.logic.get_area(2), Vector2(Board.rect.x + Board.rect.width * 0.88,
-                                                 Board.rect.y + Board.rect.height * (0.25 - areas_offset_y)),
-                 areas_radius),
-
-            Area(self.logic.get_area(3), Vector2(Board.rect.x + Board.rect.width * 0.43,
-                                                 Board.rect.y + Board.rect.height * (0.35 - areas_offset_y)),
-                 areas_radius),
-
-            Area(self.logic.get_area(4), Vector2(Board.rect.x + Board.rect.width * 0.10,
-                                                 Board.rect.y + Board.rect.height * (0.45 - areas_offset_y)),
-                 areas_radius),
-            Area(self.logic.get_area(5), Vector2(Board.rect.x + Board.rect.width * 0.34,
-                                                 Board.rect.y + Board.rect.height * (0.58 - areas_offset_y)),
-                 areas_radius),
-            Area(self.logic.get_area(6), Vector2(Board.rect.x + Board.rect.width * 0.66,
-                                                 Board.rect.y + Board.rect.height * (0.53 - areas_offset_y)),
-                 areas_radius),
-            Area(self.logic.get_area(7), Vector2(Board.rect.x + Board.rect.width * 0.90,
-                                                 Board.rect.y + Board.rect.height * (0.56 - areas_offset_y)),
-                 areas_radius),
-
-            Area(self.logic.get_area(8), Vector2(Board.rect.x + Board.rect.width * 0.12,
-                                                 Board.rect.y + Board.rect.height * (0.83 - areas_offset_y)),
-                 areas_radius),
-            Area(self.logic.get_area(9), Vector2(Board.rect.x + Board.rect.width * 0.39,
-                                                 Board.rect.y + Board.rect.height * (0.88 - areas_offset_y)),
-                 areas_radius),
-            Area(self.logic.get_area(10), Vector2(Board.rect.x + Board.rect.width * 0.62,
-                                                  Board.rect.y + Board.rect.height * (0.80 - areas_offset_y)),
-                 areas_radius),
-            Area(self.logic.get_area(11), Vector2(Board.rect.x + Board.rect.width * 0.84,
-                                                  Board.rect.y + Board.rect.height * (0.88 - areas_offset_y)),
-                 areas_radius),
-        ]
-
-        self.board = Board(self.logic.board, areas)
-
-        self.marquise = MarquiseBoard(self.logic.marquise_board_logic, "Marquise de Cat", Colors.ORANGE,
-                                      Vector2(0, 0.0 * Config.NATIVE_SCREEN_HEIGHT))
-        self.eyrie = EyrieBoard(self.logic.eyrie_board_logic, "Eyrie Dynasties", Colors.BLUE,
-                                Vector2(0, 0.5 * Config.NATIVE_SCREEN_HEIGHT))
-
-    def draw(self, screen: Surface):
-        # Fill Black
-        screen.fill("black")
-
-        self.logic.board.turn_player = self.logic.ui_turn_player
-        self.logic.board.turn_count = self.logic.turn_count
-
-        self.board.draw(screen)
-        self.marquise.draw(screen)
-        self.eyrie.draw(screen)
@@ -0,0 +1,56 @@
+import random
+
+
+class JournaledState:
+    """
+    Base of the state objects that record the undo of their in-place changes while a GameLogic frame is open, see
+    GameLogic.push. `journal` holds (undo function, args...) entries, None when no frame is open. The undo functions
+    are list and dict methods, so undoing is not journaled.
+    Fields that are assigned a new value instead are saved with the frame and need none of this.
+    """
+
+    journal: list | None = None
+
+    def set_journal(self, journal: list | None):
+        """
+        Starts (a list) or stops (None) recording the undo of every in-place change.
+        """
+        self.journal = journal
+
+    def undo_journal(self, length: int):
+        """
+        Undoes the changes recorded after the journal had `length` entries, latest first.
+        """
+        journal = self.journal
+        while len(journal) > length:
+            undo, *args = journal.pop()
+            undo(*args)
+
+    def journaled_append(self, items: list, item: any):
+        if self.journal is not None:
+            self.journal.append((items.pop,))
+        items.append(item)
+
+    def journaled_remove(self, items: list, item: any):
+        index: int = items.index(item)
+        if self.journal is not None:
+            self.journal.append((items.insert, index, item))
+        del items[index]
+
+    def journaled_extend(self, items: list, new_items: list):
+        if self.journal is not None:
+            self.journal.append((items.__delitem__, slice(len(items), None)))
+        items.extend(new_items)
+
+    def journaled_shuffle(self, items: list, rng: random.Random):
+        if self.journal is not None:
+            self.journal.append((items.__setitem__, slice(None), items.copy()))
+        rng.shuffle(items)
+
+    def journaled_set(self, mapping: dict, key: any, value: any):
+        if self.journal is not None:
+            self.journal.append((mapping.__setitem__, key, mapping[key]))
+        mapping[key] = value
+
+    def journaled_add(self, counts: dict, key: any, amount: int):
+        self.journaled_set(counts, key, counts[key] + amount)
@@ -0,0 +1,68 @@
+from game.Building import Building
+from game.Card import Card
+from game.FactionBoardLogic import FactionBoardLogic
+from game.Zobrist import count_field
+
+
+class MarquiseBoardLogic(FactionBoardLogic):
+    zobrist_tag = 'marquise'
+    HASHED_FIELDS = FactionBoardLogic.HASHED_FIELDS | {'building_trackers': count_field}
+
+    def __init__(self, reserved_warriors: int):
+        super().__init__(reserved_warriors)
+
+        self.building_trackers: {Building, int} = {
+            Building.SAWMILL: 1,
+            Building.WORKSHOP: 1,
+            Building.RECRUITER: 1
+        }
+
+        self.building_cost = [0, 1, 2, 3, 3, 4]
+        self.building_reward = {
+            Building.SAWMILL: [0, 1, 2, 3, 4, 5],
+            Building.WORKSHOP: [0, 2, 2, 3, 4, 5],
+            Building.RECRUITER: [0, 1, 2, 3, 3, 4]
+        }
+
+        self.building_reward_card = {
+            Building.SAWMILL: [0, 0, 0, 0, 0, 0],
+            Building.WORKSHOP: [0, 0, 0, 0, 0, 0],
+            Building.RECRUITER: [0, 0, 1, 1, 2, 2]
+        }
+
+    def get_state_as_num_array(self):
+        prev_arr = super().get_state_as_num_array()
+
+        n_features: int = 1
+        arr: list = prev_arr + [[]] * n_features
+
+        arr[7] = [self.building_trackers[building] for building in
+                  [Building.SAWMILL, Building.WORKSHOP, Building.RECRUITER]]
+
+        return arr
+
+    def set_state_from_num_array(self,
+                                 arr: list = None,
+                                 cards: list[Card] = None):
+        super().set_state_from_num_array(arr, cards)
+        self.__set_state_from_num_arrays(arr[7])
+
+    def __set_state_from_num_arrays(self,
+                                    building_trackers: list[int] = None):
+        for i, building in enumerate(self.building_trackers):
+            self.building_trackers[building] = building_trackers[i]
+
+    def copy_from(self, other: 'MarquiseBoardLogic'):
+        super().copy_from(other)
+        self.building_trackers = other.building_trackers.copy()
+
+    def get_reward(self, building):
+        return self.building_reward[building][self.building_trackers[building]]
+
+    def get_reward_card(self):
+        return self.building_reward_card[Building.RECRUITER][min(self.building_trackers[Building.RECRUITER], 5)]
+
+    def build_action_update(self, building):
+        cost = self.building_cost[self.building_trackers[building]]
+        self.journaled_add(self.building_trackers, building, 1)
+        return cost
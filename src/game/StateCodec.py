@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import struct
+from itertools import chain
+
+from game.Item import Item
+from game.Token import Token
+from game.Warrior import Warrior
+
+CLEARING_COUNT: int = 12
+ITEM_SUPPLY_COUNT: int = 12
+BUILDING_SLOT_COUNT: int = 3
+FACTION_COUNT: int = 2
+
+STATE_FORMAT_VERSION: int = 1  # bump on any change of the layout below
+
+# Fields of the game num array (see `GameLogic.get_state_as_num_array`) holding a single number
+SCALAR_FIELDS: tuple[int, ...] = (*range(0, 7), *range(13, 20), *range(21, 40))
+IGNORE_DECREE_FIELD: int = 37  # the only bool field
+GAME_FIELD_COUNT: int = 40
+
+# Clearing layout: building slot count, building slots (-1 past the count), tokens, warriors
+AREA_BUILDING_OFFSET: int = 1
+AREA_TOKEN_OFFSET: int = AREA_BUILDING_OFFSET + BUILDING_SLOT_COUNT
+AREA_WARRIOR_OFFSET: int = AREA_TOKEN_OFFSET + len(Token)
+AREA_SIZE: int = AREA_WARRIOR_OFFSET + len(Warrior)
+
+# Faction board layout: items, dominance card, crafting pieces, reserved warriors
+FACTION_BOARD_SIZE: int = len(Item) + 1 + 3 + 1
+
+# Board section layout: faction points, clearings, item supply, marquise board, eyrie board, building trackers,
+# roost tracker, leaders
+BOARD_AREA_OFFSET: int = FACTION_COUNT
+BOARD_ITEM_SUPPLY_OFFSET: int = BOARD_AREA_OFFSET + CLEARING_COUNT * AREA_SIZE
+BOARD_MARQUISE_OFFSET: int = BOARD_ITEM_SUPPLY_OFFSET + ITEM_SUPPLY_COUNT
+BOARD_EYRIE_OFFSET: int = BOARD_MARQUISE_OFFSET + FACTION_BOARD_SIZE
+BOARD_BUILDING_TRACKER_OFFSET: int = BOARD_EYRIE_OFFSET + FACTION_BOARD_SIZE
+BOARD_ROOST_TRACKER_OFFSET: int = BOARD_BUILDING_TRACKER_OFFSET + 3
+BOARD_LEADER_OFFSET: int = BOARD_ROOST_TRACKER_OFFSET + 1
+BOARD_SIZE: int = BOARD_LEADER_OFFSET + 4
+
+# Card lists, in this order: draw pile, discard pile, dominance discard pile, marquise hand, crafted and activated
+# cards, eyrie hand, crafted and activated cards, eyrie decree (4 columns), decree counter (4 columns).
+# Their card ids share one section of CARD_SLOT_COUNT slots, the cards of the viziers and of the decree counter
+# are listed twice.
+CARD_LIST_COUNT: int = 17
+CARD_SLOT_COUNT: int = 128
+
+# State layout: version (uint16), scalar fields (int32), board section (int16), card list lengths (uint8),
+# card ids (int8, -1 past the last list)
+SCALAR_OFFSET: int = 1
+BOARD_OFFSET: int = SCALAR_OFFSET + len(SCALAR_FIELDS)
+CARD_LENGTH_OFFSET: int = BOARD_OFFSET + BOARD_SIZE
+CARD_OFFSET: int = CARD_LENGTH_OFFSET + CARD_LIST_COUNT
+STATE_STRUCT: struct.Struct = struct.Struct('<H{}i{}h{}B{}b'.format(
+    len(SCALAR_FIELDS), BOARD_SIZE, CARD_LIST_COUNT, CARD_SLOT_COUNT))
+STATE_SIZE: int = STATE_STRUCT.size  # bytes, states can be concatenated into a file of fixed-size records
+
+BUILDING_PADDING: list[list[int]] = [[-1] * (BUILDING_SLOT_COUNT - count) for count in range(BUILDING_SLOT_COUNT + 1)]
+
+
+def encode_state(arr: list) -> bytes:
+    """
+    Packs a full game num array (see `GameLogic.get_state_as_num_array`) into STATE_SIZE bytes.
+    """
+    values: list[int] = [STATE_FORMAT_VERSION]
+    values += [arr[field] for field in SCALAR_FIELDS]
+
+    faction_points, areas, item_supply = arr[10]
+    values += faction_points
+    for area in areas:
+        buildings = area[1]
+        values.append(len(buildings))
+        values += buildings
+        values += BUILDING_PADDING[len(buildings)]
+        values += area[2]
+        values += area[3]
+    values += item_supply
+
+    marquise_board, eyrie_board = arr[11], arr[12]
+    for faction_board in (marquise_board, eyrie_board):
+        values += faction_board[0]
+        values += faction_board[4]
+        values += faction_board[5]
+        values.append(faction_board[6])
+    values += marquise_board[7]
+    values.append(eyrie_board[7])
+    values += eyrie_board[8]
+
+    card_lists = [arr[7], arr[8], arr[9],
+                  marquise_board[1], marquise_board[2], marquise_board[3],
+                  eyrie_board[1], eyrie_board[2], eyrie_board[3],
+                  *eyrie_board[9], *arr[20]]
+    card_ids = list(chain.from_iterable(card_lists))
+    if len(card_ids) > CARD_SLOT_COUNT:
+        raise ValueError("encode_state: {} card ids, at most {} fit".format(len(card_ids), CARD_SLOT_COUNT))
+    values += [len(card_list) for card_list in card_lists]
+    values += card_ids
+    values += [-1] * (CARD_SLOT_COUNT - len(card_ids))
+
+    return STATE_STRUCT.pack(*values)
+
+
+def decode_state(data: bytes) -> list:
+    """
+    Unpacks bytes of `encode_state` into the game num array they were packed from.
+    """
+    if len(data) != STATE_SIZE:
+        raise ValueError("decode_state: {} bytes, a state is {} bytes".format(len(data), STATE_SIZE))
+    values = STATE_STRUCT.unpack(data)
+    if values[0] != STATE_FORMAT_VERSION:
+        raise ValueError("decode_state: format version {}, expected {}".format(values[0], STATE_FORMAT_VERSION))
+
+    arr: list = [0] * GAME_FIELD_COUNT
+    for i, field in enumerate(SCALAR_FIELDS):
+        arr[field] = values[SCALAR_OFFSET + i]
+    arr[IGNORE_DECREE_FIELD] = arr[IGNORE_DECREE_FIELD] == 1
+
+    board = values[BOARD_OFFSET:CARD_LENGTH_OFFSET]
+    areas: list = []
+    for area_index in range(CLEARING_COUNT):
+        offset = BOARD_AREA_OFFSET + area_index * AREA_SIZE
+        areas.append([area_index,
+                      list(board[offset + AREA_BUILDING_OFFSET:offset + AREA_BUILDING_OFFSET + board[offset]]),
+                      list(board[offset + AREA_TOKEN_OFFSET:offset + AREA_WARRIOR_OFFSET]),
+                      list(board[offset + AREA_WARRIOR_OFFSET:offset + AREA_SIZE])])
+    arr[10] = [list(board[:BOARD_AREA_OFFSET]), areas,
+               list(board[BOARD_ITEM_SUPPLY_OFFSET:BOARD_MARQUISE_OFFSET])]
+
+    card_lists: list[list[int]] = []
+    card_offset = CARD_OFFSET
+    for length in values[CARD_LENGTH_OFFSET:CARD_OFFSET]:
+        card_lists.append(list(values[card_offset:card_offset + length]))
+        card_offset += length
+
+    faction_boards: list[list] = []
+    for offset, card_list_offset in ((BOARD_MARQUISE_OFFSET, 3), (BOARD_EYRIE_OFFSET, 6)):
+        items_end = offset + len(Item)
+        faction_boards.append([list(board[offset:items_end]),
+                               card_lists[card_list_offset],
+                               card_lists[card_list_offset + 1],
+                               card_lists[card_list_offset + 2],
+                               [board[items_end]],
+                               list(board[items_end + 1:items_end + 4]),
+                               board[items_end + 4]])
+    marquise_board, eyrie_board = faction_boards
+    marquise_board.append(list(board[BOARD_BUILDING_TRACKER_OFFSET:BOARD_ROOST_TRACKER_OFFSET]))
+    eyrie_board += [board[BOARD_ROOST_TRACKER_OFFSET],
+                    list(board[BOARD_LEADER_OFFSET:BOARD_SIZE]),
+                    card_lists[9:13]]
+    arr[11] = marquise_board
+    arr[12] = eyrie_board
+
+    arr[7], arr[8], arr[9] = card_lists[0:3]
+    arr[20] = card_lists[13:17]
+
+    return arr
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Callable
+
+
+@lru_cache(maxsize=None)
+def zobrist_key(*feature) -> int:
+    """
+    Fixed 64 bit random key of a state feature, e.g. <clearing, warrior type, count>.
+    Keys are derived from the feature itself instead of a random table, so every process gets the same keys.
+
+    :param feature: ints, strings or enum members
+    """
+    return int.from_bytes(blake2b(repr(feature).encode(), digest_size=8).digest(), 'little')
+
+
+def card_feature(card) -> int:
+    return -1 if card is None else card.card_id
+
+
+def hashed_field(to_feature: Callable[[any], any] | None = None) -> Callable[[str, str, any], int]:
+    """
+    Field hasher of a single value, hashed by `to_feature(value)` (the value itself by default), see HashedState.
+    Two values must have the same feature when the num array stores them the same way.
+    """
+
+    def hash_value(tag: str, name: str, value: any) -> int:
+        return zobrist_key(tag, name, value if to_feature is None else to_feature(value))
+
+    return hash_value
+
+
+def card_list_field(tag: str, name: str, cards: list) -> int:
+    zobrist_hash = 0
+    for index, card in enumerate(cards):
+        zobrist_hash ^= zobrist_key(tag, name, index, card.card_id)
+    return zobrist_hash
+
+
+def card_lists_field(tag: str, name: str, card_lists: dict) -> int:
+    zobrist_hash = 0
+    for key, cards in card_lists.items():
+        for index, card in enumerate(cards):
+            zobrist_hash ^= zobrist_key(tag, name, key, index, card.card_id)
+    return zobrist_hash
+
+
+def count_field(tag: str, name: str, counts: dict) -> int:
+    """
+    Counts (or statuses) by key, e.g. items or leaders.
+    A zero count has no key, so a missing entry hashes as a zero one.
+    """
+    zobrist_hash = 0
+    for key, count in counts.items():
+        if count != 0:
+            zobrist_hash ^= zobrist_key(tag, name, key, count)
+    return zobrist_hash
+
+
+class HashedState:
+    """
+    Base of the state objects with a zobrist hash over their fields. `HASHED_FIELDS` maps each hashed field to its
+    hasher, and `get_zobrist_hash` XORs the hashes of the current values. Nothing is kept up to date while the rules
+    run, so the hash only costs something when a transposition lookup asks for it.
+    """
+
+    zobrist_tag: str = ''
+    HASHED_FIELDS: dict[str, Callable[[str, str, any], int]] = {}
+
+    def get_zobrist_hash(self) -> int:
+        zobrist_hash = 0
+        fields = self.__dict__
+        for name, hash_value in self.HASHED_FIELDS.items():
+            zobrist_hash ^= hash_value(self.zobrist_tag, name, fields[name])
+        return zobrist_hash
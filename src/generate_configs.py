@@ -1,36 +1,60 @@
 from roottrainer.CSVOutputWriter import CSVOutputWriter
 
-config_count = 0
+NON_BASE_FACTIONS = ["ma", "ey"]
+EXPAND_COUNTS = [50, 100, 200]
+ACTION_COUNT_LIMITS = [20, 100, 200, -1]
+REWARD_FUNCTIONS = ["win", "vp-difference", "vp-difference-relu"]
+BEST_ACTION_POLICIES = ["max", "robust", "secure"]
 
 
-def write_params(
+def mcts_params(
         expand_count: int = 100,
         action_count_limit: int = 20,
         reward_func: str = "vp-difference",
-        best_action_policy: str = "robust"):
-    writer.write(["      expand-count: {}".format(expand_count)])
-    writer.write(["      rollout-no: {}".format(1)])
-    writer.write(["      action-count-limit: {}".format(action_count_limit)])
-    writer.write(["      time-limit: {}".format(-1)])
-    writer.write(["      reward-function: {}".format(reward_func)])
-    writer.write(["      best-action-policy: {}".format(best_action_policy)])
+        best_action_policy: str = "robust") -> dict:
+    return {
+        "type": "mcts",
+        "expand-count": expand_count,
+        "rollout-no": 1,
+        "action-count-limit": action_count_limit,
+        "time-limit": -1,
+        "reward-function": reward_func,
+        "best-action-policy": best_action_policy
+    }
 
 
-NON_BASE_FACTIONS = ["ma", "ey"]
-EXPAND_COUNTS = [50, 100, 200]
-ACTION_COUNT_LIMITS = [20, 100, 200, -1]
-REWARD_FUNCTIONS = ["win", "vp-difference", "vp-difference-relu"]
-BEST_ACTION_POLICIES = ["max", "robust", "secure"]
+def experiment_grid() -> list[tuple[str, dict, dict]]:
+    """
+    Enumerates every experiment config: one faction runs the base parameters, the other one permutation.
+
+    :return: list of <config file name, marquise mcts params, eyrie mcts params>, in config number order
+    """
+    grid = []
+    for non_base_faction in NON_BASE_FACTIONS:
+        for expand_count in EXPAND_COUNTS:
+            for action_count_limit in ACTION_COUNT_LIMITS:
+                for reward_func in REWARD_FUNCTIONS:
+                    for best_action_policy in BEST_ACTION_POLICIES:
+                        params = mcts_params(expand_count, action_count_limit, reward_func, best_action_policy)
+                        config_file_name = "config-{}-{}.yml".format(len(grid), non_base_faction)
+                        if non_base_faction == "ma":
+                            grid.append((config_file_name, params, mcts_params()))
+                        else:
+                            grid.append((config_file_name, mcts_params(), params))
+    return grid
+
 
-writer: CSVOutputWriter = CSVOutputWriter("src/config/experiment")
-for non_base_faction in NON_BASE_FACTIONS:
-    for expand_count in EXPAND_COUNTS:
-        for action_count_limit in ACTION_COUNT_LIMITS:
-            for reward_func in REWARD_FUNCTIONS:
-                for best_action_policy in BEST_ACTION_POLICIES:
-                    config_file_name = "config-{}-{}.yml".format(config_count, non_base_faction)
-                    writer.open(config_file_name)
-                    writer.write(["""
+def write_params(writer: CSVOutputWriter, params: dict):
+    for key, value in params.items():
+        if key != "type":
+            writer.write(["      {}: {}".format(key, value)])
+
+
+if __name__ == "__main__":
+    writer: CSVOutputWriter = CSVOutputWriter("src/config/experiment")
+    for config_file_name, marquise_params, eyrie_params in experiment_grid():
+        writer.open(config_file_name)
+        writer.write(["""
 screen:
   native-width: 1680
   native-height: 960
@@ -78,32 +102,14 @@ agent:
     type: mcts
     mcts:
       type: mcts"""])
-                    if non_base_faction is "ma":
-                        write_params(
-                            expand_count,
-                            action_count_limit,
-                            reward_func,
-                            best_action_policy
-                        )
-                    else:
-                        write_params()
-
-                    writer.write(["""
+        write_params(writer, marquise_params)
+
+        writer.write(["""
   eyrie:
     enable: true
     type: mcts
     mcts:
       type: mcts"""])
+        write_params(writer, eyrie_params)
 
-                    if non_base_faction is "ey":
-                        write_params(
-                            expand_count,
-                            action_count_limit,
-                            reward_func,
-                            best_action_policy
-                        )
-                    else:
-                        write_params()
-
-                    writer.close()
-                    config_count += 1
+        writer.close()
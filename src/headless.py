@@ -0,0 +1,25 @@
+import logging
+import sys
+
+import yaml
+
+from roottrainer.CSVOutputWriter import get_output_file_stem
+from roottrainer.HeadlessTrainer import HeadlessTrainer
+from utils.trace_utils import configure_tracing
+
+if __name__ == "__main__":
+    config_path: str = ""
+    if len(sys.argv) > 1:
+        config_path = str(sys.argv[1])
+    if config_path == "":
+        config_path = "./config/config.yml"
+    config = yaml.safe_load(open(config_path))
+
+    logging.basicConfig(level=logging.NOTSET)
+    logging.getLogger('game_logger').setLevel(config['logging']['game']['level'])
+    logging.getLogger('trainer_logger').setLevel(config['logging']['trainer']['level'])
+    logging.getLogger('mcts_logger').setLevel(config['logging']['mcts']['level'])
+    configure_tracing(config['logging'])
+
+    trainer = HeadlessTrainer(config, get_output_file_stem(config_path, config['simulation']['round']))
+    trainer.run()
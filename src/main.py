@@ -7,6 +7,7 @@ from pygame import Surface
 
 from config import Config
 from roottrainer.RootTrainer import RootTrainer
+from utils.trace_utils import configure_tracing
 
 if __name__ == "__main__":
     config_path: str = ""
@@ -20,6 +21,7 @@ if __name__ == "__main__":
     logging.getLogger('game_logger').setLevel(config['logging']['game']['level'])
     logging.getLogger('trainer_logger').setLevel(config['logging']['trainer']['level'])
     logging.getLogger('mcts_logger').setLevel(config['logging']['mcts']['level'])
+    configure_tracing(config['logging'])
 
     screen: Surface | None = None
     pygame.init()
@@ -0,0 +1,234 @@
+import math
+
+import pygame
+from pygame import Color, Vector2, Surface, Rect
+
+from config import Config, Colors
+from game.AreaLogic import AreaLogic
+from game.Building import Building
+from game.Suit import Suit
+from game.Token import Token
+from game.Warrior import Warrior
+
+
+class Area:
+    size_ratio: float = 0.07
+
+    def __init__(self, area_logic: AreaLogic, position: Vector2, radius: float):
+        self.logic = area_logic
+
+        self.position: Vector2 = position
+        self.radius: float = radius
+        self.color: Color = Colors.WHITE
+
+    def draw(self, screen: Surface):
+        # circle
+        pygame.draw.circle(screen, self.color, self.position, self.radius, width=1)
+
+        # buildings
+        self.draw_buildings(screen)
+
+        # suit
+        self.draw_suit(screen)
+
+        # ruler
+        self.draw_ruler(screen)
+
+        # warriors
+        self.draw_warriors(screen)
+
+        # tokens
+        self.draw_tokens(screen)
+
+        # text: area_index
+        margin_top = 4
+        text = str(self.logic.area_index)
+
+        surface = Config.FONT_1.render(text, True, Colors.WHITE)
+        surface_rect = surface.get_rect()
+        surface_rect.centerx = self.position.x
+        surface_rect.top = self.position.y + self.radius + margin_top
+        screen.blit(surface, surface_rect)
+
+    def draw_buildings(self, screen: Surface):
+        size_ratio: float = 0.3
+        gap_size_ratio: float = 0.1
+        y_offset_ratio: float = 0.5
+
+        dimension = size_ratio * self.radius
+        gap = gap_size_ratio * self.radius
+
+        count = len(self.logic.buildings)
+        starting_offset: Vector2 = Vector2(
+            -1 * (count * dimension + max((count - 1), 0) * gap) / 2,
+            -1 * y_offset_ratio * self.radius
+        )
+
+        for i, building in enumerate(self.logic.buildings):
+            rect = Rect(0, 0, dimension, dimension)
+            rect.topleft = self.position + starting_offset + Vector2(i * dimension + i * gap, 0)
+
+            color = Colors.WHITE
+            width = 1
+            text = ""
+            if building is Building.EMPTY:
+                color = Colors.WHITE
+            elif building is Building.RUIN:
+                color = Colors.GREY
+                width = 0
+            elif building in [Building.SAWMILL, Building.WORKSHOP, Building.RECRUITER]:
+                color = Colors.ORANGE
+                if building is Building.SAWMILL:
+                    text = "S"
+                elif building is Building.WORKSHOP:
+                    text = "W"
+                elif building is Building.RECRUITER:
+                    text = "R"
+            elif building is Building.ROOST:
+                color = Colors.BLUE
+                text = "R"
+            elif building is Building.BASE:
+                color = Colors.GREEN
+                text = "B"
+
+            pygame.draw.rect(screen, color, rect, width)
+
+            # text
+            surface = Config.FONT_1.render(text, True, color)
+            surface_rect = surface.get_rect()
+            surface_rect.center = rect.center
+
+            screen.blit(surface, surface_rect)
+
+    def draw_suit(self, screen):
+        size_ratio: float = 0.15
+
+        radius = size_ratio * self.radius
+        color = Colors.WHITE
+        width = 0
+        text = ""
+
+        offset: Vector2 = Vector2(self.radius - radius)
+        position = self.position + offset
+
+        if self.logic.suit is Suit.MOUSE:
+            color = Colors.MOUSE
+            text = "M"
+        elif self.logic.suit is Suit.RABBIT:
+            color = Colors.RABBIT
+            text = "R"
+        if self.logic.suit is Suit.FOX:
+            color = Colors.FOX
+            text = "F"
+
+        pygame.draw.circle(screen, color, position, radius, width)
+
+        # text
+        surface = Config.FONT_1.render(text, True, Colors.BLACK)
+        surface_rect = surface.get_rect()
+        surface_rect.center = position
+
+        screen.blit(surface, surface_rect)
+
+    def draw_ruler(self, screen):
+        size_ratio: float = 0.15
+
+        radius = size_ratio * self.radius
+        color = Colors.WHITE
+        width = 0
+        text = ""
+
+        offset: Vector2 = Vector2(self.radius - radius, -1 * (self.radius - radius))
+        position = self.position + offset
+
+        ruler = self.logic.ruler()
+        if ruler is Warrior.MARQUISE:
+            color = Colors.ORANGE
+            text = "M"
+        elif ruler is Warrior.EYRIE:
+            color = Colors.BLUE
+            text = "E"
+
+        pygame.draw.circle(screen, color, position, radius, width)
+
+        # text
+        surface = Config.FONT_1.render(text, True, color)
+        surface_rect = surface.get_rect()
+        surface_rect.center = position
+
+        screen.blit(surface, surface_rect)
+
+    def draw_warriors(self, screen):
+        gap_size_ratio: float = 0.5
+        y_offset_ratio: float = 0.5
+
+        gap = gap_size_ratio * self.radius
+
+        count = 2
+        starting_offset: Vector2 = Vector2(
+            -1 * ((count - 1) * gap) / 2,
+            y_offset_ratio * self.radius
+        )
+
+        # text Marquis
+        if self.logic.warrior_count[Warrior.MARQUISE] > 0:
+            color = Colors.ORANGE
+            text = str(self.logic.warrior_count[Warrior.MARQUISE])
+
+            surface = Config.FONT_SM.render(text, True, color)
+            surface_rect = surface.get_rect()
+            surface_rect.center = Rect(self.position + starting_offset + (Vector2(gap * 0, 0)), (0, 0)).center
+
+            screen.blit(surface, surface_rect)
+
+        # text Eyrie
+        if self.logic.warrior_count[Warrior.EYRIE] > 0:
+            color = Colors.BLUE
+            text = str(self.logic.warrior_count[Warrior.EYRIE])
+
+            surface = Config.FONT_SM.render(text, True, color)
+            surface_rect = surface.get_rect()
+            surface_rect.center = Rect(self.position + starting_offset + (Vector2(gap * 1, 0)), (0, 0)).center
+
+            screen.blit(surface, surface_rect)
+
+    def draw_tokens(self, screen):
+        size_ratio: float = 0.2
+        offset_ratio: float = 0.8
+
+        radius = size_ratio * self.radius
+
+        # Wood
+        if self.logic.token_count[Token.WOOD] > 0:
+            rad = math.radians(45)
+            offset = Vector2(math.cos(rad) * offset_ratio * self.radius,
+                             -1 * math.sin(rad) * offset_ratio * self.radius)
+            position = self.position + offset
+
+            color = Colors.ORANGE
+            width = 1
+            text = "w" + str(self.logic.token_count[Token.WOOD])
+            pygame.draw.circle(screen, color, position, radius, width)
+            # text
+            surface = Config.FONT_1.render(text, True, Colors.ORANGE)
+            surface_rect = surface.get_rect()
+            surface_rect.center = position
+
+            screen.blit(surface, surface_rect)
+        # Castle
+        if self.logic.token_count[Token.CASTLE] > 0:
+            rad = math.radians(10)
+            offset = Vector2(math.cos(rad) * offset_ratio * self.radius,
+                             -1 * math.sin(rad) * offset_ratio * self.radius)
+            position = self.position + offset
+
+            color = Colors.ORANGE
+            width = 1
+            text = "C"
+            pygame.draw.circle(screen, color, position, radius, width)
+            # text
+            surface = Config.FONT_1.render(text, True, Colors.ORANGE)
+            surface_rect = surface.get_rect()
+            surface_rect.center = position
+
+            screen.blit(surface, surface_rect)
@@ -0,0 +1,146 @@
+import pygame
+from pygame import Rect, Color, Surface
+
+from config import Config, Colors
+from game.BoardLogic import BoardLogic
+from game.Faction import Faction
+from game.Item import Item
+from render.Area import Area
+from utils.geometry_utils import get_path_points
+
+FACTION_NAMES = ['Marquise de Cat', 'The Decree', 'Woodland Alliance', 'Vagabond']
+FACTION_ALIAS = {
+    Faction.MARQUISE: 'MC',
+    Faction.EYRIE: 'EY'
+}
+FACTION_COLORS = {
+    Faction.MARQUISE: Colors.ORANGE,
+    Faction.EYRIE: Colors.BLUE
+}
+FACTION_SIZE = 4
+ITEM_SUPPLY_RENDER = [
+    [Item.BAG, Item.BOOTS, Item.CROSSBOW, Item.KNIFE, Item.KEG, Item.COIN],
+    [Item.BAG, Item.BOOTS, Item.HAMMER, Item.KNIFE, Item.KEG, Item.COIN]
+]
+
+
+def add_tuple(a, b):
+    return tuple(map(lambda i, j: i + j, a, b))
+
+
+class Board:
+    dimension: float = 800
+    rect: Rect = Rect(
+        ((Config.NATIVE_SCREEN_WIDTH - dimension) / 2, (Config.NATIVE_SCREEN_HEIGHT - dimension) / 2 - 50),
+        (dimension, dimension))
+
+    def __init__(self, board_logic: BoardLogic, areas: list[Area]):
+        self.name: str = "Forest"
+        self.color: Color = Colors.GREEN
+        self.logic: BoardLogic = board_logic
+        self.areas: list[Area] = areas
+
+    def draw(self, screen: Surface):
+        pygame.draw.rect(screen, self.color, self.rect, width=1)
+
+        self.draw_paths_clearing(screen)
+        self.draw_areas(screen)
+        self.draw_board_info(screen)
+
+    def draw_areas(self, screen: Surface):
+        for area in self.areas:
+            area.draw(screen)
+
+    def draw_paths_clearing(self, screen: Surface):
+        for path in self.logic.paths:
+            area_a = self.areas[path[0]]
+            area_b = self.areas[path[1]]
+            additional_shift = 5
+            line_width = 5
+            pos_a, pos_b = get_path_points(area_a.position, area_b.position, area_a.radius + additional_shift)
+
+            pygame.draw.line(
+                screen, Colors.GREY_DARK_2, pos_a, pos_b, line_width
+            )
+        pass
+
+    def draw_board_info(self, screen):
+        starting_point = ((Config.NATIVE_SCREEN_WIDTH - self.dimension) / 2, (Config.NATIVE_SCREEN_HEIGHT - 130))
+
+        size = (self.dimension, 130)
+        block_one_third = (size[0] / 3, size[1] / 3)
+        block_full = (size[0] / 3, size[1])
+
+        self.draw_victory_point_tracker(screen, starting_point, block_one_third)
+        self.draw_turn_tracker(screen, add_tuple(starting_point, (size[0] / 3, 0)), block_one_third)
+        self.draw_item_supply(screen, add_tuple(starting_point, (size[0] / 3 * 2, 0)), block_full)
+
+        pass
+
+    def draw_victory_point_tracker(self, screen, starting_point, size):
+        # Box
+        box = Rect(starting_point, size)
+        pygame.draw.rect(screen, self.color, box, width=1)
+
+        # Text
+        points_text = Config.FONT_LG_BOLD.render("VPs", True, Colors.WHITE)
+        shift = (10, size[1] / 2 - points_text.get_height() / 2)
+
+        screen.blit(points_text, add_tuple(starting_point, shift))
+
+        faction_pos_ind = 0
+        for (faction, vp) in self.logic.faction_points.items():
+            rendered_text = Config.FONT_LG_BOLD.render("{}".format(vp), True, FACTION_COLORS[faction])
+            pos = (starting_point[0] + faction_pos_ind * 45 + points_text.get_width() + 20, starting_point[1])
+            screen.blit(rendered_text, add_tuple(pos, shift))
+            faction_pos_ind += 1
+
+        pass
+
+    def draw_turn_tracker(self, screen, starting_point, size):
+
+        # Box
+        box = Rect(starting_point, size)
+        pygame.draw.rect(screen, self.color, box, width=1)
+
+        turn_text = Config.FONT_MD_BOLD.render("Turn {}:".format(self.logic.turn_count), True, Colors.WHITE)
+        shift = (10, size[1] / 2 - turn_text.get_height() / 2)
+
+        screen.blit(turn_text, add_tuple(starting_point, shift))
+
+        player_turn_text = Config.FONT_MD_BOLD.render("{}'s turn".format(FACTION_ALIAS[self.logic.turn_player]), True,
+                                                      FACTION_COLORS[self.logic.turn_player])
+        pos = (starting_point[0] + turn_text.get_width() + 10, starting_point[1])
+        screen.blit(player_turn_text, add_tuple(pos, shift))
+
+        pass
+
+    def draw_item_supply(self, screen, starting_point, size):
+
+        # Box
+        box = Rect(starting_point, size)
+        pygame.draw.rect(screen, self.color, box, width=1)
+
+        item_supply_text = Config.FONT_MD_BOLD.render("Item Supply", True, Colors.WHITE)
+        shift = (10, 10)
+
+        screen.blit(item_supply_text, add_tuple(starting_point, shift))
+
+        img_size = (40, 40)
+        img_pos = add_tuple(starting_point, (10, item_supply_text.get_height() + 10))
+
+        for i in range(len(self.logic.item_supply_available)):
+            row = i // 6
+            col = i % 6
+
+            item_image = pygame.image.load("./assets/images/{}.png".format(ITEM_SUPPLY_RENDER[row][col]))
+            item_image = pygame.transform.scale(item_image, img_size)
+
+            if self.logic.item_supply_available[i]:
+                screen.blit(item_image,
+                            (img_pos[0] + img_size[0] * col, img_pos[1] + img_size[0] * row))
+            else:
+                alpha = 128
+                item_image.set_alpha(alpha)
+                screen.blit(item_image,
+                            (img_pos[0] + img_size[0] * col, img_pos[1] + img_size[0] * row))
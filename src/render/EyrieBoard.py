@@ -0,0 +1,104 @@
+import pygame
+from pygame import Color, Vector2, Surface
+
+from config import Config, Colors
+from game.EyrieBoardLogic import EyrieBoardLogic, count_decree_action_static
+from game.Suit import Suit
+from render.FactionBoard import FactionBoard
+from utils import text_utils
+
+
+class EyrieBoard(FactionBoard):
+
+    def __init__(self, eyrie_board_logic: EyrieBoardLogic,
+                 name: str, color: Color, starting_point: Vector2):
+        super().__init__(eyrie_board_logic, name, color, starting_point)
+        self.logic = eyrie_board_logic
+
+    def draw(self, screen: Surface):
+        super().draw(screen)
+
+        self.draw_roost_tracker(screen,
+                                self.starting_point + Vector2(5, 45 * 6 + 25 + self.text_surface.get_height() + 20))
+        self.draw_decree(screen, self.starting_point + Vector2(5, 45 * 7 + 10 + self.text_surface.get_height() + 20))
+        self.draw_leader(screen, self.starting_point + Vector2(5, 45 * 8 + 10 + self.text_surface.get_height() + 20))
+
+    def draw_roost_tracker(self, screen: Surface, starting_point: Vector2):
+
+        # Text
+        title_text = Config.FONT_SM_BOLD.render("roost", True, Colors.BLUE)
+        shift: Vector2 = Vector2(10)
+
+        screen.blit(title_text, starting_point + shift)
+
+        img_size: Vector2 = Vector2(40)
+
+        alpha = 200
+        img = pygame.image.load("./assets/images/eyrie/roost.png")
+        img = pygame.transform.scale(img, img_size)
+        img.set_alpha(alpha)
+        alpha = 64
+        img_dimmed = img.copy()
+        img_dimmed.set_alpha(alpha)
+
+        gap = 5
+        offset_x = 75
+
+        for j in range(7):
+            if j < self.logic.roost_tracker:
+                draw_img = img_dimmed
+            else:
+                draw_img = img
+            screen.blit(draw_img,
+                        (starting_point.x + (img_size.x + gap) * j + gap + offset_x, starting_point.y))
+            if EyrieBoardLogic.ROOST_REWARD_VP[j] > 0:
+                reward_vp = Config.FONT_SM_BOLD.render("+" + str(EyrieBoardLogic.ROOST_REWARD_VP[j]), True,
+                                                       (206, 215, 132))
+                reward_vp = text_utils.add_outline(reward_vp, 2, Colors.GREY_DARK_2)
+
+                screen.blit(reward_vp, (starting_point.x + (img_size.x + gap) * j + gap + offset_x, starting_point.y))
+
+            if EyrieBoardLogic.ROOST_REWARD_CARD[j] > 0:
+                reward_card = Config.FONT_SM_BOLD.render("+" + str(EyrieBoardLogic.ROOST_REWARD_CARD[j]), True,
+                                                         (206, 215, 132))
+                reward_card = text_utils.add_outline(reward_card, 2, Colors.BLUE)
+
+                screen.blit(reward_card, (starting_point.x + (img_size.x + gap) * j + gap + offset_x,
+                                          starting_point.y + img_size.y - Config.FONT_SM_BOLD.get_height()))
+
+    def draw_leader(self, screen: Surface, starting_point: Vector2):
+        shift = Vector2(FactionBoard.dimension.x * 0.05, - FactionBoard.dimension.y * 0.04)
+        text = Config.FONT_1.render("{}".format("leader"), True, Colors.BLUE)
+        screen.blit(text, starting_point + shift)
+        shift = Vector2(FactionBoard.dimension.x * 0.05, 0)
+        text = Config.FONT_1.render("{}".format(self.logic.get_active_leader()), True, Colors.BLUE)
+        screen.blit(text, starting_point + shift)
+
+    def draw_decree(self, screen: Surface, starting_point: Vector2):
+
+        # DecreeAction
+        width = FactionBoard.dimension.x / len(self.logic.decree) - FactionBoard.dimension.x * 0.08
+        offset_x = FactionBoard.dimension.x * 0.3
+        offset_y = Config.FONT_1.get_height()
+
+        for index, decree_action in enumerate(self.logic.decree.keys()):
+            title_text = Config.FONT_1.render(decree_action, True, Colors.BLUE)
+            shift: Vector2 = Vector2(index * width + offset_x, offset_y)
+
+            screen.blit(title_text, starting_point + shift)
+
+        for i, suit in enumerate(Suit):
+            color = Colors.BIRD
+            if suit == Suit.FOX:
+                color = Colors.FOX
+            elif suit == Suit.MOUSE:
+                color = Colors.MOUSE
+            elif suit == Suit.RABBIT:
+                color = Colors.RABBIT
+
+            for j, decree_action in enumerate(self.logic.decree.keys()):
+                title_text = Config.FONT_1.render(str(self.logic.count_decree_action_with_suit(decree_action, suit)),
+                                                  True, color)
+                shift: Vector2 = Vector2(j * width + offset_x, (i + 2) * offset_y)
+
+                screen.blit(title_text, starting_point + shift)
@@ -0,0 +1,131 @@
+import pygame
+from pygame import Rect, Color, Surface, Vector2
+
+from config import Config, Colors
+from game.FactionBoardLogic import FactionBoardLogic
+from game.Suit import Suit
+from utils import text_utils
+from utils.draw_utils import draw_key_value, draw_cards
+
+
+class FactionBoard:
+    dimension = Vector2(Config.NATIVE_SCREEN_WIDTH * 0.25, Config.NATIVE_SCREEN_HEIGHT * 0.5)
+
+    def __init__(self, faction_board_logic: FactionBoardLogic,
+                 name: str, color: Color, starting_point: Vector2):
+        self.logic = faction_board_logic
+        self.name: str = name
+        self.color: Color = color
+        self.starting_point: Vector2 = starting_point
+
+        self.text_surface: Surface = Config.FONT_MD_BOLD.render(name, True, color)
+
+    def draw(self, screen: Surface):
+        pygame.draw.rect(screen, self.color, Rect(self.starting_point,
+                                                  (FactionBoard.dimension.x, FactionBoard.dimension.y)),
+                         width=3)
+
+        # Text
+        shift: Vector2 = Vector2(10, 10)
+
+        screen.blit(self.text_surface, self.starting_point + shift)
+
+        self.draw_crafted_items(screen, self.starting_point + Vector2(5, 45 * 0 + self.text_surface.get_height() + 20))
+
+        self.draw_crafted_cards(screen, self.starting_point + Vector2(5, 45 * 2 + self.text_surface.get_height() + 20))
+        self.draw_crafted_cards_count(screen,
+                                      self.starting_point + Vector2(5, 45 * 3 + self.text_surface.get_height() + 20))
+
+        self.draw_cards_in_hand(screen, self.starting_point + Vector2(5, 45 * 4 + self.text_surface.get_height() + 20))
+        self.draw_cards_in_hand_count(screen,
+                                      self.starting_point + Vector2(5, 45 * 5 + self.text_surface.get_height() + 20))
+
+        self.draw_reserved_warriors(screen,
+                                    self.starting_point + Vector2(5, 45 * 5 + 25 + self.text_surface.get_height() + 20))
+
+        self.draw_dominance_card(screen)
+
+    def draw_dominance_card(self, screen):
+        size_ratio: float = 0.03
+
+        radius = size_ratio * Config.NATIVE_SCREEN_WIDTH / 4
+        color = Colors.WHITE
+        width = 1
+        text = ""
+
+        offset: Vector2 = Vector2(-radius - 2, radius + 2)
+        position: Vector2 = Vector2(self.starting_point.x + Config.NATIVE_SCREEN_WIDTH / 4,
+                                    self.starting_point.y) + offset
+
+        if self.logic.dominance_card is not None:
+            if self.logic.dominance_card.suit is Suit.MOUSE:
+                color = Colors.MOUSE
+                text = "M"
+            elif self.logic.dominance_card.suit is Suit.RABBIT:
+                color = Colors.RABBIT
+                text = "R"
+            elif self.logic.dominance_card.suit is Suit.FOX:
+                color = Colors.FOX
+                text = "F"
+            elif self.logic.dominance_card.suit is Suit.BIRD:
+                color = Colors.BIRD
+                text = "B"
+
+        pygame.draw.circle(screen, color, position, radius, width)
+
+        # text
+        surface = Config.FONT_1.render(text, True, color)
+        surface_rect = surface.get_rect()
+        surface_rect.center = position
+
+        screen.blit(surface, surface_rect)
+
+    def draw_crafted_items(self, screen: Surface, starting_point: Vector2):
+        # Text
+        title_text = Config.FONT_SM_BOLD.render("Crafted Items", True, self.color)
+        shift: Vector2 = Vector2(10, 10)
+
+        screen.blit(title_text, starting_point + shift)
+
+        img_size: Vector2 = Vector2(40, 40)
+
+        ind = 0
+        for key in self.logic.items:
+            value = self.logic.items[key]
+            row = ind // 5
+            col = ind % 5
+
+            img = pygame.image.load("./assets/images/{}.png".format(key))
+            img = pygame.transform.scale(img, img_size)
+
+            screen.blit(img,
+                        (starting_point.x + (img_size.x + 10) * col + 10 + 150,
+                         starting_point.y + (img_size.x + 5) * row))
+
+            quantity = Config.FONT_SM_BOLD.render("x{}".format(value), True, (206, 215, 132))
+            quantity = text_utils.add_outline(quantity, 2, Colors.GREY_DARK_2)
+            screen.blit(quantity, (
+                starting_point.x + (img_size.x + 10) * col + 10 + 150, starting_point.y + (img_size.x + 5) * row))
+            ind = ind + 1
+
+    def draw_crafted_cards(self, screen: Surface, starting_point: Vector2):
+        draw_cards(screen, starting_point, self.color, "Crafted Cards:", self.logic.crafted_cards)
+
+    def draw_crafted_cards_count(self, screen: Surface, starting_point):
+        draw_key_value(screen, Config.FONT_SM_BOLD, starting_point, Vector2(10, 10), self.color, "Crafted Cards Count",
+                       len(self.logic.crafted_cards))
+
+    def draw_cards_in_hand(self, screen: Surface, starting_point: Vector2):
+        draw_cards(screen, starting_point, self.color, "Cards In-Hand:", self.logic.cards_in_hand)
+
+    def draw_cards_in_hand_count(self, screen: Surface, starting_point):
+        draw_key_value(screen, Config.FONT_SM_BOLD, starting_point, Vector2(10, 10), self.color, "Cards In-Hand Count",
+                       len(self.logic.cards_in_hand))
+
+    def draw_reserved_warriors(self, screen: Surface, starting_point: Vector2):
+        title_text = Config.FONT_SM_BOLD.render("Reserved Warriors: {}".format(self.logic.reserved_warriors), True,
+                                                self.color)
+        shift: Vector2 = Vector2(10, 10)
+        screen.blit(title_text, starting_point + shift)
+
+        pass
@@ -0,0 +1,78 @@
+from pygame import Vector2, Surface
+
+from config import Config, Colors
+from game.GameLogic import GameLogic
+from render.Area import Area
+from render.Board import Board
+from render.EyrieBoard import EyrieBoard
+from render.MarquiseBoard import MarquiseBoard
+
+
+class Game:
+    def __init__(self, game_config: dict | None = None, seed: int | None = None):
+        """
+        :param game_config: the `game` section of the config file, see GameLogic
+        :param seed: seed of the game, see GameLogic
+        """
+        self.logic = GameLogic(game_config, seed)
+        areas_offset_y = 0.05
+        areas_radius = Board.rect.width * Area.size_ratio
+        areas: list[Area] = [
+            Area(self.logic.get_area(0), Vector2(Board.rect.x + Board.rect.width * 0.12,
+                                                 Board.rect.y + Board.rect.height * (0.20 - areas_offset_y)),
+                 areas_radius),
+            Area(self.logic.get_area(1), Vector2(Board.rect.x + Board.rect.width * 0.55,
+                                                 Board.rect.y + Board.rect.height * (0.15 - areas_offset_y)),
+                 areas_radius),
+            Area(self.logic.get_area(2), Vector2(Board.rect.x + Board.rect.width * 0.88,
+                                                 Board.rect.y + Board.rect.height * (0.25 - areas_offset_y)),
+                 areas_radius),
+
+            Area(self.logic.get_area(3), Vector2(Board.rect.x + Board.rect.width * 0.43,
+                                                 Board.rect.y + Board.rect.height * (0.35 - areas_offset_y)),
+                 areas_radius),
+
+            Area(self.logic.get_area(4), Vector2(Board.rect.x + Board.rect.width * 0.10,
+                                                 Board.rect.y + Board.rect.height * (0.45 - areas_offset_y)),
+                 areas_radius),
+            Area(self.logic.get_area(5), Vector2(Board.rect.x + Board.rect.width * 0.34,
+                                                 Board.rect.y + Board.rect.height * (0.58 - areas_offset_y)),
+                 areas_radius),
+            Area(self.logic.get_area(6), Vector2(Board.rect.x + Board.rect.width * 0.66,
+                                                 Board.rect.y + Board.rect.height * (0.53 - areas_offset_y)),
+                 areas_radius),
+            Area(self.logic.get_area(7), Vector2(Board.rect.x + Board.rect.width * 0.90,
+                                                 Board.rect.y + Board.rect.height * (0.56 - areas_offset_y)),
+                 areas_radius),
+
+            Area(self.logic.get_area(8), Vector2(Board.rect.x + Board.rect.width * 0.12,
+                                                 Board.rect.y + Board.rect.height * (0.83 - areas_offset_y)),
+                 areas_radius),
+            Area(self.logic.get_area(9), Vector2(Board.rect.x + Board.rect.width * 0.39,
+                                                 Board.rect.y + Board.rect.height * (0.88 - areas_offset_y)),
+                 areas_radius),
+            Area(self.logic.get_area(10), Vector2(Board.rect.x + Board.rect.width * 0.62,
+                                                  Board.rect.y + Board.rect.height * (0.80 - areas_offset_y)),
+                 areas_radius),
+            Area(self.logic.get_area(11), Vector2(Board.rect.x + Board.rect.width * 0.84,
+                                                  Board.rect.y + Board.rect.height * (0.88 - areas_offset_y)),
+                 areas_radius),
+        ]
+
+        self.board = Board(self.logic.board, areas)
+
+        self.marquise = MarquiseBoard(self.logic.marquise_board_logic, "Marquise de Cat", Colors.ORANGE,
+                                      Vector2(0, 0.0 * Config.NATIVE_SCREEN_HEIGHT))
+        self.eyrie = EyrieBoard(self.logic.eyrie_board_logic, "Eyrie Dynasties", Colors.BLUE,
+                                Vector2(0, 0.5 * Config.NATIVE_SCREEN_HEIGHT))
+
+    def draw(self, screen: Surface):
+        # Fill Black
+        screen.fill("black")
+
+        self.logic.board.turn_player = self.logic.ui_turn_player
+        self.logic.board.turn_count = self.logic.turn_count
+
+        self.board.draw(screen)
+        self.marquise.draw(screen)
+        self.eyrie.draw(screen)
@@ -1,20 +1,18 @@
 import os
-import sys
 from datetime import datetime
 from typing import TextIO
 
-import yaml
 from pathlib import Path
 
 from utils.utils import get_filename_from_path
 
-config_path: str = ""
-if len(sys.argv) > 1:
-    config_path = str(sys.argv[1])
-if config_path == "":
-    config_path = "./config/config.yml"
-config_filename: str = get_filename_from_path(config_path)
-config = yaml.safe_load(open(config_path))
+
+def get_output_file_stem(config_path: str, round_count: int) -> str:
+    """
+    :return: name of the files written by a run of the config file at `config_path`, without extension
+    """
+    return "{}-{}-{}".format(
+        get_filename_from_path(config_path), round_count, datetime.now().strftime("%Y-%m-%d-%H-%M-%S"))
 
 
 class CSVOutputWriter:
@@ -26,12 +24,7 @@ class CSVOutputWriter:
     def __del__(self):
         self.close()
 
-    def open(self,
-             file_name: str = "{}-{}-{}.csv".format(
-                 config_filename,
-                 config['simulation']['round'],
-                 datetime.now().strftime("%Y-%m-%d-%H-%M-%S")),
-             truncate: bool = True):
+    def open(self, file_name: str, truncate: bool = True):
         """
         Open the file with `file_name`. If `truncate`, will clear file content before writing.
         :param file_name: the name of the file to be written on.
@@ -52,3 +45,4 @@ class CSVOutputWriter:
         if self.file is not None:
             self.file.close()
             print(os.path.realpath(self.file.name))
+            self.file = None
@@ -0,0 +1,92 @@
+import time
+from datetime import timedelta
+
+from game.Faction import Faction
+from roottrainer.CSVOutputWriter import CSVOutputWriter
+from roottrainer.HeadlessTrainer import play_game
+from roottrainer.agents.AgentFactory import create_agent
+from roottrainer.agents.RolloutPool import RolloutPool
+from utils.random_utils import derive_seed, new_seed
+
+
+def run_work_unit(seed: int, config_name: str, marquise_params: dict, eyrie_params: dict, round_no: int,
+                  game_config: dict) -> list:
+    """
+    Plays one round of one experiment config. Runs inside a worker process.
+
+    :param seed: seed of the game, see `play_game`
+    :return: output row <config, round, winner, turn, current player, vp marquise, vp eyrie>
+    """
+    marquise_agent = create_agent(Faction.MARQUISE, {'type': marquise_params['type'], 'mcts': marquise_params},
+                                  game_config=game_config)
+    eyrie_agent = create_agent(Faction.EYRIE, {'type': eyrie_params['type'], 'mcts': eyrie_params},
+                               game_config=game_config)
+
+    winning_faction, _, turns_played, turn_player, vp_marquise, vp_eyrie, _ = \
+        play_game(marquise_agent, eyrie_agent, "{} R{}".format(config_name, round_no), game_config, seed)
+
+    marquise_agent.close()
+    eyrie_agent.close()
+
+    return [config_name, round_no, winning_faction, turns_played, turn_player, vp_marquise, vp_eyrie]
+
+
+class ExperimentScheduler:
+    """
+    Runs every round of every experiment config on one worker pool, in a single process tree.
+    Each <config, round> pair is a work unit. Workers take the next unit as soon as they are free,
+    so a slow config never holds back a whole batch. Rows are written to one CSV as units finish.
+    Unit `i` of the grid order is seeded with `derive_seed(seed, i)`, whichever worker plays it.
+    """
+
+    def __init__(self, grid: list[tuple[str, dict, dict]], round_count: int, core_count: int, output_dir: str,
+                 output_file_stem: str, game_config: dict | None = None, seed: int | None = None):
+        """
+        :param grid: list of <config name, marquise mcts params, eyrie mcts params>, see `generate_configs`
+        :param round_count: rounds played per config
+        :param core_count: number of worker processes
+        :param output_dir: directory of the aggregated CSV output
+        :param output_file_stem: name of the CSV output without extension, see `get_output_file_stem`
+        :param game_config: `game` section of the base config, rules shared by every config
+        :param seed: master seed of the run, None to draw one
+        """
+        self.grid: list[tuple[str, dict, dict]] = grid
+        self.round_count: int = round_count
+        self.game_config: dict | None = game_config
+        self.seed: int = seed if seed is not None else new_seed()
+        self.pool: RolloutPool = RolloutPool(core_count)
+        self.output_writer: CSVOutputWriter = CSVOutputWriter(output_dir)
+        self.output_file_stem: str = output_file_stem
+
+    def run(self):
+        self.pool.open()  # fork workers before the output file is opened
+        self.output_writer.open(self.output_file_stem + ".csv")
+        self.output_writer.write(['config', 'round', 'winner', 'turn', 'current_player', 'vp_marquise', 'vp_eyrie'])
+
+        print("Seed {}".format(self.seed))
+        units = [(config_name, marquise_params, eyrie_params, round_no)
+                 for config_name, marquise_params, eyrie_params in self.grid
+                 for round_no in range(1, self.round_count + 1)]
+        args = [[derive_seed(self.seed, i) for i in range(len(units))]] + [list(column) for column in zip(*units)] \
+            + [[self.game_config] * len(units)]
+
+        remaining_rounds: dict[str, int] = {config_name: self.round_count for config_name, _, _ in self.grid}
+        completed = 0
+        start_time = time.time()
+
+        try:
+            for row in self.pool.imap_unordered(run_work_unit, *args):
+                self.output_writer.write(row)
+                completed += 1
+
+                config_name = row[0]
+                remaining_rounds[config_name] -= 1
+                if remaining_rounds[config_name] == 0:
+                    elapsed_time = time.time() - start_time
+                    print("Config {} done | Run {}/{} | Total time: {} | Estimated remaining time: {}".format(
+                        config_name, completed, len(units),
+                        str(timedelta(seconds=elapsed_time)),
+                        str(timedelta(seconds=elapsed_time / completed * (len(units) - completed)))))
+        finally:
+            self.pool.close()
+            self.output_writer.close()
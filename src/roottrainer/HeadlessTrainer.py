@@ -0,0 +1,121 @@
+import logging
+
+from game.Faction import Faction
+from game.GameLogic import GameLogic
+from roottrainer.CSVOutputWriter import CSVOutputWriter
+from roottrainer.agents.Agent import Agent
+from roottrainer.agents.AgentFactory import create_agent
+from roottrainer.agents.MCTS import MCTS
+from roottrainer.agents.RolloutPool import RolloutPool
+from utils.random_utils import EYRIE_STREAM, GAME_STREAM, MARQUISE_STREAM, derive_seed, new_seed
+from utils.trace_utils import Tracer
+
+LOGGER = logging.getLogger('trainer_logger')
+PROGRESS_TRACER = Tracer('trainer_logger', 21)
+
+
+def play_game(marquise_agent: Agent, eyrie_agent: Agent, label: str = "", game_config: dict | None = None,
+              seed: int | None = None) -> tuple:
+    """
+    Plays one game between two agents to the end.
+
+    :param label: prefix of the progress log lines
+    :param game_config: `game` section of the config file
+    :param seed: seed of the game, the game and both agents are seeded from it so the game replays bit for bit.
+                 None to leave the agents as they are and seed the game from OS entropy
+    :return: end game data, see `GameLogic.get_end_game_data`
+    """
+    game_logic = GameLogic(game_config, None if seed is None else derive_seed(seed, GAME_STREAM))
+    if seed is not None:
+        marquise_agent.seed(derive_seed(seed, MARQUISE_STREAM))
+        eyrie_agent.seed(derive_seed(seed, EYRIE_STREAM))
+
+    action_count = 0
+    while game_logic.running:
+        if PROGRESS_TRACER.enabled:
+            PROGRESS_TRACER.emit("{}: action_count {}", label, action_count)
+
+        actions = game_logic.get_legal_actions()
+        agent = marquise_agent if game_logic.turn_player == Faction.MARQUISE else eyrie_agent
+        action = agent.choose_action(game_logic.get_state_as_num_array(), actions)
+        action.function()
+
+        action_count += 1
+
+    return game_logic.get_end_game_data()
+
+
+class HeadlessTrainer:
+    """
+    Plays `simulation.round` agent vs agent games back to back, without a window, event loop or frame limiter.
+    Both factions are played by their configured agent, `agent.<faction>.enable` is ignored.
+    Results are written with the same CSV output as RootTrainer.
+    Round `r` is seeded with `derive_seed(simulation.seed, r)`, so any round of a run replays on its own.
+    """
+
+    def __init__(self, config: dict, output_file_stem: str):
+        """
+        :param config: the config file
+        :param output_file_stem: name of the files written by this run, without extension, see `get_output_file_stem`
+        """
+        self.config: dict = config
+
+        self.rollout_pool: RolloutPool | None = None
+        if config['simulation']['multiprocessing']['enable']:
+            self.rollout_pool = RolloutPool(config['simulation']['multiprocessing']['core'])
+            self.rollout_pool.open()  # fork workers before the output file is opened
+
+        self.profile_writer: CSVOutputWriter | None = None
+        if config['simulation']['output'].get('profile'):
+            self.profile_writer = CSVOutputWriter(config['simulation']['output']['dir'])
+            self.profile_writer.open(output_file_stem + "-profile.csv")
+            self.profile_writer.write(['faction', 'decision', 'mcts_type'] + MCTS.get_profile_header())
+
+        self.marquise_agent: Agent = create_agent(Faction.MARQUISE, config['agent']['marquise'], self.rollout_pool,
+                                                  config['game'], self.profile_writer)
+        self.eyrie_agent: Agent = create_agent(Faction.EYRIE, config['agent']['eyrie'], self.rollout_pool,
+                                               config['game'], self.profile_writer)
+
+        self.round_limit: int = config['simulation']['round']
+        self.round: int = 0
+
+        self.seed: int = config['simulation'].get('seed')
+        if self.seed is None:
+            self.seed = new_seed()
+        LOGGER.log(21, "HeadlessTrainer: seed {}".format(self.seed))
+
+        self.output_writer = CSVOutputWriter(config['simulation']['output']['dir'])
+        if config['simulation']['output']['enable']:
+            self.output_writer.open(output_file_stem + ".csv")
+            self.output_writer.write(['winner', 'turn', 'current_player', 'vp_marquise', 'vp_eyrie'])
+
+    def run(self):
+        try:
+            while self.round < self.round_limit:
+                self.round += 1
+                LOGGER.log(21, "Simulating Round {}/{}".format(self.round, self.round_limit))
+
+                winning_faction, _, turns_played, turn_player, vp_marquise, vp_eyrie, _ = self.play_round()
+
+                if self.config['simulation']['output']['enable']:
+                    self.output_writer.write([winning_faction, turns_played, turn_player, vp_marquise, vp_eyrie])
+        finally:
+            self.close()
+
+    def play_round(self) -> tuple:
+        """
+        Plays one game to the end.
+
+        :return: end game data, see `GameLogic.get_end_game_data`
+        """
+        return play_game(self.marquise_agent, self.eyrie_agent, "R{}/{}".format(self.round, self.round_limit),
+                         self.config['game'], derive_seed(self.seed, self.round))
+
+    def close(self):
+        self.marquise_agent.close()
+        self.eyrie_agent.close()
+        if self.profile_writer is not None:
+            self.profile_writer.close()
+        if self.rollout_pool is not None:
+            self.rollout_pool.close()
+
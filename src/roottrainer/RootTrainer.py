@@ -1,6 +1,6 @@
 import logging
+import random
 import sys
-from random import randint
 
 import pygame
 import yaml
@@ -9,12 +9,16 @@ from pygame.time import Clock
 
 from config import Config, Colors
 from game.Faction import Faction
-from game.GameLogic import Action, GameLogic, Game
-from roottrainer.CSVOutputWriter import CSVOutputWriter
+from game.GameLogic import Action, GameLogic
+from render.Game import Game
+from roottrainer.CSVOutputWriter import CSVOutputWriter, get_output_file_stem
 from roottrainer.agents.Agent import Agent
-from roottrainer.agents.MCTSAgent import MCTSAgent
-from roottrainer.agents.RandomDecisionAgent import RandomDecisionAgent
+from roottrainer.agents.AgentFactory import create_agent
+from roottrainer.agents.MCTS import MCTS
+from roottrainer.agents.RolloutPool import RolloutPool
 from utils.draw_utils import draw_text_in_rect
+from utils.random_utils import EYRIE_STREAM, GAME_STREAM, MARQUISE_STREAM, derive_seed, new_seed
+from utils.trace_utils import Tracer
 
 config_path: str = ""
 if len(sys.argv) > 1:
@@ -24,6 +28,7 @@ if config_path == "":
 config = yaml.safe_load(open(config_path))
 
 LOGGER = logging.getLogger('trainer_logger')
+PROGRESS_TRACER = Tracer('trainer_logger', 21)
 
 
 class RootTrainer:
@@ -40,8 +45,13 @@ class RootTrainer:
         self.delta_time: float = 0.0
         self.fps: float = 0.0
 
-        # Game
-        self.game: Game = Game()
+        # Game, round `r` is seeded with `derive_seed(seed, r)` as in HeadlessTrainer
+        self.seed: int = config['simulation'].get('seed')
+        if self.seed is None:
+            self.seed = new_seed()
+        LOGGER.log(21, "RootTrainer: seed {}".format(self.seed))
+        self.rng: random.Random = random.Random(derive_seed(self.seed))  # random arrow
+        self.game: Game = Game(config['game'], derive_seed(derive_seed(self.seed, 0), GAME_STREAM))
 
         # Action Board
         self.action_arrow_pos = Vector2(0, 0)
@@ -56,6 +66,20 @@ class RootTrainer:
         self.reset_arrow()
 
         # Agent
+        self.rollout_pool: RolloutPool | None = None
+        if config['simulation']['multiprocessing']['enable']:
+            self.rollout_pool = RolloutPool(config['simulation']['multiprocessing']['core'])
+            self.rollout_pool.open()  # fork workers before the output file is opened
+
+        # name of the files written by this run, without extension
+        self.output_file_stem: str = get_output_file_stem(config_path, config['simulation']['round'])
+
+        self.profile_writer: CSVOutputWriter | None = None
+        if config['simulation']['output'].get('profile'):
+            self.profile_writer = CSVOutputWriter(config['simulation']['output']['dir'])
+            self.profile_writer.open(self.output_file_stem + "-profile.csv")
+            self.profile_writer.write(['faction', 'decision', 'mcts_type'] + MCTS.get_profile_header())
+
         self.marquise_agent = self.init_agent(Faction.MARQUISE)
         self.eyrie_agent = self.init_agent(Faction.EYRIE)
 
@@ -75,7 +99,7 @@ class RootTrainer:
 
         self.output_writer = CSVOutputWriter(config['simulation']['output']['dir'])
         if config['simulation']['output']['enable']:
-            self.output_writer.open()
+            self.output_writer.open(self.output_file_stem + ".csv")
             self.output_writer.write(['winner', 'turn', 'current_player', 'vp_marquise', 'vp_eyrie'])
 
         self.next_round()
@@ -84,41 +108,8 @@ class RootTrainer:
         pass
 
     def init_agent(self, faction: Faction) -> Agent:
-        match config['agent'][faction.lower()]['type']:
-            case "random":
-                return RandomDecisionAgent(faction)
-            case "mcts":
-                mcts_type = "one-depth"
-                reward_function = "win"
-                expand_count = 100
-                rollout_no = 1
-                time_limit = -1.0
-                action_count_limit = -1
-                best_action_policy = 'max'
-
-                if config['agent'][faction.lower()]['mcts']['type']:
-                    mcts_type = config['agent'][faction.lower()]['mcts']['type']
-
-                if config['agent'][faction.lower()]['mcts']['reward-function']:
-                    reward_function = config['agent'][faction.lower()]['mcts']['reward-function']
-
-                if config['agent'][faction.lower()]['mcts']['expand-count']:
-                    expand_count = config['agent'][faction.lower()]['mcts']['expand-count']
-
-                if config['agent'][faction.lower()]['mcts']['rollout-no']:
-                    rollout_no = config['agent'][faction.lower()]['mcts']['rollout-no']
-
-                if config['agent'][faction.lower()]['mcts']['time-limit']:
-                    time_limit = config['agent'][faction.lower()]['mcts']['time-limit']
-
-                if config['agent'][faction.lower()]['mcts']['action-count-limit']:
-                    action_count_limit = config['agent'][faction.lower()]['mcts']['action-count-limit']
-
-                if config['agent'][faction.lower()]['mcts']['best-action-policy']:
-                    best_action_policy = config['agent'][faction.lower()]['mcts']['best-action-policy']
-
-                return MCTSAgent(faction, mcts_type, reward_function, expand_count, rollout_no, time_limit,
-                                 action_count_limit, best_action_policy)
+        return create_agent(faction, config['agent'][faction.lower()], self.rollout_pool, config['game'],
+                            self.profile_writer)
 
     def run(self):
         while self.running:
@@ -131,8 +122,17 @@ class RootTrainer:
 
             self.delta_time = self.clock.tick(config['simulation']['framerate']) / 1000
 
+        self.close()
         pygame.quit()
 
+    def close(self):
+        self.marquise_agent.close()
+        self.eyrie_agent.close()
+        if self.profile_writer is not None:
+            self.profile_writer.close()
+        if self.rollout_pool is not None:
+            self.rollout_pool.close()
+
     #####
     # Init
     def init(self):
@@ -183,7 +183,8 @@ class RootTrainer:
 
         if self.get_game_logic().running:
             if keys[pygame.K_a] or (not Config.AGENT_REQUIRE_KEY_HOLD):
-                LOGGER.log(21, "R{}/{}: action_count {}".format(self.round, self.round_limit, self.action_count))
+                if PROGRESS_TRACER.enabled:
+                    PROGRESS_TRACER.emit("R{}/{}: action_count {}", self.round, self.round_limit, self.action_count)
                 if self.get_game_logic().turn_player == Faction.MARQUISE and config['agent']['marquise']['enable']:
                     self.execute_agent_action(Faction.MARQUISE)
                 elif self.get_game_logic().turn_player == Faction.EYRIE and config['agent']['eyrie']['enable']:
@@ -227,9 +228,12 @@ class RootTrainer:
         self.fps = self.calculate_fps()
 
     def next_round(self):
+        self.round += 1
+        round_seed = derive_seed(self.seed, self.round)
+        self.marquise_agent.seed(derive_seed(round_seed, MARQUISE_STREAM))
+        self.eyrie_agent.seed(derive_seed(round_seed, EYRIE_STREAM))
         self.new_game()
         self.collected_end_game_data = False
-        self.round += 1
         self.get_actions()
         self.reset_arrow()
         self.action_count = 0
@@ -242,7 +246,7 @@ class RootTrainer:
         self.reset_arrow()
 
         row = len(self.actions)
-        rand = randint(0, row - 1)
+        rand = self.rng.randint(0, row - 1)
 
         self.action_arrow_pos += Vector2(0, rand)
         self.current_action = self.actions[int(self.action_arrow_pos.y)]
@@ -321,7 +325,7 @@ class RootTrainer:
         return self.game
 
     def new_game(self):
-        self.game = Game()
+        self.game = Game(config['game'], derive_seed(derive_seed(self.seed, self.round), GAME_STREAM))
 
     def set_game_state(self, arr: list = None):
         self.game.logic.set_state_from_num_array(arr)
@@ -1,11 +1,23 @@
+import random
+
 from game.Faction import Faction
 from game.GameLogic import Action
 
 
 class Agent:
-    def __init__(self, faction: Faction):
+    def __init__(self, faction: Faction, seed: int | None = None):
+        """
+        :param seed: seed of the random choices of the agent, None to seed from OS entropy
+        """
         self.agent_type: str = "interface"
         self.faction: Faction = faction
+        self.rng: random.Random = random.Random(seed)
+
+    def seed(self, seed: int):
+        """
+        Restarts the random choices of the agent from `seed`, e.g. at the start of each game of a run.
+        """
+        self.rng.seed(seed)
 
     def choose_action(self, state: list, actions: list[Action]) -> Action | None:
         """
@@ -16,3 +28,9 @@ class Agent:
         :return: an action to be executed
         """
         pass
+
+    def close(self):
+        """
+        Releases resources held by the agent at the end of a run.
+        """
+        pass
@@ -0,0 +1,85 @@
+
+from game.Faction import Faction
+from roottrainer.CSVOutputWriter import CSVOutputWriter
+from roottrainer.agents.Agent import Agent
+from roottrainer.agents.MCTSAgent import MCTSAgent
+from roottrainer.agents.RandomDecisionAgent import RandomDecisionAgent
+from roottrainer.agents.RolloutPool import RolloutPool
+
+
+def create_agent(faction: Faction, agent_config: dict, rollout_pool: RolloutPool | None = None,
+                 game_config: dict | None = None, profile_writer: CSVOutputWriter | None = None,
+                 seed: int | None = None) -> Agent:
+    """
+    Builds the agent described by `agent_config`.
+
+    :param faction: faction the agent plays
+    :param agent_config: `agent.<faction>` section of the config file
+    :param rollout_pool: worker pool shared by the agents, None to run single process
+    :param game_config: `game` section of the config file, rules used by the agent's simulations
+    :param profile_writer: opened writer of the per-search profile of MCTS agents, None to not profile
+    :param seed: seed of the agent's random choices and searches, see `Agent.seed`
+    """
+    match agent_config['type']:
+        case "random":
+            return RandomDecisionAgent(faction, seed)
+        case "mcts":
+            mcts_type = "one-depth"
+            reward_function = "win"
+            expand_count = 100
+            rollout_no = 1
+            time_limit = -1.0
+            action_count_limit = -1
+            best_action_policy = 'max'
+            virtual_loss = 1.0
+            snapshot_cache_size = 1024
+            transposition = False
+            tree_reuse = False
+            decision_time_limit = -1.0
+            early_stop = False
+
+            if agent_config['mcts']['type']:
+                mcts_type = agent_config['mcts']['type']
+
+            if agent_config['mcts']['reward-function']:
+                reward_function = agent_config['mcts']['reward-function']
+
+            if agent_config['mcts']['expand-count']:
+                expand_count = agent_config['mcts']['expand-count']
+
+            if agent_config['mcts']['rollout-no'] is not None:
+                rollout_no = agent_config['mcts']['rollout-no']
+                if rollout_no < 1:
+                    raise ValueError("create_agent: rollout-no {}, expected at least 1".format(rollout_no))
+
+            if agent_config['mcts']['time-limit']:
+                time_limit = agent_config['mcts']['time-limit']
+
+            if agent_config['mcts']['action-count-limit']:
+                action_count_limit = agent_config['mcts']['action-count-limit']
+
+            if agent_config['mcts']['best-action-policy']:
+                best_action_policy = agent_config['mcts']['best-action-policy']
+
+            if agent_config['mcts'].get('virtual-loss') is not None:
+                virtual_loss = agent_config['mcts']['virtual-loss']
+
+            if agent_config['mcts'].get('snapshot-cache-size') is not None:
+                snapshot_cache_size = agent_config['mcts']['snapshot-cache-size']
+
+            if agent_config['mcts'].get('transposition') is not None:
+                transposition = agent_config['mcts']['transposition']
+
+            if agent_config['mcts'].get('tree-reuse') is not None:
+                tree_reuse = agent_config['mcts']['tree-reuse']
+
+            if agent_config['mcts'].get('decision-time-limit') is not None:
+                decision_time_limit = agent_config['mcts']['decision-time-limit']
+
+            if agent_config['mcts'].get('early-stop') is not None:
+                early_stop = agent_config['mcts']['early-stop']
+
+            return MCTSAgent(faction, mcts_type, reward_function, expand_count, rollout_no, time_limit,
+                             action_count_limit, best_action_policy, rollout_pool, virtual_loss,
+                             snapshot_cache_size, game_config, transposition, tree_reuse, decision_time_limit,
+                             early_stop, profile_writer, seed)
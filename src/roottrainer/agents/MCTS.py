@@ -1,84 +1,79 @@
 import logging
-import sys
+import random
 import time
-from multiprocessing.pool import MapResult
-from random import randint
-from typing import Union, Tuple
+from contextlib import contextmanager
 
-import yaml
-from pathos.pools import ProcessPool
+import numpy as np
 
 from game.Faction import Faction
-from game.GameLogic import Action, GameLogic
-from roottrainer.agents.MCTSNode import MCTSNode
-
-config_path: str = ""
-if len(sys.argv) > 1:
-    config_path = str(sys.argv[1])
-if config_path == "":
-    config_path = "./config/config.yml"
-config = yaml.safe_load(open(config_path))
+from game.GameLogic import Action, GameLogic, get_action_name
+from game.StateCodec import decode_state, encode_state
+from roottrainer.agents.MCTSNode import MCTSNode, mean_confidence_interval
+from roottrainer.agents.RolloutPool import RolloutPool
+from roottrainer.agents.SearchProfiler import SearchProfiler
+from roottrainer.agents.SnapshotCache import SnapshotCache
+from utils.random_utils import SEED_BOUND, derive_seed
+from utils.trace_utils import Tracer
 
 LOGGER = logging.getLogger('mcts_logger')
+TRACER = Tracer('mcts_logger')
+INFO_TRACER = Tracer('mcts_logger', logging.INFO)
 
+EARLY_STOP_MIN_SAMPLES: int = 5  # backpropagations a root child needs before its confidence interval is trusted
+EARLY_STOP_CHECK_INTERVAL: int = 10  # iterations between two confidence interval checks
+EARLY_STOP_REWARD_BOUNDS: dict[str, int] = {'win': 1, 'vp-difference-bin': 1}  # max |reward| of one rollout
 
-def show_action(a: Union[Action, Tuple[int, int, Action]]):
-    if isinstance(a, Action):
-        return a.name
-    else:
-        return a[0], a[1], a[2].name
 
+def show_action(action_id: int) -> str:
+    return get_action_name(action_id)
 
-def exec_seq_actions(node: MCTSNode, game_logic: GameLogic):
-    LOGGER.debug(
-        "expand_and_select_node:execute_actions: len(seq_actions) {}, seq_actions {}".format(len(node.seq_actions),
-                                                                                             [show_action(a) for a in
-                                                                                              node.seq_actions]))
 
-    for seq_action in node.seq_actions:
-        actions: list[Action] = game_logic.get_legal_actions()
-        LOGGER.debug("expand_and_select_node:execute_actions: seq_action {}".format(show_action(seq_action)))
+def exec_seq_actions(node: MCTSNode, game_logic: GameLogic, start: int = 0) -> str:
+    """
+    Replays `node.seq_actions` on `game_logic`, skipping the first `start` actions already applied to it.
+    The forced moves following each action are played too, a node stands for the next state with a choice
+    or a dice roll, see `GameLogic.advance_forced_moves`.
 
-        legal_action: Action | None = None
+    :return: turn player right after the last action, before its forced moves. Scores of the node are seen
+             from this player, as they were when every forced move had a node of its own
+    """
+    if TRACER.enabled:
+        TRACER.emit("expand_and_select_node:execute_actions: len(seq_actions) {}, start {}, seq_actions {}",
+                    len(node.seq_actions), start, [show_action(a) for a in node.seq_actions])
 
-        if isinstance(seq_action, Action):
-            for action in actions:
-                if seq_action == action:
-                    legal_action = action
-                    break
-        else:
-            attacker_roll = seq_action[0]
-            defender_roll = seq_action[1]
+    turn_player = game_logic.turn_player
+    for action_id in node.seq_actions[start:]:
+        if TRACER.enabled:
+            TRACER.emit("expand_and_select_node:execute_actions: seq_action {}", show_action(action_id))
 
-            game_logic.set_dice_values(attacker_roll, defender_roll)
+        if not game_logic.apply(action_id):
+            if TRACER.enabled:
+                TRACER.emit("expand_and_select_node:execute_actions: no matching legal action for {}",
+                            show_action(action_id))
+            break
+        turn_player = game_logic.turn_player
+        game_logic.advance_forced_moves(stop_at_dice_roll=True)
 
-            legal_action = actions[0]
+    return turn_player
 
-        if legal_action:
-            LOGGER.debug("expand_and_select_node:execute_actions: exec {}".format(legal_action.name))
-            legal_action.function()
-        else:
-            LOGGER.debug(
-                "expand_and_select_node:execute_actions: no matching legal action for {}".format(seq_action.name))
-            break
 
+def execute_random_action(game: GameLogic, rng: random.Random) -> int:
+    """
+    Executes a random legal action and the forced moves following it.
 
-def execute_random_action(game: GameLogic):
-    actions = game.get_legal_actions()
-    if len(actions) > 1:
-        rand = randint(0, len(actions) - 1)
-    elif len(actions) == 1:
-        rand = 0
-    else:
-        rand = 0
-        LOGGER.error("execute_random_action: len(actions) == {}".format(len(actions)))
-    actions[rand].function()
+    :param rng: random stream of the playout, picks the action
+    :return: number of actions executed
+    """
+    action = game.sample_random_action(rng)
+    if action is None:
+        LOGGER.error("execute_random_action: len(actions) == 0")
+        return 0
+    action.function()
+    return 1 + game.advance_forced_moves()
 
 
 def reward_function(game: GameLogic, root_state: list, reward_function_type: str) -> int:
-    root_game = GameLogic()
-    root_game.set_state_from_num_array(root_state)
-    current_player = root_game.turn_player
+    current_player = Faction.MARQUISE if root_state[3] == 1 else Faction.EYRIE  # turn player, see get_state_as_num_array
 
     winning_faction, \
         winning_condition, \
@@ -111,38 +106,67 @@ def reward_function(game: GameLogic, root_state: list, reward_function_type: str
 
 
 def exec_random_actions(process_id: int, game: GameLogic, reward_function_type: str, root_state: list,
-                        time_limit: float, action_count_limit: int, rewards: dict[int] = None):
-    acc_time: float = 0
+                        time_limit: float, action_count_limit: int, rewards: dict[int] = None, seed: int | None = None):
+    """
+    Plays one random playout on `game`, its actions, shuffles and dice are drawn from `seed`.
+    """
+    rng = random.Random(seed)
+    game.seed(rng.randrange(SEED_BOUND))
+    acc_time: float = 0  # ms, same unit as time_limit
     time_0 = time.time()
     action_count: int = 0
 
     while game.running:
         time_1 = time.time()
-        delta_time = time_0 - time_1
+        delta_time = (time_1 - time_0) * 1000
         acc_time += delta_time
         if time_limit > 0:
             if acc_time >= time_limit:
-                LOGGER.debug("rollout: BREAK time limit")
+                if TRACER.enabled:
+                    TRACER.emit("rollout: BREAK time limit")
                 break
 
         if action_count_limit > 0:
             if action_count >= action_count_limit:
-                LOGGER.debug("rollout: BREAK action count limit")
+                if TRACER.enabled:
+                    TRACER.emit("rollout: BREAK action count limit")
                 break
 
-        execute_random_action(game)
-        action_count += 1
+        executed = execute_random_action(game, rng)
+        if executed == 0:
+            break
+        action_count += executed
         time_0 = time_1
 
     return reward_function(game, root_state, reward_function_type)
 
 
+def exec_random_actions_from_bytes(process_id: int, state: bytes, game_config: dict | None, reward_function_type: str,
+                                   root_state: bytes, time_limit: float, action_count_limit: int,
+                                   seed: int | None = None):
+    """
+    `exec_random_actions` on states encoded by `GameLogic.to_bytes`, sent to the workers instead of a pickled game
+    and num array.
+    """
+    return exec_random_actions(process_id, GameLogic.from_bytes(state, game_config), reward_function_type,
+                               decode_state(root_state), time_limit, action_count_limit, seed=seed)
+
+
 class MCTS:
     def __init__(self, state: list, actions: list[Action], reward_function: str,
                  expand_count: int, rollout_no: int,
-                 time_limit: float, action_count_limit: int, best_action_policy='max', depth_limit: int = 1):
+                 time_limit: float, action_count_limit: int, best_action_policy='max', depth_limit: int = 1,
+                 rollout_pool: RolloutPool | None = None, snapshot_cache_size: int = 1024,
+                 game_config: dict | None = None, transposition: bool = False, decision_time_limit: float = -1.0,
+                 early_stop: bool = False, profile: bool = False, seed: int | None = None):
         self.root: MCTSNode = MCTSNode(0, None, None, None)
         self.root_state: list = state
+        self.game_config: dict | None = game_config
+        # seeds the root snapshot and every rollout, the whole search replays from it
+        self.rng: random.Random = random.Random(seed)
+        self.root.snapshot = self.get_game_logic_at_root_state()
+        self.root.snapshot.get_legal_action_ids()  # kept for the replays, a frame drops what is cached inside it
+        self.snapshot_cache: SnapshotCache = SnapshotCache(snapshot_cache_size)
         self.reward_function_type = reward_function
         self.expand_count: int = expand_count
         self.rollout_no: int = rollout_no
@@ -150,135 +174,352 @@ class MCTS:
         self.depth_limit: int = depth_limit
         self.best_action_policy = best_action_policy
         self.action_count_limit: int = action_count_limit
+        self.rollout_pool: RolloutPool | None = rollout_pool
+        self.virtual_loss: float = 0.0
+
+        # per-decision budget in ms, replaces expand_count when positive, see has_budget
+        self.decision_time_limit: float = decision_time_limit
+        self.iterations: int = 0
+        self.search_time: float = 0.0
+        self.early_stop: bool = early_stop  # stop as soon as the root decision is settled, see is_settled
+        self.profiler: SearchProfiler = SearchProfiler(profile)  # phases of the last search, see get_profile_row
+
+        # state hash -> first node that reached it, only in transposition mode, see add_expanded_node
+        self.transposition_table: dict[int, MCTSNode] | None = None
+        if transposition:
+            self.transposition_table = {self.root.snapshot.get_zobrist_hash(): self.root}
+        self.selected_path: list[MCTSNode] = []
+
+        self.best_action_id: int | None = None  # action of the last choose_best_action, see reroot
 
     def get_game_logic_at_root_state(self) -> GameLogic:
-        game_logic: GameLogic = GameLogic()
+        game_logic: GameLogic = GameLogic(self.game_config, self.rng.randrange(SEED_BOUND))
         game_logic.set_state_from_num_array(self.root_state)
         return game_logic
 
+    def reroot(self, state: list) -> bool:
+        """
+        Moves the root to the child reached by the last chosen action, so the next search adds its budget on top of
+        the statistics already gathered below that child. After a dice roll, this is the child with the rolled dice.
+        Nodes keep their seq_actions from the first root, replays start at the depth of the new root.
+
+        :param state: state of the next decision
+        :return: False if no such child has `state`, the tree is left untouched
+        """
+        game_logic: GameLogic = GameLogic(self.game_config, self.rng.randrange(SEED_BOUND))
+        game_logic.set_state_from_num_array(state)
+        state_hash: int = game_logic.get_zobrist_hash()
+
+        for action, child in self.root.children:
+            if action.action_id != self.best_action_id:
+                continue
+            with self.borrow_game_logic_at_node(child) as child_game_logic:
+                if child_game_logic.get_zobrist_hash() != state_hash:
+                    continue
+
+            if INFO_TRACER.enabled:
+                INFO_TRACER.emit("reroot: reusing {} with {} tries",
+                                 [show_action(a) for a in child.seq_actions], child.tries)
+            self.snapshot_cache.remove(child)
+            child.parent = None
+            child.compact_pool()
+            child.snapshot = game_logic
+            child.turn_player = game_logic.turn_player  # rewards are seen from the root player, see reward_function
+            self.root = child
+            self.root_state = state
+            if self.transposition_table is not None:
+                self.transposition_table = {state_hash: child}
+            return True
+
+        return False
+
+    @contextmanager
+    def borrow_game_logic_at_node(self, node: MCTSNode):
+        """
+        Materializes the state at `node` on the snapshot of its nearest cached ancestor (the root at worst), between
+        a `GameLogic.push` and `pop`, then caches a snapshot of `node` itself. The borrowed game must not outlive the
+        `with` block, use `get_game_logic_at_node` for a copy to mutate.
+        """
+        ancestor: MCTSNode = node
+        while ancestor.snapshot is None:
+            ancestor = ancestor.parent
+        self.snapshot_cache.touch(ancestor)
+
+        game_logic: GameLogic = ancestor.snapshot
+        self.profiler.start('replay')
+        game_logic.push()
+        try:
+            turn_player = exec_seq_actions(node, game_logic, ancestor.depth)
+
+            if node.turn_player is None:
+                node.turn_player = turn_player
+            if ancestor is not node:
+                self.snapshot_cache.put(node, game_logic.clone())
+            self.profiler.stop()
+
+            yield game_logic
+        finally:
+            self.profiler.start('replay', 0)
+            game_logic.pop()
+            self.profiler.stop()
+
     def get_game_logic_at_node(self, node: MCTSNode) -> GameLogic:
-        game_logic: GameLogic = self.get_game_logic_at_root_state()
-        exec_seq_actions(node, game_logic)
-        return game_logic
+        """
+        :return: the state at `node`, a private copy the caller may mutate
+        """
+        with self.borrow_game_logic_at_node(node) as game_logic:
+            return game_logic.clone()
+
+    def get_turn_player_at_node(self, node: MCTSNode) -> str:
+        if node.turn_player is None:
+            with self.borrow_game_logic_at_node(node):
+                pass
+        return node.turn_player
 
     def expand_and_select_node(self, round):
         current: MCTSNode = self.root
+        self.selected_path = [current]
         while not current.terminal_flag:
             if not current.is_fully_expanded():
-                LOGGER.info("{}:expand_and_select_node:expand {}".format(round, [show_action(a) for a in
-                                                                                 current.seq_actions]))
+                if INFO_TRACER.enabled:
+                    INFO_TRACER.emit("{}:expand_and_select_node:expand {}",
+                                     round, [show_action(a) for a in current.seq_actions])
+                self.profiler.start('expansion')
+                roll_dice_state = False
                 if current.untried_actions is None:
-                    game: GameLogic = GameLogic()
-                    game.set_state_from_num_array(self.root_state)
-                    exec_seq_actions(current, game)
-                    current.untried_actions = game.get_legal_actions()
-
-                    if game.sub_phase == 40007:
-                        return current.expand(True, game.attacker_roll,
-                                              game.defender_roll)  # check if state is roll dice state.
-
-                return current.expand()  # check if state is roll dice state.
+                    with self.borrow_game_logic_at_node(current) as game:
+                        current.untried_actions = game.get_legal_actions()  # only their ids are used
+                        roll_dice_state = game.sub_phase == 40007
+                        attacker_roll, defender_roll = game.attacker_roll, game.defender_roll
+
+                if roll_dice_state:
+                    child = self.add_expanded_node(
+                        current, current.expand(True, attacker_roll,
+                                                defender_roll))  # check if state is roll dice state.
+                else:
+                    child = self.add_expanded_node(current, current.expand())  # check if state is roll dice state.
+                self.profiler.stop()
+                return child
             else:
-                (_, best_child) = current.choose_best_child('UCB')
-                LOGGER.info("{}:expand_and_select_node:select best child {}".format(round, [show_action(a) for a in
-                                                                                            best_child.seq_actions]))
+                (_, best_child) = current.choose_best_child('UCB', virtual_loss=self.virtual_loss)
+                if INFO_TRACER.enabled:
+                    INFO_TRACER.emit("{}:expand_and_select_node:select best child {}",
+                                     round, [show_action(a) for a in best_child.seq_actions])
                 current = best_child
+                self.selected_path.append(current)
         return current
 
-    def rollout(self, node: MCTSNode) -> int:
+    def add_expanded_node(self, parent: MCTSNode, child: MCTSNode) -> MCTSNode:
+        """
+        Ends the selected path with a newly expanded child. In transposition mode, a child whose state was already
+        reached through another order of actions is replaced by the existing node, which then has several parents
+        and shares its statistics between them.
+        """
+        if self.transposition_table is not None and not child.roll_dice_state:
+            with self.borrow_game_logic_at_node(child) as game_logic:
+                state_hash: int = game_logic.get_zobrist_hash()
+            transposed: MCTSNode = self.transposition_table.setdefault(state_hash, child)
+
+            if transposed is not child and transposed not in self.selected_path:  # no cycles
+                if INFO_TRACER.enabled:
+                    INFO_TRACER.emit("add_expanded_node: {} transposes to {}",
+                                     [show_action(a) for a in child.seq_actions],
+                                     [show_action(a) for a in transposed.seq_actions])
+                parent.replace_last_child(transposed)
+                child = transposed
+
+        self.selected_path.append(child)
+        return child
 
-        game_logic = GameLogic()
-        game_logic.set_state_from_num_array(self.root_state)
+    def rollout(self, node: MCTSNode) -> int:
+        with self.borrow_game_logic_at_node(node) as game_logic:  # playouts run on clones, see rollout_from
+            return self.rollout_from(game_logic)
 
-        exec_seq_actions(node, game_logic)
+    def rollout_from(self, game_logic: GameLogic) -> int:
+        # playout i is seeded by derive_seed(seed, i) on both paths, so the pool does not change the rewards
+        seed = self.rng.randrange(SEED_BOUND)
+        seeds = [derive_seed(seed, i) for i in range(self.rollout_no)]
 
         # Multicore / Single core Simulation
-        if config['simulation']['multiprocessing']['enable']:
+        if self.rollout_pool is not None:
             start_time = time.time()
 
-            core_count: int = config['simulation']['multiprocessing']['core']
-            LOGGER.info("rollout: multiprocessing with {} cores".format(core_count))
+            if INFO_TRACER.enabled:
+                INFO_TRACER.emit("rollout: multiprocessing with {} cores", self.rollout_pool.core_count)
 
-            pool: ProcessPool = ProcessPool(core_count)
-            rewards: MapResult = pool.amap(
-                exec_random_actions, [i for i in range(self.rollout_no)],
-                [game_logic] * self.rollout_no,
+            state = game_logic.to_bytes()  # a few hundred bytes instead of a pickled game, see StateCodec
+            rewards: list[int] = self.rollout_pool.map(
+                exec_random_actions_from_bytes, [i for i in range(self.rollout_no)],
+                [state] * self.rollout_no,
+                [self.game_config] * self.rollout_no,
                 [self.reward_function_type] * self.rollout_no,
-                [self.root_state] * self.rollout_no,
+                [encode_state(self.root_state)] * self.rollout_no,
                 [self.time_limit] * self.rollout_no,
-                [self.action_count_limit] * self.rollout_no)
-            while not rewards.ready():
-                time.sleep(0.00001)
+                [self.action_count_limit] * self.rollout_no,
+                seeds)
             end_time = time.time()
-            LOGGER.info("rollout: multiprocessing with {} cores: finished in {} s"
-                        .format(core_count, end_time - start_time))
-            return sum(rewards.get(0.00001))
+            if INFO_TRACER.enabled:
+                INFO_TRACER.emit("rollout: multiprocessing with {} cores: finished in {} s",
+                                 self.rollout_pool.core_count, end_time - start_time)
+            return sum(rewards)
         else:
             start_time = time.time()
 
-            LOGGER.info("rollout: running on single process")
+            if INFO_TRACER.enabled:
+                INFO_TRACER.emit("rollout: running on single process")
 
-            rewards: dict = {}
+            rewards: list[int] = []
             for i in range(self.rollout_no):
-                rewards[i] = exec_random_actions(
-                    i, game_logic, self.reward_function_type, self.root_state,
-                    self.time_limit, self.action_count_limit)
+                rewards.append(exec_random_actions(
+                    i, game_logic.clone(), self.reward_function_type, self.root_state,
+                    self.time_limit, self.action_count_limit, seed=seeds[i]))
             end_time = time.time()
-            LOGGER.info("rollout: running on single process: finished in {} s"
-                        .format(end_time - start_time))
-            return sum(rewards.values())
+            if INFO_TRACER.enabled:
+                INFO_TRACER.emit("rollout: running on single process: finished in {} s", end_time - start_time)
+            return sum(rewards)
 
     def backpropagation(self, node: MCTSNode, reward: int):
-
-        node.tries += self.rollout_no
-
-        actual_reward: int = reward
-
-        game_logic_root: GameLogic = self.get_game_logic_at_root_state()
-        game_logic: GameLogic = self.get_game_logic_at_node(node)
-
-        if game_logic_root.turn_player != game_logic.turn_player:
-            actual_reward = -reward
-
-        node.score += actual_reward
-        node.score_list.append(actual_reward)
-
-        LOGGER.debug(
-            "backpropagation: actual_reward {}, wins/tries {}/{}".format(actual_reward, node.score, node.tries))
-
-        if node.parent:
-            self.backpropagation(node.parent, reward)
+        path: list[MCTSNode] = []
+        while node:
+            path.append(node)
+            node = node.parent
+        path.reverse()
+
+        self.backpropagation_path(path, reward)
+
+    def backpropagation_path(self, path: list[MCTSNode], reward: int):
+        """
+        Backpropagation along the selected path instead of the parent links, used in transposition mode
+        where a node can be reached from more than one parent.
+        """
+        root_turn_player = self.get_turn_player_at_node(self.root)
+        actual_rewards: list[int] = [
+            reward if self.get_turn_player_at_node(node) == root_turn_player else -reward for node in reversed(path)]
+        self.root.pool.add_results([node.index for node in reversed(path)], self.rollout_no, actual_rewards)
+
+        if TRACER.enabled:
+            TRACER.emit("backpropagation: actual_rewards {}, wins/tries {}/{}",
+                        actual_rewards, path[-1].score, path[-1].tries)
+
+    def has_budget(self, iteration: int, start_time: float) -> bool:
+        """
+        With a decision time limit, iterations run until it is spent, at least one so the root has a child to choose.
+        Otherwise `expand_count` iterations are run.
+        """
+        if self.decision_time_limit > 0:
+            return iteration == 0 or (time.perf_counter() - start_time) * 1000 < self.decision_time_limit
+        return iteration < self.expand_count
+
+    def is_settled(self, iteration: int) -> bool:
+        """
+        True once more iterations cannot change the root decision. Either the best child by `best_action_policy`
+        can no longer be overtaken in the remaining `expand_count` iterations ('robust' and 'max' only, bounded
+        rewards only), or the confidence interval of its mean reward is above those of all other children.
+        Never before every root action has been tried.
+
+        :param iteration: iterations run so far
+        """
+        if not self.root.is_fully_expanded() or len(self.root.children) < 2:
+            return False
+        pool = self.root.pool
+        rows = self.root.get_child_rows()
+        tries, score, samples = pool.tries[rows], pool.score[rows], pool.samples[rows]
+
+        # one iteration updates one root child by rollout_no tries and at most rollout_no * bound score,
+        # except in transposition mode where a path can pass through several root children
+        if self.decision_time_limit <= 0 and self.transposition_table is None:
+            remaining_rollouts = (self.expand_count - iteration) * self.rollout_no
+            if self.best_action_policy == 'robust':
+                second, first = np.sort(tries)[-2:]
+                if first - second > remaining_rollouts:
+                    return True
+            elif self.best_action_policy == 'max' and self.reward_function_type in EARLY_STOP_REWARD_BOUNDS:
+                second, first = np.sort(score)[-2:]
+                if first - second > remaining_rollouts * EARLY_STOP_REWARD_BOUNDS[self.reward_function_type]:
+                    return True
+
+        if iteration % EARLY_STOP_CHECK_INTERVAL != 0 or samples.min() < EARLY_STOP_MIN_SAMPLES:
+            return False
+        # same scale as the intervals: one summed reward of rollout_no rollouts per backpropagation
+        mean, lower, upper = mean_confidence_interval(samples, score, pool.score_sq[rows])
+        best = np.argmax(mean)
+        others = np.arange(len(rows)) != best
+        policy_key = {'robust': tries, 'max': score}.get(self.best_action_policy)
+        if policy_key is not None and (policy_key[others] >= policy_key[best]).any():
+            return False  # the policy would not choose the separated child yet
+        return bool((upper[others] < lower[best]).all() and (mean[others] < lower[best]).all())
+
+    def end_search(self, iterations: int, start_time: float):
+        self.iterations = iterations
+        self.search_time = time.perf_counter() - start_time
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("run_mcts: {} iterations in {} s, {} iterations/s", self.iterations, self.search_time,
+                             self.iterations / self.search_time if self.search_time > 0 else 0.0)
+
+    @staticmethod
+    def get_profile_header() -> list[str]:
+        return ['iterations', 'search_time', 'iterations_per_s', 'tree_size', 'max_depth'] + \
+            SearchProfiler.get_header()
+
+    def get_profile_row(self) -> list:
+        """
+        :return: profile of the last search, in the order of `get_profile_header`. Tree size and depth are those of
+                 the whole tree below the root, including the nodes reused from earlier searches
+        """
+        nodes: list[MCTSNode] = self.root.get_subtree_nodes()
+        return [self.iterations, self.search_time,
+                self.iterations / self.search_time if self.search_time > 0 else 0.0,
+                len(nodes), max(node.depth for node in nodes) - self.root.depth] + self.profiler.get_row()
 
     def run_mcts(self):
-
-        game: GameLogic = GameLogic()
-        game.set_state_from_num_array(self.root_state)
-
-        for i in range(self.expand_count):
+        self.profiler.reset()
+        start_time = time.perf_counter()
+        i = 0
+        while self.has_budget(i, start_time):
             # Selection & Expansion
-            LOGGER.info("{}:run_mcts: expand_and_select_node".format(i))
+            if INFO_TRACER.enabled:
+                INFO_TRACER.emit("{}:run_mcts: expand_and_select_node", i)
+            self.profiler.start('selection')
             selected_node = self.expand_and_select_node(i)
+            self.profiler.stop()
             # Rollout
-            LOGGER.info("{}:rollout".format(i))
-            LOGGER.info("{}".format(selected_node))
+            if INFO_TRACER.enabled:
+                INFO_TRACER.emit("{}:rollout {}", i, selected_node)
+            self.profiler.start('rollout')
             reward = self.rollout(selected_node)
+            self.profiler.stop()
             # Backpropagation
-            LOGGER.info("{}:backpropagation".format(i))
-            self.backpropagation(selected_node, reward)
+            if INFO_TRACER.enabled:
+                INFO_TRACER.emit("{}:backpropagation", i)
+            self.profiler.start('backpropagation')
+            if self.transposition_table is not None:
+                self.backpropagation_path(self.selected_path, reward)
+            else:
+                self.backpropagation(selected_node, reward)
+            self.profiler.stop()
+
+            i += 1
+            if self.early_stop and self.is_settled(i):
+                if INFO_TRACER.enabled:
+                    INFO_TRACER.emit("{}:run_mcts: root decision settled, early stop", i)
+                break
+
+        self.end_search(i, start_time)
 
     def choose_best_action(self, actions: list[Action]) -> Action:
         best_action_sim, best_node = self.root.choose_best_child(self.best_action_policy)
-        LOGGER.info("best_action_sim: action {}".format(best_action_sim.name))
-        best_action: Action | None = None
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("best_action_sim: action {}", best_action_sim.name)
+        self.best_action_id = best_action_sim.action_id
 
-        LOGGER.info("choose_best_action: actions {} {}".format(len(actions), [a.name for a in actions]))
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("choose_best_action: actions {} {}", len(actions), [a.name for a in actions])
 
-        for action in actions:
-            if best_action_sim == action:
-                best_action = action
-                break
+        best_action: Action | None = next(
+            (action for action in actions if action.action_id == best_action_sim.action_id), None)  # same as apply
 
-        LOGGER.info(
-            "choose_best_action: best_action_sim {}, best_action {}".format(best_action_sim.name, best_action.name))
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("choose_best_action: best_action_sim {}, best_action {}",
+                             best_action_sim.name, best_action.name)
 
         return best_action if best_action else None
@@ -2,17 +2,28 @@ import logging
 
 from game.Faction import Faction
 from game.GameLogic import Action
+from roottrainer.CSVOutputWriter import CSVOutputWriter
 from roottrainer.agents.Agent import Agent
 from roottrainer.agents.MCTS import MCTS
 from roottrainer.agents.OneDepthMCTS import MCTSOneDepth
+from roottrainer.agents.RootParallelMCTS import RootParallelMCTS
+from roottrainer.agents.TreeParallelMCTS import TreeParallelMCTS
+from roottrainer.agents.RolloutPool import RolloutPool
+from utils.random_utils import SEED_BOUND
+from utils.trace_utils import Tracer
 
 LOGGER = logging.getLogger('mcts_logger')
+INFO_TRACER = Tracer('mcts_logger', logging.INFO)
 
 
 class MCTSAgent(Agent):
     def __init__(self, faction: Faction, mcts_type: str, reward_function: str, expand_count: int, rollout_no: int,
-                 time_limit: float, action_count_limit: int, best_action_policy: str):
-        super().__init__(faction)
+                 time_limit: float, action_count_limit: int, best_action_policy: str,
+                 rollout_pool: RolloutPool | None = None, virtual_loss: float = 1.0, snapshot_cache_size: int = 1024,
+                 game_config: dict | None = None, transposition: bool = False, tree_reuse: bool = False,
+                 decision_time_limit: float = -1.0, early_stop: bool = False,
+                 profile_writer: CSVOutputWriter | None = None, seed: int | None = None):
+        super().__init__(faction, seed)
         self.agent_type: str = "mcts"
         self.mcts_type: str = mcts_type
         self.reward_function: str = reward_function
@@ -21,23 +32,101 @@ class MCTSAgent(Agent):
         self.time_limit: float = time_limit
         self.action_count_limit: int = action_count_limit
         self.best_action_policy: str = best_action_policy
-        LOGGER.info(
-            "MCTSAgent:__init__: type {}, reward_function {}, expand_count {}, rollout_no {}, time_limit {}, action_count_limit {}, best action policy {}"
-            .format(mcts_type, reward_function, expand_count, rollout_no, time_limit, action_count_limit,
-                    best_action_policy))
+        self.rollout_pool: RolloutPool | None = rollout_pool
+        self.virtual_loss: float = virtual_loss
+        self.snapshot_cache_size: int = snapshot_cache_size
+        self.game_config: dict | None = game_config
+        self.transposition: bool = transposition
+        self.tree_reuse: bool = tree_reuse
+        self.mcts: MCTS | None = None  # tree of the last decision, kept when tree_reuse is set
+        self.decision_time_limit: float = decision_time_limit
+        self.early_stop: bool = early_stop
+        # one row per search of an MCTS tree, see MCTS.get_profile_row, None to not profile
+        self.profile_writer: CSVOutputWriter | None = profile_writer
+
+        self.decision_count: int = 0
+        self.total_iterations: int = 0
+        self.total_search_time: float = 0.0
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("MCTSAgent:__init__: type {}, reward_function {}, expand_count {}, rollout_no {}, "
+                             "time_limit {}, action_count_limit {}, best action policy {}",
+                             mcts_type, reward_function, expand_count, rollout_no, time_limit, action_count_limit,
+                             best_action_policy)
 
     def choose_action(self, state: list, actions: list[Action]) -> Action:
+        if len(actions) == 1:
+            return self.choose_forced_action(state, actions[0])
+
+        if self.mcts is not None and self.mcts.reroot(state):
+            mcts = self.mcts
+        else:
+            mcts = self.create_mcts(state, actions)
+
+        mcts.run_mcts()
+        best_action = mcts.choose_best_action(actions)
+
+        if not isinstance(mcts, MCTSOneDepth):
+            self.decision_count += 1
+            self.total_iterations += mcts.iterations
+            self.total_search_time += mcts.search_time
+
+        if self.profile_writer is not None and isinstance(mcts, MCTS):
+            self.profile_writer.write([self.faction, self.decision_count, self.mcts_type] + mcts.get_profile_row())
+
+        if self.tree_reuse and isinstance(mcts, MCTS):  # one-depth and root-parallel trees are not reused
+            self.mcts = mcts
+
+        return best_action
+
+    def seed(self, seed: int):
+        super().seed(seed)
+        self.mcts = None  # a kept tree searches on with the stream of the previous seed
+
+    def choose_forced_action(self, state: list, action: Action) -> Action:
+        """
+        Plays the only legal action without searching. A kept tree is moved along when `state` has a node of its
+        own (a dice roll), so the next decision can still reuse the subtree below `action`. Other forced moves are
+        part of the node of the action before them, the tree is kept as it is.
+        """
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("choose_action: forced action {}, search skipped", action.name)
+        if self.mcts is not None and self.mcts.reroot(state):
+            self.mcts.best_action_id = action.action_id
+        return action
+
+    def create_mcts(self, state: list, actions: list[Action]) -> MCTS | RootParallelMCTS | MCTSOneDepth:
+        seed = self.rng.randrange(SEED_BOUND)  # every search draws from a stream of its own
         match self.mcts_type:
             case "one-depth":
                 mcts = MCTSOneDepth(state, actions,
-                                    self.reward_function, self.rollout_no, self.time_limit)
+                                    self.reward_function, self.rollout_no, self.time_limit, self.game_config, seed)
+            case "root-parallel":
+                mcts = RootParallelMCTS(state, actions, self.reward_function, self.expand_count, self.rollout_no,
+                                        self.time_limit, self.action_count_limit, self.best_action_policy,
+                                        rollout_pool=self.rollout_pool, game_config=self.game_config,
+                                        decision_time_limit=self.decision_time_limit, seed=seed)
+            case "tree-parallel":
+                mcts = TreeParallelMCTS(state, actions, self.reward_function, self.expand_count, self.rollout_no,
+                                        self.time_limit, self.action_count_limit, self.best_action_policy,
+                                        rollout_pool=self.rollout_pool, snapshot_cache_size=self.snapshot_cache_size,
+                                        virtual_loss=self.virtual_loss, game_config=self.game_config,
+                                        decision_time_limit=self.decision_time_limit, early_stop=self.early_stop,
+                                        profile=self.profile_writer is not None, seed=seed)
             case _:
                 mcts = MCTS(state, actions, self.reward_function, self.expand_count, self.rollout_no, self.time_limit,
-                            self.action_count_limit, self.best_action_policy)
+                            self.action_count_limit, self.best_action_policy, rollout_pool=self.rollout_pool,
+                            snapshot_cache_size=self.snapshot_cache_size, game_config=self.game_config,
+                            transposition=self.transposition, decision_time_limit=self.decision_time_limit,
+                            early_stop=self.early_stop, profile=self.profile_writer is not None, seed=seed)
 
-        mcts.run_mcts()
-
-        return mcts.choose_best_action(actions)
+        return mcts
 
     def run_mcts(self, state: list, actions: list[Action]) -> Action:  # TODO
         pass
+
+    def close(self):
+        if self.decision_count == 0:
+            return
+        LOGGER.log(21, "MCTSAgent:close: {} {} decisions, {} iterations in {} s, {} iterations/s".format(
+            self.faction, self.decision_count, self.total_iterations, self.total_search_time,
+            self.total_iterations / self.total_search_time if self.total_search_time > 0 else 0.0))
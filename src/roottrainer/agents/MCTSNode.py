@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import logging
-from typing import Union
+from array import array
 
 import numpy as np
 import scipy.stats as st
 
-from game.GameLogic import Action
+from game.GameLogic import Action, GameLogic, encode_dice_roll, get_action_name
+from roottrainer.agents.NodePool import NodePool
+from utils.trace_utils import Tracer
 
-LOGGER = logging.getLogger('mcts_logger')
+TRACER = Tracer('mcts_logger')
+INFO_TRACER = Tracer('mcts_logger', logging.INFO)
 
 
 def map_dice_roll_to_child(d1, d2):
@@ -18,105 +21,163 @@ def map_dice_roll_to_child(d1, d2):
     return f[max(d1, d2)] + g[min(d1, d2)]
 
 
-def mean_confidence_interval(data, confidence=0.95):
-    if len(data) == 1:  # approximation error
-        m = data[0]
-        h = (1 - confidence) * m
-        return m, m - h, m + h
-    elif len(data) == 0:
-        return float('-inf'), float('-inf'), float('-inf')
-    else:  # confidence interval
-        a = 1.0 * np.array(data)
-        n = len(a)
-        m, se = np.mean(a), st.sem(a)
-        h = se * st.t.ppf((1 + confidence) / 2., n - 1)
-        return m, m - h, m + h
+def mean_confidence_interval(samples, total, total_sq, confidence=0.95):
+    """
+    Mean and confidence interval bounds of the rewards backpropagated to nodes, from their count, sum and sum of
+    squares (see NodePool). Vectorized over arrays of nodes.
+
+    :return: mean, lower bound, upper bound
+    """
+    samples = np.asarray(samples, dtype=float)
+    total = np.asarray(total, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        m = total / samples
+        variance = np.maximum(np.asarray(total_sq, dtype=float) - total * m, 0) / (samples - 1)
+        h = np.sqrt(variance / samples) * st.t.ppf((1 + confidence) / 2., samples - 1)  # confidence interval
+    h = np.where(samples == 1, (1 - confidence) * m, h)  # approximation error
+    m = np.where(samples == 0, float('-inf'), m)
+    h = np.where(samples == 0, 0, h)
+    return m, m - h, m + h
 
 
 class MCTSNode:
-    def __init__(self, depth: int = 0, parent: MCTSNode = None, prev_actions: list[Action] = None,
+    def __init__(self, depth: int = 0, parent: MCTSNode = None, prev_actions: array = None,
                  untried_actions: list[Action] = None, roll_dice_state=False, attacker_roll=-1, defender_roll=-1):
-        if prev_actions is None:
-            prev_actions = []
 
         self.depth: int = depth
-        self.tries: int = 0
-        self.score: int = 0
-        self.score_list: list[int] = []
+        # statistics are rows of a pool shared by the whole tree, see the properties below
+        self.pool: NodePool = parent.pool if parent is not None else NodePool()
+        self.index: int = self.pool.add_node()
         self.parent = parent
         self.children: list[(Action, MCTSNode)] = []
-        self.seq_actions: list[Union[Action, (int, int, Action)]] = prev_actions if prev_actions else []
+        self.child_indices: array = array('i')  # pool rows of the children, in the order of `children`
+        # action ids from the root, dice outcomes are negative ids (see encode_dice_roll)
+        self.seq_actions: array = prev_actions if prev_actions is not None else array('i')
         self.untried_actions = untried_actions
         self.terminal_flag = False
 
+        self.snapshot: GameLogic | None = None  # state at this node, only cloned from, see SnapshotCache
+        self.turn_player: str | None = None
+
         self.roll_dice_state = roll_dice_state
         self.attacker_roll = attacker_roll
         self.defender_roll = defender_roll
 
+    @property
+    def tries(self) -> int:
+        return int(self.pool.tries[self.index])
+
+    @tries.setter
+    def tries(self, tries: int):
+        self.pool.tries[self.index] = tries
+
+    @property
+    def score(self) -> int:
+        return int(self.pool.score[self.index])
+
+    @score.setter
+    def score(self, score: int):
+        self.pool.score[self.index] = score
+
+    @property
+    def samples(self) -> int:
+        """
+        Number of backpropagated rewards, each the sum of rollout_no rollouts.
+        """
+        return int(self.pool.samples[self.index])
+
+    @samples.setter
+    def samples(self, samples: int):
+        self.pool.samples[self.index] = samples
+
+    @property
+    def score_sq(self) -> int:
+        return int(self.pool.score_sq[self.index])
+
+    @score_sq.setter
+    def score_sq(self, score_sq: int):
+        self.pool.score_sq[self.index] = score_sq
+
+    @property
+    def pending(self) -> int:
+        """
+        Rollouts dispatched but not yet backpropagated.
+        """
+        return int(self.pool.pending[self.index])
+
+    @pending.setter
+    def pending(self, pending: int):
+        self.pool.pending[self.index] = pending
+
+    def get_child_rows(self) -> np.ndarray:
+        return np.frombuffer(self.child_indices, dtype=np.intc)
+
     def add_child(self, action: Action, child: MCTSNode):
         self.children.append((action, child))
+        self.child_indices.append(child.index)
         if child.roll_dice_state:
-            child.seq_actions = self.seq_actions + [(child.attacker_roll, child.defender_roll, action)]
+            child.seq_actions = self.seq_actions + array('i', [encode_dice_roll(child.attacker_roll,
+                                                                                child.defender_roll)])
         else:
-            child.seq_actions = self.seq_actions + [action]
+            child.seq_actions = self.seq_actions + array('i', [action.action_id])
         # NOTE: seq_actions: action closer to leaf is added at the BACK of the list
 
-    def choose_best_child(self, criteria='max', c_param=2) -> (Action, MCTSNode):
+    def replace_last_child(self, child: MCTSNode):
+        self.children[-1] = (self.children[-1][0], child)
+        self.child_indices[-1] = child.index
+
+    def get_subtree_nodes(self) -> list[MCTSNode]:
+        """
+        :return: this node and every node reachable from it, once each
+        """
+        nodes: dict[int, MCTSNode] = {}
+        stack: list[MCTSNode] = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) not in nodes:  # transposed nodes have several parents
+                nodes[id(node)] = node
+                stack += [child for _, child in node.children]
+        return list(nodes.values())
+
+    def compact_pool(self):
+        """
+        Drops the statistics of every node that is not reachable from this one, called on a new root.
+        """
+        nodes: list[MCTSNode] = self.get_subtree_nodes()
+
+        self.pool.keep([node.index for node in nodes])
+        for index, node in enumerate(nodes):
+            node.index = index
+        for node in nodes:
+            node.child_indices = array('i', [child.index for _, child in node.children])
+
+    def choose_best_child(self, criteria='max', c_param=2, virtual_loss=0.0) -> (Action, MCTSNode):
+        pool: NodePool = self.pool
+        rows: np.ndarray = self.get_child_rows()
 
         if criteria == 'max':
-            choices_reward = [c.score for _, c in self.children]
-
-            LOGGER.info(
-                "choose_best_child: child actions {} {}".format(len(self.children), [a.name for a, c in self.children]))
-            LOGGER.info("choose_best_child: choices_reward {}".format(str(choices_reward)))
-            LOGGER.info("choose_best_child: params <score, tries> {}".format(str(
-                ["<{}, {}>".format(c.score, c.tries) for a, c in
-                 self.children] + ["<{}, {}>".format(self.score, self.tries)]
-            )
-            ))
-
-            return self.children[np.argmax(choices_reward)]
+            weights = pool.score[rows]
         elif criteria == 'robust':
-            choices_most_visited = [c.tries for _, c in self.children]
-
-            LOGGER.info(
-                "choose_best_child: child actions {} {}".format(len(self.children), [a.name for a, c in self.children]))
-            LOGGER.info("choose_best_child: choices_most_visited {}".format(str(choices_most_visited)))
-            LOGGER.info("choose_best_child: params <score, tries> {}".format(str(
-                ["<{}, {}>".format(c.score, c.tries) for a, c in
-                 self.children] + ["<{}, {}>".format(self.score, self.tries)]
-            )
-            ))
-
-            return self.children[np.argmax(choices_most_visited)]
+            weights = pool.tries[rows]
         elif criteria == 'UCB':
-            choices_weights: list[float] = [
-                (c.score / c.tries + c_param * np.sqrt(np.log(self.tries) / c.tries)) if c.tries != 0 else float('-inf')
-                for
-                a, c in
-                self.children]
-            LOGGER.info(
-                "choose_best_child: child actions {} {}".format(len(self.children), [a.name for a, c in self.children]))
-            LOGGER.info("choose_best_child: choices_weights {}".format(str(choices_weights)))
-            LOGGER.info("choose_best_child: params <score, tries> {}".format(str(
-                ["<{}, {}>".format(c.score, c.tries) for a, c in
-                 self.children] + ["<{}, {}>".format(self.score, self.tries)]
-            )
-            ))
-            return self.children[np.argmax(choices_weights)]
+            # pending rollouts count as visits that lost `virtual_loss` each, steering concurrent selections apart
+            parent_tries = self.tries + self.pending
+            visits = pool.tries[rows] + pool.pending[rows]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                weights = ((pool.score[rows] - virtual_loss * pool.pending[rows]) / visits
+                           + c_param * np.sqrt(np.log(parent_tries) / visits))
+            weights[visits == 0] = float('-inf')
         elif criteria == 'secure':
-            rewards = [mean_confidence_interval(c.score_list) for _, c in self.children]
-            rewards_lower_bound = [r[1] for r in rewards]
-
-            LOGGER.info(
-                "choose_best_child: child actions {} {}".format(len(self.children), [a.name for a, c in self.children]))
-            LOGGER.info("choose_best_child: rewards_lower_bound {}".format(str(rewards_lower_bound)))
-            LOGGER.info("choose_best_child: params <score, tries> {}".format(str(
-                ["<{}, {}>".format(c.score, c.tries) for a, c in
-                 self.children] + ["<{}, {}>".format(self.score, self.tries)]
-            )
-            ))
-            return self.children[np.argmax(rewards_lower_bound)]
+            _, weights, _ = mean_confidence_interval(pool.samples[rows], pool.score[rows], pool.score_sq[rows])
+        else:
+            return None
+
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("choose_best_child: child actions {}, {} weights {}, <score, tries> {}, parent {}",
+                             [a.name for a, c in self.children], criteria, weights.tolist(),
+                             list(zip(pool.score[rows].tolist(), pool.tries[rows].tolist())), (self.score, self.tries))
+
+        return self.children[np.argmax(weights)]
 
     def is_fully_expanded(self):
         if self.untried_actions is None:
@@ -133,14 +194,15 @@ class MCTSNode:
         if roll_dice_state:
             for i in range(0, 4):
                 for j in range(i, 4):
-                    child = MCTSNode(self.depth + 1, self, self.seq_actions + [action], None, True, j, i)
+                    child = MCTSNode(self.depth + 1, self, None, None, True, j, i)
                     self.add_child(action, child)
 
             return self.roll_dice_state_child(attacker_roll, defender_roll)[1]
 
         else:
-            child = MCTSNode(self.depth + 1, self, self.seq_actions + [action], None)
+            child = MCTSNode(self.depth + 1, self, None, None)
             self.add_child(action, child)
-            LOGGER.debug("add child: {}".format([n for n in self.seq_actions + [action]]))
+            if TRACER.enabled:
+                TRACER.emit("add child: {}", [get_action_name(a) for a in child.seq_actions])
 
             return child
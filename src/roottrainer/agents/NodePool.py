@@ -0,0 +1,69 @@
+import numpy as np
+
+COLUMNS: tuple[str, ...] = ('tries', 'score', 'score_sq', 'samples', 'pending')
+MIN_CAPACITY: int = 256
+
+
+class NodePool:
+    """
+    Statistics of every MCTSNode of a tree as a struct of arrays, a node is the row `MCTSNode.index`.
+    Rows are never freed while searching, the arrays double when full. A node's children are scored
+    by gathering their rows, see MCTSNode.choose_best_child.
+    """
+
+    def __init__(self, capacity: int = MIN_CAPACITY):
+        self.size: int = 0
+        self.tries: np.ndarray = np.zeros(capacity, dtype=np.int64)
+        self.score: np.ndarray = np.zeros(capacity, dtype=np.int64)
+        self.score_sq: np.ndarray = np.zeros(capacity, dtype=np.int64)  # sum of the squared backpropagated rewards
+        self.samples: np.ndarray = np.zeros(capacity, dtype=np.int64)  # backpropagations, rollout_no rollouts each
+        self.pending: np.ndarray = np.zeros(capacity, dtype=np.int64)  # rollouts dispatched, not backpropagated
+
+    def __len__(self):
+        return self.size
+
+    def capacity(self) -> int:
+        return len(self.tries)
+
+    def add_node(self) -> int:
+        """
+        :return: index of a new zeroed row
+        """
+        if self.size == self.capacity():
+            self.resize(2 * self.capacity())
+        self.size += 1
+        return self.size - 1
+
+    def resize(self, capacity: int):
+        for column in COLUMNS:
+            values = np.zeros(capacity, dtype=np.int64)
+            values[:self.size] = getattr(self, column)[:self.size]
+            setattr(self, column, values)
+
+    def add_results(self, nodes: list[int], tries: int, rewards: list[int]):
+        """
+        Backpropagates one summed reward of `tries` rollouts to each of `nodes`. A node may be listed several times.
+        """
+        nodes = np.asarray(nodes, dtype=np.intp)
+        rewards = np.asarray(rewards, dtype=np.int64)
+        np.add.at(self.tries, nodes, tries)
+        np.add.at(self.score, nodes, rewards)
+        np.add.at(self.score_sq, nodes, rewards * rewards)
+        np.add.at(self.samples, nodes, 1)
+
+    def add_pending(self, nodes: list[int], count: int):
+        np.add.at(self.pending, np.asarray(nodes, dtype=np.intp), count)
+
+    def keep(self, rows: list[int]):
+        """
+        Keeps only `rows`, renumbered in the given order. Used to drop the abandoned part of a reused tree.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        capacity = self.capacity()
+        while capacity // 2 >= len(rows) and capacity > MIN_CAPACITY:
+            capacity //= 2
+        for column in COLUMNS:
+            values = np.zeros(capacity, dtype=np.int64)
+            values[:len(rows)] = getattr(self, column)[rows]
+            setattr(self, column, values)
+        self.size = len(rows)
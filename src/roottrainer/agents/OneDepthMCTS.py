@@ -1,77 +1,61 @@
 from __future__ import annotations
 
 import logging
-import sys
-from random import randint
-
-import pygame
-import yaml
+import random
+import time
 
 from game.Faction import Faction
-from game.GameLogic import Action, GameLogic
+from game.GameLogic import Action, GameLogic, get_action_name
 from roottrainer.agents.MCTSNode import MCTSNode
-
-config_path: str = ""
-if len(sys.argv) > 1:
-    config_path = str(sys.argv[1])
-if config_path == "":
-    config_path = "./config/config.yml"
-config = yaml.safe_load(open(config_path))
+from utils.random_utils import SEED_BOUND
+from utils.trace_utils import Tracer
 
 LOGGER = logging.getLogger('mcts_logger')
+TRACER = Tracer('mcts_logger')
+INFO_TRACER = Tracer('mcts_logger', logging.INFO)
 
 
 class MCTSOneDepth:
-    def __init__(self, state: list, actions: list[Action], reward_function: str, roll_out_no: int, time_limit: float):
+    def __init__(self, state: list, actions: list[Action], reward_function: str, roll_out_no: int, time_limit: float,
+                 game_config: dict | None = None, seed: int | None = None):
         self.root: MCTSNode = MCTSNode(0)
         self.root_state: list = state
         self.rollout_no: int = roll_out_no
         self.reward_function: str = reward_function
         self.time_limit: float = time_limit
+        self.game_config: dict | None = game_config
+        self.rng: random.Random = random.Random(seed)  # seeds every rollout
 
     def rollout(self, node: MCTSNode) -> int:
-        def execute_random_action(game_state: GameLogic):
-            actions = game_state.get_legal_actions()
+        def execute_random_action(game_state: GameLogic) -> bool:
+            action = game_state.sample_random_action(self.rng)
+            if action is None:
+                LOGGER.error("rollout:execute_random_action: len(actions) == 0")
+                return False
+
+            if TRACER.enabled:
+                TRACER.emit("rollout:execute_random_action: exec {}", action.name)
+            action.function()
+            game_state.advance_forced_moves()
+            return True
 
-            LOGGER.debug("rollout:execute_random_action: actions {} {}".format(len(actions), [a.name for a in actions]))
-
-            if len(actions) > 1:
-                rand = randint(0, len(actions) - 1)
-            elif len(actions) == 1:
-                rand = 0
-            else:
-                rand = 0
-                LOGGER.error("rollout:execute_random_action: len(actions) == {}".format(len(actions)))
+        def exec_seq_actions(game_state: GameLogic):
+            if TRACER.enabled:
+                TRACER.emit("rollout:exec_seq_actions: len(seq_actions) {}, seq_actions {}",
+                            len(node.seq_actions), [get_action_name(a) for a in node.seq_actions])
 
-            LOGGER.debug("rollout:execute_random_action: exec {}".format(actions[rand].name))
-            actions[rand].function()
+            for action_id in node.seq_actions:
+                if TRACER.enabled:
+                    TRACER.emit("rollout:exec_seq_actions: seq_action {}", get_action_name(action_id))
 
-        def exec_seq_actions(game_state: GameLogic):
-            LOGGER.debug(
-                "rollout:exec_seq_actions: len(seq_actions) {}, seq_actions {}".format(len(node.seq_actions), [a.name for a in node.seq_actions]))
-
-            for seq_action in node.seq_actions:
-                actions: list[Action] = game_state.get_legal_actions()
-                LOGGER.debug("rollout:exec_seq_actions: seq_action {}".format(seq_action.name))
-                LOGGER.debug(
-                    "rollout:exec_seq_actions: len(actions) {}, actions {}".format(len(actions), [a.name for a in actions]))
-
-                legal_action: Action | None = None
-
-                for action in actions:
-                    if seq_action == action:
-                        legal_action = action
-                        break
-
-                if legal_action:
-                    LOGGER.debug("rollout:exec_seq_actions: exec {}".format(legal_action.name))
-                    legal_action.function()
-                else:
-                    LOGGER.warning("rollout:exec_seq_actions: no matching legal action for {}".format(seq_action.name))
+                if not game_state.apply(action_id):
+                    LOGGER.warning(
+                        "rollout:exec_seq_actions: no matching legal action for {}".format(get_action_name(action_id)))
                     break
+                game_state.advance_forced_moves()
 
         def reward_function(game_state: GameLogic) -> int:
-            root_game = GameLogic()
+            root_game = GameLogic(self.game_config)
             root_game.set_state_from_num_array(self.root_state)
             current_player = root_game.turn_player
 
@@ -94,20 +78,22 @@ class MCTSOneDepth:
                     LOGGER.error("rollout:reward_function: unknown function, reward set to 0")
                     return 0
 
-        game = GameLogic()
+        game = GameLogic(self.game_config, self.rng.randrange(SEED_BOUND))
         game.set_state_from_num_array(self.root_state)
 
         exec_seq_actions(game)
 
         acc_time: float = 0
-        clock = pygame.time.Clock()
+        last_time = time.time()
         while game.running:
-            delta_time = clock.tick()
-            acc_time += delta_time
+            now = time.time()
+            acc_time += (now - last_time) * 1000  # ms, as pygame Clock.tick() used to return
+            last_time = now
             if self.time_limit > 0:
                 if acc_time >= self.time_limit:
                     break
-            execute_random_action(game)
+            if not execute_random_action(game):
+                break
 
         return reward_function(game)
 
@@ -116,46 +102,49 @@ class MCTSOneDepth:
         node.tries += 1
         node.score += reward
 
-        LOGGER.debug("backpropagation: reward {}, wins/tries {}/{}".format(reward, node.score, node.tries))
+        if TRACER.enabled:
+            TRACER.emit("backpropagation: reward {}, wins/tries {}/{}", reward, node.score, node.tries)
 
         if node.parent:
             self.backpropagation(node.parent, reward)
 
     def run_mcts(self):
-        LOGGER.info("run_mcts, rollout_no {}".format(self.rollout_no))
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("run_mcts, rollout_no {}", self.rollout_no)
 
-        game: GameLogic = GameLogic()
+        game: GameLogic = GameLogic(self.game_config)
         game.set_state_from_num_array(self.root_state)
         legal_actions: list[Action] = game.get_legal_actions()
 
-        clock = pygame.time.Clock()
-        clock.tick()
+        start_time = time.time()
         for action in legal_actions:
-            node = MCTSNode(1, self.root, self.root.seq_actions[:])
+            node = MCTSNode(1, self.root)
             self.root.add_child(action, node)
 
             for i in range(self.rollout_no):
-                LOGGER.debug("run_mcts: node {}, rollout_no {}/{}".format(action.name, i + 1, self.rollout_no))
+                if TRACER.enabled:
+                    TRACER.emit("run_mcts: node {}, rollout_no {}/{}", action.name, i + 1, self.rollout_no)
                 reward = self.rollout(node)
                 self.backpropagation(node, reward)
 
-            LOGGER.debug("run_mcts: node {}, len(seq_actions) {}".format(action.name, len(node.seq_actions)))
+            if TRACER.enabled:
+                TRACER.emit("run_mcts: node {}, len(seq_actions) {}", action.name, len(node.seq_actions))
 
-        total_rollout_time = clock.tick()
-        LOGGER.info("run_mcts: total_rollout_time {} seconds".format(total_rollout_time/1000.0))
+        total_rollout_time = time.time() - start_time
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("run_mcts: total_rollout_time {} seconds", total_rollout_time)
 
     def choose_best_action(self, actions: list[Action]) -> Action:
         best_action_sim, best_node = self.root.choose_best_child()
-        LOGGER.debug("best_action_sim: action {}".format(best_action_sim.name))
-        best_action: Action | None = None
+        if TRACER.enabled:
+            TRACER.emit("best_action_sim: action {}", best_action_sim.name)
+            TRACER.emit("choose_best_action: actions {} {}", len(actions), [a.name for a in actions])
 
-        LOGGER.debug("choose_best_action: actions {} {}".format(len(actions), [a.name for a in actions]))
-
-        for action in actions:
-            if best_action_sim == action:
-                best_action = action
-                break
+        best_action: Action | None = next(
+            (action for action in actions if action.action_id == best_action_sim.action_id), None)  # same as apply
 
-        LOGGER.info("choose_best_action: best_action_sim {}, best_action {}".format(best_action_sim.name, best_action.name))
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("choose_best_action: best_action_sim {}, best_action {}",
+                             best_action_sim.name, best_action.name)
 
         return best_action if best_action else None
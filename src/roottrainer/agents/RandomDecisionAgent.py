@@ -1,14 +1,12 @@
-from random import randint
-
 from game.Faction import Faction
 from game.GameLogic import Action, GameLogic
 from roottrainer.agents.Agent import Agent
 
 
 class RandomDecisionAgent(Agent):
-    def __init__(self, faction: Faction):
-        super().__init__(faction)
+    def __init__(self, faction: Faction, seed: int | None = None):
+        super().__init__(faction, seed)
         self.agent_type: str = "random"
 
     def choose_action(self, state: list, actions: list[Action]) -> Action:
-        return actions[randint(0, len(actions) - 1)]
+        return actions[self.rng.randint(0, len(actions) - 1)]
@@ -0,0 +1,114 @@
+import logging
+import time
+
+from pathos.pools import ProcessPool
+
+from utils.trace_utils import Tracer
+
+LOGGER = logging.getLogger('mcts_logger')
+INFO_TRACER = Tracer('mcts_logger', logging.INFO)
+
+
+def timed_call(function: any, *args) -> tuple[any, float]:
+    """
+    Runs `function(*args)` inside a worker and measures how long the call itself took.
+
+    :return: result of the function, time spent in the worker in seconds
+    """
+    start_time = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start_time
+
+
+class RolloutPool:
+    """
+    Long-lived worker pool shared by every rollout of a run.
+    The processes are spawned by `open()` and kept alive until `close()` is called. Runs open the pool before their
+    output files, so the forked workers do not inherit unwritten rows. A pool that was not opened spawns its
+    processes on the first batch.
+    """
+
+    def __init__(self, core_count: int):
+        self.core_count: int = core_count
+        self.pool: ProcessPool | None = None
+
+        self.batch_count: int = 0
+        self.task_count: int = 0
+        self.total_batch_time: float = 0.0
+        self.total_dispatch_overhead: float = 0.0
+
+    def open(self):
+        if self.pool is None:
+            self.pool = ProcessPool(self.core_count)
+            if INFO_TRACER.enabled:
+                INFO_TRACER.emit("RolloutPool:open: {} workers", self.core_count)
+
+    def map(self, function: any, *args: list) -> list:
+        """
+        Runs `function` over the argument lists on the workers and blocks until every result is back.
+        Dispatch overhead of the batch is the wall time not spent inside the slowest worker call.
+
+        :param function: picklable function to run on the workers
+        :param args: one list per positional argument of `function`
+        :return: results in the same order as the arguments
+        """
+        self.open()
+
+        task_count = len(args[0]) if args else 0
+        start_time = time.perf_counter()
+        timed_results: list[tuple[any, float]] = self.pool.map(timed_call, [function] * task_count, *args)
+        batch_time = time.perf_counter() - start_time
+
+        worker_time = max([t for _, t in timed_results], default=0.0)
+        dispatch_overhead = max(batch_time - worker_time, 0.0)
+
+        self.batch_count += 1
+        self.task_count += task_count
+        self.total_batch_time += batch_time
+        self.total_dispatch_overhead += dispatch_overhead
+
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("RolloutPool:map: batch {}, {} tasks, finished in {} s, dispatch overhead {} s",
+                             self.batch_count, task_count, batch_time, dispatch_overhead)
+
+        return [result for result, _ in timed_results]
+
+    def imap_unordered(self, function: any, *args: list):
+        """
+        Runs `function` over the argument lists on the workers and yields each result as soon as it is done.
+        Tasks are handed out one at a time from a shared queue, a worker that finishes early takes the next one
+        instead of waiting for the slowest task of a batch.
+
+        :param function: picklable function to run on the workers
+        :param args: one list per positional argument of `function`
+        :return: generator of results in completion order
+        """
+        self.open()
+
+        task_count = len(args[0]) if args else 0
+        self.task_count += task_count
+
+        return self.pool.uimap(function, *args)
+
+    def get_stats(self) -> dict:
+        return {
+            'batch_count': self.batch_count,
+            'task_count': self.task_count,
+            'total_batch_time': self.total_batch_time,
+            'total_dispatch_overhead': self.total_dispatch_overhead,
+            'mean_dispatch_overhead': self.total_dispatch_overhead / self.batch_count if self.batch_count else 0.0
+        }
+
+    def close(self):
+        if self.pool is None:
+            return
+
+        self.pool.close()
+        self.pool.join()
+        self.pool.clear()
+        self.pool = None
+
+        stats = self.get_stats()
+        LOGGER.log(21, "RolloutPool:close: {} batches, {} tasks, total {} s, dispatch overhead {} s ({} s/batch)"
+                   .format(stats['batch_count'], stats['task_count'], stats['total_batch_time'],
+                           stats['total_dispatch_overhead'], stats['mean_dispatch_overhead']))
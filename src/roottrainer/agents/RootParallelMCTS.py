@@ -0,0 +1,139 @@
+import logging
+import random
+import time
+
+from game.GameLogic import Action, format_handler_key, get_action_id
+from game.StateCodec import decode_state, encode_state
+from roottrainer.agents.MCTS import MCTS
+from roottrainer.agents.MCTSNode import MCTSNode
+from roottrainer.agents.RolloutPool import RolloutPool
+from utils.random_utils import SEED_BOUND, derive_seed
+from utils.trace_utils import Tracer
+
+LOGGER = logging.getLogger('mcts_logger')
+INFO_TRACER = Tracer('mcts_logger', logging.INFO)
+
+
+def run_mcts_tree(seed: int, state: bytes, reward_function: str, expand_count: int, rollout_no: int,
+                  time_limit: float, action_count_limit: int,
+                  game_config: dict | None = None,
+                  decision_time_limit: float = -1.0) -> list[tuple[tuple, int, int, int, int, int, int]]:
+    """
+    Builds and searches one independent tree. Runs inside a worker process.
+
+    :param state: root state encoded by `encode_state`
+    :return: statistics of every root child as <action key, attacker roll, defender roll, score, tries,
+             samples, sum of squared rewards>
+    """
+    mcts = MCTS(decode_state(state), [], reward_function, expand_count, rollout_no, time_limit, action_count_limit,
+                game_config=game_config, decision_time_limit=decision_time_limit, seed=seed)
+    mcts.run_mcts()
+
+    return [(action.key, child.attacker_roll, child.defender_roll, child.score, child.tries, child.samples,
+             child.score_sq) for action, child in mcts.root.children]
+
+
+class RootParallelMCTS:
+    """
+    Root parallelization: every worker searches its own tree from the same root state with a different seed,
+    then the root children statistics are summed into a single root.
+    """
+
+    def __init__(self, state: list, actions: list[Action], reward_function: str,
+                 expand_count: int, rollout_no: int,
+                 time_limit: float, action_count_limit: int, best_action_policy='max',
+                 rollout_pool: RolloutPool | None = None, game_config: dict | None = None,
+                 decision_time_limit: float = -1.0, seed: int | None = None):
+        self.root: MCTSNode = MCTSNode(0, None, None, None)
+        self.root_state: list = state
+        self.actions: list[Action] = actions
+        self.reward_function_type = reward_function
+        self.expand_count: int = expand_count
+        self.rollout_no: int = rollout_no
+        self.time_limit: float = time_limit
+        self.best_action_policy = best_action_policy
+        self.action_count_limit: int = action_count_limit
+        self.rollout_pool: RolloutPool | None = rollout_pool
+        self.tree_count: int = rollout_pool.core_count if rollout_pool is not None else 1
+        self.game_config: dict | None = game_config
+        self.decision_time_limit: float = decision_time_limit  # ms, every tree searches until it is spent
+        self.rng: random.Random = random.Random(seed)  # seeds of the trees
+        self.iterations: int = 0
+        self.search_time: float = 0.0
+
+    def run_mcts(self):
+        start_time = time.perf_counter()
+        base_seed = self.rng.randrange(SEED_BOUND)
+        seeds = [derive_seed(base_seed, i) for i in range(self.tree_count)]
+
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("RootParallelMCTS:run_mcts: {} trees, seeds {}", self.tree_count, seeds)
+
+        args = [seeds,
+                [encode_state(self.root_state)] * self.tree_count,
+                [self.reward_function_type] * self.tree_count,
+                [self.expand_count] * self.tree_count,
+                [self.rollout_no] * self.tree_count,
+                [self.time_limit] * self.tree_count,
+                [self.action_count_limit] * self.tree_count,
+                [self.game_config] * self.tree_count,
+                [self.decision_time_limit] * self.tree_count]
+
+        if self.rollout_pool is not None:
+            trees_stats = self.rollout_pool.map(run_mcts_tree, *args)
+        else:
+            trees_stats = [run_mcts_tree(*tree_args) for tree_args in zip(*args)]
+
+        for tree_stats in trees_stats:
+            self.merge(tree_stats)
+
+        self.iterations = self.root.tries // self.rollout_no  # every iteration adds rollout_no tries to a root child
+        self.search_time = time.perf_counter() - start_time
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("RootParallelMCTS:run_mcts: {} iterations in {} s, {} iterations/s", self.iterations,
+                             self.search_time, self.iterations / self.search_time if self.search_time > 0 else 0.0)
+
+    def merge(self, tree_stats: list[tuple[tuple, int, int, int, int, int, int]]):
+        # action ids are local to a process, workers report action keys
+        actions: dict[int, Action] = {action.action_id: action for action in self.actions}
+
+        for action_key, attacker_roll, defender_roll, score, tries, samples, score_sq in tree_stats:
+            action_id = get_action_id(action_key)
+            child = self.find_child(action_id, attacker_roll, defender_roll)
+
+            if child is None:
+                action = actions.get(action_id)
+                if action is None:
+                    LOGGER.error("RootParallelMCTS:merge: no legal action {}".format(format_handler_key(action_key)))
+                    continue
+
+                child = MCTSNode(1, self.root, None, None, attacker_roll != -1, attacker_roll, defender_roll)
+                self.root.add_child(action, child)
+
+            child.score += score
+            child.tries += tries
+            child.samples += samples
+            child.score_sq += score_sq
+
+            self.root.score += score
+            self.root.tries += tries
+
+    def find_child(self, action_id: int, attacker_roll: int, defender_roll: int) -> MCTSNode | None:
+        for action, child in self.root.children:
+            if action.action_id == action_id \
+                    and child.attacker_roll == attacker_roll and child.defender_roll == defender_roll:
+                return child
+        return None
+
+    def choose_best_action(self, actions: list[Action]) -> Action:
+        best_action_sim, best_node = self.root.choose_best_child(self.best_action_policy)
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("best_action_sim: action {}", best_action_sim.name)
+        best_action: Action | None = next(
+            (action for action in actions if action.action_id == best_action_sim.action_id), None)  # same as apply
+
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("choose_best_action: best_action_sim {}, best_action {}",
+                             best_action_sim.name, best_action.name)
+
+        return best_action if best_action else None
@@ -0,0 +1,59 @@
+import time
+
+# replay: materializing the state of a node from a cached ancestor, see MCTS.borrow_game_logic_at_node
+PHASES: tuple[str, ...] = ('selection', 'expansion', 'replay', 'rollout', 'backpropagation')
+
+
+class SearchProfiler:
+    """
+    Wall time and call count of each phase of one search. Phases nest, e.g. the replays of a rollout, and a phase is
+    charged only the time not spent in the phases started inside it, so the phase times add up to the search time
+    minus the bookkeeping between iterations. Every call is a no-op unless `enabled`.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled: bool = enabled
+        self.times: dict[str, float] = dict.fromkeys(PHASES, 0.0)  # s
+        self.calls: dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.stack: list[str] = []  # started phases, innermost last
+        self.last_time: float = 0.0
+
+    def reset(self):
+        self.times = dict.fromkeys(PHASES, 0.0)
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.stack = []
+
+    def start(self, phase: str, calls: int = 1):
+        """
+        Pauses the running phase, if any, and starts `phase`.
+
+        :param calls: added to the call count of `phase`, 0 to charge it more time for a call already counted
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.stack:
+            self.times[self.stack[-1]] += now - self.last_time
+        self.stack.append(phase)
+        self.calls[phase] += calls
+        self.last_time = now
+
+    def stop(self):
+        """
+        Stops the innermost phase and resumes the one it was started in.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.times[self.stack.pop()] += now - self.last_time
+        self.last_time = now
+
+    @staticmethod
+    def get_header() -> list[str]:
+        return [column for phase in PHASES for column in (phase + '_time', phase + '_calls')]
+
+    def get_row(self) -> list:
+        """
+        :return: time and call count of every phase, in the order of `get_header`
+        """
+        return [value for phase in PHASES for value in (self.times[phase], self.calls[phase])]
@@ -0,0 +1,40 @@
+from collections import OrderedDict
+
+from game.GameLogic import GameLogic
+from roottrainer.agents.MCTSNode import MCTSNode
+
+
+class SnapshotCache:
+    """
+    Bounds how many MCTSNode keep a state snapshot. The least recently used node loses its snapshot
+    when a new one is stored over `capacity`.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity: int = capacity
+        self.nodes: OrderedDict[int, MCTSNode] = OrderedDict()
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def touch(self, node: MCTSNode):
+        if id(node) in self.nodes:
+            self.nodes.move_to_end(id(node))
+
+    def remove(self, node: MCTSNode):
+        """
+        Stops tracking `node`, its snapshot is kept and never evicted. Used for the root of a reused tree.
+        """
+        self.nodes.pop(id(node), None)
+
+    def put(self, node: MCTSNode, snapshot: GameLogic):
+        if self.capacity <= 0:
+            return
+
+        node.snapshot = snapshot
+        self.nodes[id(node)] = node
+        self.nodes.move_to_end(id(node))
+
+        while len(self.nodes) > self.capacity:
+            _, evicted = self.nodes.popitem(last=False)
+            evicted.snapshot = None
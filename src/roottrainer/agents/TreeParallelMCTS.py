@@ -0,0 +1,148 @@
+import logging
+import time
+
+from game.GameLogic import Action
+from game.StateCodec import encode_state
+from roottrainer.agents.MCTS import MCTS, exec_random_actions, exec_random_actions_from_bytes, show_action
+from roottrainer.agents.MCTSNode import MCTSNode
+from roottrainer.agents.RolloutPool import RolloutPool
+from utils.random_utils import SEED_BOUND, derive_seed
+from utils.trace_utils import Tracer
+
+TRACER = Tracer('mcts_logger')
+INFO_TRACER = Tracer('mcts_logger', logging.INFO)
+
+
+class TreeParallelMCTS(MCTS):
+    """
+    Tree parallelization over one shared tree. Each iteration selects a batch of leaves, one per worker,
+    with virtual loss on the in-flight paths, rolls them out on the pool in a single dispatch
+    and backpropagates the whole batch at once.
+    """
+
+    def __init__(self, state: list, actions: list[Action], reward_function: str,
+                 expand_count: int, rollout_no: int,
+                 time_limit: float, action_count_limit: int, best_action_policy='max', depth_limit: int = 1,
+                 rollout_pool: RolloutPool | None = None, snapshot_cache_size: int = 1024, virtual_loss: float = 1.0,
+                 game_config: dict | None = None, decision_time_limit: float = -1.0, early_stop: bool = False,
+                 profile: bool = False, seed: int | None = None):
+        super().__init__(state, actions, reward_function, expand_count, rollout_no, time_limit, action_count_limit,
+                         best_action_policy, depth_limit, rollout_pool, snapshot_cache_size, game_config,
+                         decision_time_limit=decision_time_limit, early_stop=early_stop, profile=profile, seed=seed)
+        self.virtual_loss: float = virtual_loss
+        self.batch_size: int = rollout_pool.core_count if rollout_pool is not None else 1
+
+    def add_pending(self, node: MCTSNode, count: int):
+        path: list[int] = []
+        current = node
+        while current:
+            path.append(current.index)
+            current = current.parent
+        self.root.pool.add_pending(path, count)
+
+    def rollout_batch(self, leaves: list[MCTSNode]) -> list[int]:
+        """
+        Rolls out every leaf of the batch `rollout_no` times.
+
+        :return: summed reward of each leaf, in the same order as `leaves`
+        """
+        states: list[bytes] = []
+        if self.rollout_pool is not None:
+            for leaf in leaves:
+                with self.borrow_game_logic_at_node(leaf) as game_logic:
+                    states += [game_logic.to_bytes()] * self.rollout_no  # sent instead of a pickled game
+
+        task_count = len(leaves) * self.rollout_no
+        seed = self.rng.randrange(SEED_BOUND)
+        seeds = [derive_seed(seed, i) for i in range(task_count)]
+
+        start_time = time.time()
+        if self.rollout_pool is not None:
+            rewards = self.rollout_pool.map(
+                exec_random_actions_from_bytes,
+                [i for i in range(task_count)],
+                states,
+                [self.game_config] * task_count,
+                [self.reward_function_type] * task_count,
+                [encode_state(self.root_state)] * task_count,
+                [self.time_limit] * task_count,
+                [self.action_count_limit] * task_count,
+                seeds)
+        else:
+            rewards = []
+            for i, leaf in enumerate(leaves):
+                for j in range(self.rollout_no):
+                    rewards.append(exec_random_actions(
+                        i, self.get_game_logic_at_node(leaf), self.reward_function_type, self.root_state,
+                        self.time_limit, self.action_count_limit, seed=seeds[i * self.rollout_no + j]))
+        end_time = time.time()
+        if INFO_TRACER.enabled:
+            INFO_TRACER.emit("rollout_batch: {} leaves, {} rollouts: finished in {} s",
+                             len(leaves), task_count, end_time - start_time)
+
+        return [sum(rewards[i * self.rollout_no:(i + 1) * self.rollout_no]) for i in range(len(leaves))]
+
+    def backpropagation_batch(self, leaves: list[MCTSNode], rewards: list[int]):
+        """
+        Applies the rewards of a whole batch in one pool update.
+        """
+        root_turn_player = self.get_turn_player_at_node(self.root)
+        nodes: list[int] = []
+        actual_rewards: list[int] = []
+
+        for leaf, reward in zip(leaves, rewards):
+            current = leaf
+            while current:
+                nodes.append(current.index)
+                actual_rewards.append(-reward if self.get_turn_player_at_node(current) != root_turn_player else reward)
+                current = current.parent
+
+        pool = self.root.pool
+        pool.add_pending(nodes, -self.rollout_no)
+        pool.add_results(nodes, self.rollout_no, actual_rewards)
+
+        if TRACER.enabled:
+            TRACER.emit("backpropagation_batch: {} leaves, root wins/tries {}/{}",
+                        len(leaves), self.root.score, self.root.tries)
+
+    def run_mcts(self):
+        self.profiler.reset()
+        start_time = time.perf_counter()
+        i = 0
+        while self.has_budget(i, start_time):
+            batch_size = self.batch_size
+            if self.decision_time_limit <= 0:
+                batch_size = min(batch_size, self.expand_count - i)
+
+            # Selection & Expansion
+            if INFO_TRACER.enabled:
+                INFO_TRACER.emit("{}:run_mcts: expand_and_select_node x{}", i, batch_size)
+            self.profiler.start('selection')
+            leaves: list[MCTSNode] = []
+            for j in range(batch_size):
+                selected_node = self.expand_and_select_node(i + j)
+                self.add_pending(selected_node, self.rollout_no)
+                leaves.append(selected_node)
+            self.profiler.stop()
+
+            # Rollout
+            if INFO_TRACER.enabled:
+                INFO_TRACER.emit("{}:rollout_batch", i)
+            self.profiler.start('rollout')
+            rewards = self.rollout_batch(leaves)
+            self.profiler.stop()
+
+            # Backpropagation
+            if INFO_TRACER.enabled:
+                INFO_TRACER.emit("{}:backpropagation_batch", i)
+            self.profiler.start('backpropagation')
+            self.backpropagation_batch(leaves, rewards)
+            self.profiler.stop()
+
+            i += batch_size
+            if self.early_stop and self.is_settled(i):
+                if INFO_TRACER.enabled:
+                    INFO_TRACER.emit("{}:run_mcts: root decision settled, early stop", i)
+                break
+
+        self.end_search(i, start_time)
@@ -0,0 +1,74 @@
+import unittest
+
+from benchmarks.corpus import load_corpus, restore, get_decision_id
+from game.GameLogic import GameLogic, encode_dice_roll
+from game.StateCodec import STATE_SIZE, decode_state, encode_state
+
+PLAYOUT_LENGTH: int = 3  # decisions played from each decoded state
+DICE_ROLL: int = encode_dice_roll(2, 1)
+
+
+class StateCodecTest(unittest.TestCase):
+    """
+    Round trips of the states along the trajectories of the benchmark corpus, which start at the first decision of
+    every sub phase, so battles and card effects are decoded in the middle of their sub phases.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.corpus = load_corpus()
+
+    def get_trajectory_games(self):
+        """
+        :return: every game met along the corpus trajectories, ready for its next decision
+        """
+        for entry in self.corpus['entries']:
+            game = restore(self.corpus, entry['state'])
+            game.advance_forced_moves(stop_at_dice_roll=True)
+            for decision in entry['trajectory']:
+                yield game, decision
+                game.apply(get_decision_id(game, decision))
+                game.advance_forced_moves(stop_at_dice_roll=True)
+
+    def test_num_array_round_trip(self):
+        for entry in self.corpus['entries']:
+            data = encode_state(entry['state'])
+            self.assertEqual(len(data), STATE_SIZE)
+            self.assertEqual(decode_state(data), entry['state'])
+
+    def test_legal_actions_round_trip(self):
+        for game, _ in self.get_trajectory_games():
+            keys = [action.key for action in game.get_legal_actions()]
+            decoded = GameLogic.from_bytes(game.to_bytes(), self.corpus['game-config'])
+            self.assertEqual([action.key for action in decoded.get_legal_actions()], keys,
+                             "sub phase {}".format(game.sub_phase))
+            self.assertEqual(decoded.to_bytes(), game.to_bytes())
+            self.assertEqual(decoded.get_zobrist_hash(), game.get_zobrist_hash())
+
+    def test_decoded_game_plays_on(self):
+        for game, _ in self.get_trajectory_games():
+            original = game.clone()
+            original.seed(0)
+            decoded = GameLogic.from_bytes(game.to_bytes(), self.corpus['game-config'], 0)
+            for _ in range(PLAYOUT_LENGTH):
+                if not original.running:
+                    break
+                decision = DICE_ROLL if original.sub_phase == 40007 else original.get_legal_actions()[0].name
+                for played in (original, decoded):
+                    played.apply(get_decision_id(played, decision))
+                    played.advance_forced_moves(stop_at_dice_roll=True)
+                self.assertEqual(decoded.to_bytes(), original.to_bytes(), "sub phase {}".format(game.sub_phase))
+
+    def test_wrong_size_and_version(self):
+        data = encode_state(self.corpus['entries'][0]['state'])
+        with self.assertRaises(ValueError):
+            decode_state(data[:-1])
+        with self.assertRaises(ValueError):
+            decode_state(b'\xff\xff' + data[2:])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+#  Run from src by using this cmd
+#       python -m unittest discover tests
@@ -0,0 +1,26 @@
+import random
+
+import numpy as np
+
+SEED_BOUND: int = 2 ** 32  # seeds are drawn in [0, SEED_BOUND)
+
+# streams of the seed of one game, see derive_seed
+GAME_STREAM: int = 0
+MARQUISE_STREAM: int = 1
+EYRIE_STREAM: int = 2
+
+
+def derive_seed(seed: int, *keys: int) -> int:
+    """
+    Seed of the stream `keys` of `seed`, e.g. `derive_seed(master_seed, round)` for the seed of a round, then
+    `derive_seed(round_seed, GAME_STREAM)` for its game. Streams with different keys are independent, and the same
+    inputs give the same seed in any process, so the seeds handed to workers replay bit for bit.
+    """
+    return int(np.random.SeedSequence(seed, spawn_key=keys).generate_state(1)[0])
+
+
+def new_seed() -> int:
+    """
+    :return: a master seed from OS entropy, for runs without a configured seed. Log it to replay the run
+    """
+    return random.SystemRandom().randrange(SEED_BOUND)
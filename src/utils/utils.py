@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import ntpath
 import os
+from functools import partial
 
 from game.Building import Building
 from game.Card import Card
@@ -10,8 +11,12 @@ from game.Token import Token
 from game.Warrior import Warrior
 
 
-def perform(function: any, *args):
-    return lambda: function(*args)
+def perform(function: any, *args) -> partial:
+    """
+    `function(*args)` as a callable taking no argument. Unlike a lambda, the function and its arguments stay
+    readable, `GameLogic` builds action ids from them.
+    """
+    return partial(function, *args)
 
 
 def get_filename_from_path(path: str, extension: bool = False) -> str: